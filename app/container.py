@@ -1,7 +1,11 @@
 ﻿from dependency_injector import containers, providers
 
 from app.settings import Settings
+from src.application.skills.dtos import SkillDTO
+from src.application.skills.repositories import SkillRepository
 from src.application.skills.services import SkillSearchService
+from src.application.directions.dtos import DirectionDTO
+from src.application.directions.repositories import DirectionRepository
 from src.application.directions.services import DirectionSearchService, DirectionStatisticsService
 from src.application.users.auth.services import EmailOtpService, HashService, OAuthService
 from src.infrastructure.dbs.postgre import create_engine, create_session_factory
@@ -10,8 +14,18 @@ from src.infrastructure.integrations.email_service import EmailService
 from src.infrastructure.integrations.es_client import ElasticsearchClient
 from src.infrastructure.integrations.jwt_service import JWTService
 from src.infrastructure.integrations.openai_service import OpenAIService
-from src.application.modules.services import ModuleStatisticsService
+from src.infrastructure.integrations.openai_cache import CachedOpenAIService
+from src.application.modules.services import ModuleStatisticsService, ProgressStatisticsCache
+from src.application.questions.services import QuestionSeedService, QUESTION_SEED_QUEUE
+from src.application.interview.services import InterviewStateCache
+from src.infrastructure.jobs.queue import RedisJobQueue
+from src.infrastructure.jobs.single_flight import SingleFlight
 from src.infrastructure.integrations.airflow_client import AirflowClient
+from src.infrastructure.search.prefix_index import (
+    LocalAutocompleteIndex,
+    LocalAutocompleteSearchService,
+    catalog_loader,
+)
 
 
 class Container(containers.DeclarativeContainer):
@@ -26,13 +40,29 @@ class Container(containers.DeclarativeContainer):
 
     settings = Settings()
 
-    engine = providers.Singleton(create_engine, db_url=settings.db_url, echo=False)
+    engine = providers.Singleton(
+        create_engine,
+        db_url=settings.db_url,
+        echo=False,
+        pool_mode=settings.DB_POOL_MODE,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+    )
 
     session_factory = providers.Resource(
         create_session_factory, engine=engine
     )
 
     redis = providers.Resource(RedisConnection, url=settings.REDIS_URL)
+    single_flight = providers.Singleton(
+        SingleFlight,
+        redis=redis,
+        lock_ttl=settings.SINGLE_FLIGHT_LOCK_TTL,
+    )
 
     email_service = providers.Factory(
         EmailService,
@@ -75,19 +105,65 @@ class Container(containers.DeclarativeContainer):
         host=settings.ELASTIC_SEARCH_HOST,
     )
 
-    skill_search_service = providers.Factory(
+    skill_es_search_service = providers.Factory(
         SkillSearchService,
         es_client=elasticsearch_client.provided.client,
     )
 
-    direction_search_service = providers.Factory(
+    direction_es_search_service = providers.Factory(
         DirectionSearchService,
         es_client=elasticsearch_client.provided.client,
     )
 
+    skill_autocomplete_index = providers.Singleton(
+        LocalAutocompleteIndex,
+        redis=redis,
+        name="skills",
+        loader=providers.Callable(
+            catalog_loader,
+            session_factory=session_factory,
+            repository_factory=providers.Object(SkillRepository),
+            batch_size=settings.SEARCH_REINDEX_BATCH_SIZE,
+        ),
+        refresh_interval=settings.AUTOCOMPLETE_INDEX_REFRESH_INTERVAL,
+    )
+
+    direction_autocomplete_index = providers.Singleton(
+        LocalAutocompleteIndex,
+        redis=redis,
+        name="directions",
+        loader=providers.Callable(
+            catalog_loader,
+            session_factory=session_factory,
+            repository_factory=providers.Object(DirectionRepository),
+            batch_size=settings.SEARCH_REINDEX_BATCH_SIZE,
+        ),
+        refresh_interval=settings.AUTOCOMPLETE_INDEX_REFRESH_INTERVAL,
+    )
+
+    skill_search_service = providers.Factory(
+        LocalAutocompleteSearchService,
+        search_service=skill_es_search_service,
+        index=skill_autocomplete_index,
+        dto_factory=providers.Object(SkillDTO),
+    )
+
+    direction_search_service = providers.Factory(
+        LocalAutocompleteSearchService,
+        search_service=direction_es_search_service,
+        index=direction_autocomplete_index,
+        dto_factory=providers.Object(DirectionDTO),
+    )
+
     openai_service = providers.Factory(
-        OpenAIService,
-        OPENAI_API_KEY=settings.OPENAI_API_KEY,
+        CachedOpenAIService,
+        service=providers.Factory(
+            OpenAIService,
+            OPENAI_API_KEY=settings.OPENAI_API_KEY,
+        ),
+        redis=redis,
+        ttl=settings.LLM_CACHE_TTL,
+        single_flight=single_flight,
     )
 
     airflow_client = providers.Factory(
@@ -97,6 +173,31 @@ class Container(containers.DeclarativeContainer):
         password=settings.AIRFLOW_PASSWORD,
     )
 
+    question_seed_queue = providers.Factory(
+        RedisJobQueue,
+        redis=redis,
+        name=QUESTION_SEED_QUEUE,
+        max_attempts=settings.QUESTION_SEED_MAX_ATTEMPTS,
+        retry_delay=settings.QUESTION_SEED_RETRY_DELAY,
+    )
+
+    question_seed_service = providers.Factory(
+        QuestionSeedService,
+        queue=question_seed_queue,
+    )
+
+    interview_state_cache = providers.Factory(
+        InterviewStateCache,
+        redis=redis,
+        ttl=settings.INTERVIEW_STATE_TTL,
+    )
+
+    progress_statistics_cache = providers.Factory(
+        ProgressStatisticsCache,
+        redis=redis,
+        ttl=settings.STATISTICS_CACHE_TTL,
+    )
+
     module_statistics_service = providers.Factory(
         ModuleStatisticsService,
     )
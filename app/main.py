@@ -1,11 +1,15 @@
-from typing import Annotated
+import asyncio
+import logging
+from typing import Annotated, List, Optional
 
 from dependency_injector.wiring import inject, Provide
 from fastapi import FastAPI, Depends
 
 from src.application.skills.interfaces import ISkillSearchService
 from src.application.directions.interfaces import IDirectionSearchService
+from src.infrastructure.jobs.single_flight import SingleFlight
 from .container import Container
+from .reindex import reindex
 from src.presentation.routers import (
     users_router as ur,
     auth_router as ar,
@@ -18,24 +22,71 @@ from src.presentation.routers import (
     learning_recommendations_router as lrr,
     vacancies_router as vr,
     airflow_router as afr,
+    db_router as dbr,
 )
 
 
+logger = logging.getLogger(__name__)
+
 container = Container()
 app = FastAPI(
     prefix="/api",
 )
 app.container = container
 
+async def initial_reindex(targets: List[str]) -> None:
+    single_flight: SingleFlight = await Container.single_flight()
+
+    async def rebuilt() -> Optional[bool]:
+        # Another worker process finished the rebuild while we waited
+        for target in targets:
+            search = Container.skill_es_search_service() if target == "skills" else Container.direction_es_search_service()
+            if not await search.is_index_current():
+                return None
+        return True
+
+    try:
+        await single_flight.do(
+            "search_reindex:" + ",".join(targets),
+            lambda: reindex(targets, Container.settings.SEARCH_REINDEX_BATCH_SIZE),
+            lookup=rebuilt,
+        )
+    except Exception:
+        logger.exception("Initial search reindex failed, run `python -m app.reindex`")
+
 @app.on_event("startup")
 async def startup():
-    skill_search: ISkillSearchService = Container.skill_search_service()
+    # Indices are (re)built by `python -m app.reindex`; startup only rebuilds
+    # indices that are new or built for an older mapping, in the background.
+    targets: List[str] = []
+
+    skill_search: ISkillSearchService = Container.skill_es_search_service()
     # await skill_search.delete_index()
     await skill_search.create_index_if_not_exists()
+    if not await skill_search.is_index_current():
+        targets.append("skills")
 
-    direction_search: IDirectionSearchService = Container.direction_search_service()
+    direction_search: IDirectionSearchService = Container.direction_es_search_service()
     # await direction_search.delete_index()
     await direction_search.create_index_if_not_exists()
+    if not await direction_search.is_index_current():
+        targets.append("directions")
+
+    if targets:
+        app.state.initial_reindex = asyncio.create_task(initial_reindex(targets))
+
+    # Autocomplete is served from in-process copies of the catalogs, loaded in
+    # the background; Elasticsearch answers until they are ready.
+    if Container.settings.AUTOCOMPLETE_LOCAL_INDEX:
+        (await Container.skill_autocomplete_index()).start()
+        (await Container.direction_autocomplete_index()).start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    if Container.settings.AUTOCOMPLETE_LOCAL_INDEX:
+        await (await Container.skill_autocomplete_index()).stop()
+        await (await Container.direction_autocomplete_index()).stop()
+    await Container.engine().dispose()
 
 app.include_router(ur.router)
 app.include_router(ar.router)
@@ -48,3 +99,4 @@ app.include_router(ir.router)
 app.include_router(lrr.router)
 app.include_router(vr.router)
 app.include_router(afr.router)
+app.include_router(dbr.router)
@@ -0,0 +1,78 @@
+"""Rebuild the Elasticsearch search indices from Postgres.
+
+Run with ``python -m app.reindex [skills] [directions]`` (both by default).
+Rows are streamed in keyset-paginated batches into a fresh index, and the
+index alias is switched over once it is complete. Rows created meanwhile are
+read again after the switch.
+"""
+import argparse
+import asyncio
+import logging
+from typing import Iterable, List, Optional, Sequence
+
+from app.container import Container
+from src.application.directions.repositories import DirectionRepository
+from src.application.skills.repositories import SkillRepository
+from src.infrastructure.dbs.pagination import encode_cursor, iter_batches
+
+# Register every mapped model so relationships resolve outside the API process.
+from src.application.users.models import User  # noqa: F401
+from src.application.skills.models import Skill, UserSkill  # noqa: F401
+from src.application.locations.models import Country, City  # noqa: F401
+from src.application.directions.models import Direction, Salary  # noqa: F401
+from src.application.questions.models import Question, UserQuestion, UserQuestionProgress  # noqa: F401
+from src.application.interview.models import InterviewSession, InterviewQuestion  # noqa: F401
+from src.application.learning_recommendations.models import LearningRecommendation  # noqa: F401
+from src.application.vacancies.models import Vacancy, VacancySkill, UserVacancy  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+TARGETS = ("skills", "directions")
+
+
+async def reindex(targets: Iterable[str], batch_size: int) -> None:
+    session_factory = Container.session_factory()
+
+    for target in targets:
+        async with session_factory() as session:
+            if target == "skills":
+                repository = SkillRepository(session)
+                search_service = Container.skill_es_search_service()
+            else:
+                repository = DirectionRepository(session)
+                search_service = Container.direction_es_search_service()
+
+            def fetch(pagination):
+                return repository.get(pagination=pagination)
+
+            # Both repositories page by id, so the catch-up resumes after the last id read
+            indexed = await search_service.rebuild(
+                iter_batches(fetch, batch_size),
+                catch_up=lambda max_id: iter_batches(fetch, batch_size, cursor=encode_cursor([max_id])),
+            )
+            logger.info(f"Reindexed {indexed} {target}")
+
+
+def parse_targets(argv: Optional[Sequence[str]] = None) -> List[str]:
+    parser = argparse.ArgumentParser(description="Rebuild the search indices from Postgres.")
+    # No default here: argparse would check the list default against choices
+    parser.add_argument("targets", nargs="*", choices=TARGETS)
+    args = parser.parse_args(argv)
+    return args.targets or list(TARGETS)
+
+
+async def main() -> None:
+    targets = parse_targets()
+
+    container = Container()
+    try:
+        await reindex(targets, Container.settings.SEARCH_REINDEX_BATCH_SIZE)
+    finally:
+        await container.shutdown_resources()
+        await container.engine().dispose()
+        await container.elasticsearch_client().close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
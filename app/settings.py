@@ -1,4 +1,6 @@
 from pathlib import Path
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -18,6 +20,15 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     ALEMBIC_URL: str
 
+    # ---- Database pool ----
+    DB_POOL_MODE: Literal["queue", "null"] = "queue"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
     # ---- Redis ----
     REDIS_URL: str
 
@@ -35,6 +46,11 @@ class Settings(BaseSettings):
 
     # ---- Elastic Search ----
     ELASTIC_SEARCH_HOST: str
+    SEARCH_REINDEX_BATCH_SIZE: int = 1000
+
+    # ---- Autocomplete ----
+    AUTOCOMPLETE_LOCAL_INDEX: bool = True
+    AUTOCOMPLETE_INDEX_REFRESH_INTERVAL: int = 600
 
     # ---- OTP ----
     OTP_TTL: int
@@ -48,6 +64,20 @@ class Settings(BaseSettings):
 
     # ---- OpenAI ----
     OPENAI_API_KEY: str
+    LLM_CACHE_TTL: int = 2592000
+    SINGLE_FLIGHT_LOCK_TTL: int = 120
+
+    # ---- Background jobs ----
+    QUESTION_SEED_CONCURRENCY: int = 4
+    QUESTION_SEED_MAX_ATTEMPTS: int = 3
+    QUESTION_SEED_RETRY_DELAY: int = 30
+
+    # ---- Interview ----
+    INTERVIEW_AUDIO_MAX_BYTES: int = 26214400
+    INTERVIEW_STATE_TTL: int = 21600
+
+    # ---- Statistics ----
+    STATISTICS_CACHE_TTL: int = 3600
 
     # ---- AirFlow ----
     AIRFLOW_URL: str
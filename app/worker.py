@@ -0,0 +1,80 @@
+"""Background worker for queued jobs.
+
+Run with ``python -m app.worker``.
+"""
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Dict
+
+from app.container import Container
+from src.application.modules.services import ProgressStatisticsCache
+from src.application.questions.repositories import QuestionRepository
+from src.application.questions.services import QuestionSeeder
+from src.infrastructure.dbs.uow import UoW
+from src.infrastructure.jobs.queue import RedisJobQueue, run_worker
+from src.infrastructure.jobs.single_flight import SingleFlight
+
+# Register every mapped model so relationships resolve outside the API process.
+from src.application.users.models import User  # noqa: F401
+from src.application.skills.models import Skill, UserSkill  # noqa: F401
+from src.application.locations.models import Country, City  # noqa: F401
+from src.application.directions.models import Direction, Salary  # noqa: F401
+from src.application.questions.models import Question, UserQuestion, UserQuestionProgress  # noqa: F401
+from src.application.interview.models import InterviewSession, InterviewQuestion  # noqa: F401
+from src.application.learning_recommendations.models import LearningRecommendation  # noqa: F401
+from src.application.vacancies.models import Vacancy, VacancySkill, UserVacancy  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    container = Container()
+    settings = Container.settings
+
+    queue: RedisJobQueue = await container.question_seed_queue()
+    session_factory = container.session_factory()
+    openai_service = await container.openai_service()
+    single_flight: SingleFlight = await container.single_flight()
+    statistics_cache: ProgressStatisticsCache = await container.progress_statistics_cache()
+
+    async def seed_module(module_id: int, skill_name: str) -> None:
+        async with session_factory() as session:
+            seeder = QuestionSeeder(
+                question_repository=QuestionRepository(session),
+                openai_service=openai_service,
+                uow=UoW(session=session),
+            )
+            await seeder.seed(module_id=module_id, skill_name=skill_name)
+
+        # Question totals of everyone learning the module have changed
+        await statistics_cache.delete_for_module(module_id)
+
+    async def seed_questions(payload: Dict[str, Any]) -> None:
+        module_id = int(payload["module_id"])
+        # The seeder re-checks existing questions once it holds the module lock,
+        # so a duplicate job that waited here ends up a no-op.
+        await single_flight.do(
+            f"question_seed:{module_id}",
+            lambda: seed_module(module_id, payload["skill_name"]),
+        )
+
+    worker_id = os.getenv("WORKER_ID") or socket.gethostname()
+    logger.info(f"Question seed worker {worker_id} started")
+
+    try:
+        await run_worker(
+            queue=queue,
+            handler=seed_questions,
+            worker_id=worker_id,
+            concurrency=settings.QUESTION_SEED_CONCURRENCY,
+        )
+    finally:
+        await container.shutdown_resources()
+        await container.engine().dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+"""add unique index on lower(skills.name)
+
+Revision ID: c3e8a1f5d2b6
+Revises: 4a5d9169c7a7
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8a1f5d2b6"
+down_revision: Union[str, Sequence[str], None] = "4a5d9169c7a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ux_skills_name_lower",
+        "skills",
+        [sa.text("lower(name)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ux_skills_name_lower", table_name="skills")
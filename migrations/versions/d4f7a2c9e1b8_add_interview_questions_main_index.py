@@ -0,0 +1,61 @@
+"""add main_index to interview_questions
+
+Revision ID: d4f7a2c9e1b8
+Revises: c3e8a1f5d2b6
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f7a2c9e1b8"
+down_revision: Union[str, Sequence[str], None] = "c3e8a1f5d2b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("interview_questions", sa.Column("main_index", sa.Integer(), nullable=True))
+
+    # Main questions were positioned by id order within their session
+    op.execute(
+        """
+        UPDATE interview_questions AS iq
+        SET main_index = numbered.position
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY session_id ORDER BY id) AS position
+            FROM interview_questions
+            WHERE is_followup IS FALSE
+        ) AS numbered
+        WHERE iq.id = numbered.id
+        """
+    )
+
+    op.create_index(
+        "ix_interview_questions_session_followup_main_index",
+        "interview_questions",
+        ["session_id", "is_followup", "main_index"],
+    )
+    op.create_index(
+        "ix_interview_questions_main_question_followup_index",
+        "interview_questions",
+        ["main_question_id", "followup_index"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_interview_questions_main_question_followup_index",
+        table_name="interview_questions",
+    )
+    op.drop_index(
+        "ix_interview_questions_session_followup_main_index",
+        table_name="interview_questions",
+    )
+    op.drop_column("interview_questions", "main_index")
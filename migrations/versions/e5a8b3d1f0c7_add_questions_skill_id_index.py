@@ -0,0 +1,27 @@
+"""add skill_id index to questions
+
+Revision ID: e5a8b3d1f0c7
+Revises: d4f7a2c9e1b8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a8b3d1f0c7"
+down_revision: Union[str, Sequence[str], None] = "d4f7a2c9e1b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f("ix_questions_skill_id"), "questions", ["skill_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_questions_skill_id"), table_name="questions")
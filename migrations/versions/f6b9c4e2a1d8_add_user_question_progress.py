@@ -0,0 +1,68 @@
+"""add user_question_progress
+
+Revision ID: f6b9c4e2a1d8
+Revises: e5a8b3d1f0c7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6b9c4e2a1d8"
+down_revision: Union[str, Sequence[str], None] = "e5a8b3d1f0c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_question_progress",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("question_id", sa.Integer(), nullable=False),
+        sa.Column("skill_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "last_status",
+            postgresql.ENUM("SATISFACTORY", "UNSATISFACTORY", name="question_status", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["skill_id"], ["skills.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "question_id"),
+    )
+    op.create_index(
+        "ix_user_question_progress_user_skill",
+        "user_question_progress",
+        ["user_id", "skill_id"],
+    )
+
+    # Latest answer per user and question
+    op.execute(
+        """
+        INSERT INTO user_question_progress (user_id, question_id, skill_id, last_status, last_seen_at, attempts)
+        SELECT DISTINCT ON (uq.user_id, uq.question_id)
+            uq.user_id,
+            uq.question_id,
+            q.skill_id,
+            uq.status,
+            uq.created_at,
+            count(*) OVER (PARTITION BY uq.user_id, uq.question_id)
+        FROM user_questions AS uq
+        JOIN questions AS q ON q.id = uq.question_id
+        ORDER BY uq.user_id, uq.question_id, uq.id DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_question_progress_user_skill", table_name="user_question_progress")
+    op.drop_table("user_question_progress")
@@ -89,17 +89,12 @@ class DirectionSalaryController(IDirectionSalaryController):
             pagination: PaginationDTO[DirectionDTO],
             q: Optional[str] = None,
     ) -> PaginationDTO[DirectionDTO]:
-        count = await self._direction_search_service.count()
-
-        if count < 1:
-            directions = await self._direction_repository.get()
-            directions = directions.items
-
-            await self._direction_search_service.bulk_index(directions)
-
         res = await self._direction_search_service.search(pagination=pagination, name=q)
         return res
 
+    async def direction_suggest(self, q: str, size: int = 10) -> List[DirectionDTO]:
+        return await self._direction_search_service.suggest(prefix=q, size=size)
+
     async def create_direction(
             self,
             name: str,
@@ -112,14 +107,10 @@ class DirectionSalaryController(IDirectionSalaryController):
                 detail=f"Direction {name} already exists"
             )
 
-        description = ""
-        for _ in range(3):
-            description = await self._openai_service.get_direction_description(
-                direction_name=name,
-                model=ChatGPTModel.GPT_4_1,
-            )
-            if description:
-                break
+        description = await self._openai_service.get_direction_description(
+            direction_name=name,
+            model=ChatGPTModel.GPT_4_1,
+        )
         if not description:
             raise HTTPException(
                 status_code=s.HTTP_408_REQUEST_TIMEOUT,
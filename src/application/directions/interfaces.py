@@ -1,5 +1,5 @@
 ﻿from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, AsyncIterator, Callable, List
 
 from src.application.directions.dtos import DirectionDTO, SalaryDTO, ProgressStatisticsDTO
 from src.application.users.dtos import UserDTO
@@ -109,6 +109,9 @@ class IDirectionSalaryController(ABC):
             q: Optional[str] = None,
     ) -> PaginationDTO[DirectionDTO]: ...
 
+    @abstractmethod
+    async def direction_suggest(self, q: str, size: int = 10) -> List[DirectionDTO]: ...
+
     @abstractmethod
     async def create_direction(
             self,
@@ -136,11 +139,21 @@ class IDirectionSalaryController(ABC):
 class IDirectionSearchService(ABC):
 
     @abstractmethod
-    async def create_index_if_not_exists(self) -> None: ...
+    async def create_index_if_not_exists(self) -> bool: ...
+
+    @abstractmethod
+    async def is_index_current(self) -> bool: ...
 
     @abstractmethod
     async def delete_index(self) -> bool: ...
 
+    @abstractmethod
+    async def rebuild(
+        self,
+        batches: AsyncIterator[List[DirectionDTO]],
+        catch_up: Optional[Callable[[int], AsyncIterator[List[DirectionDTO]]]] = None,
+    ) -> int: ...
+
     @abstractmethod
     async def count(self) -> int: ...
 
@@ -159,3 +172,6 @@ class IDirectionSearchService(ABC):
         name: Optional[str] = None,
         pagination: Optional[PaginationDTO[DirectionDTO]] = None,
     ) -> PaginationDTO[DirectionDTO]: ...
+
+    @abstractmethod
+    async def suggest(self, prefix: str, size: int = 10) -> List[DirectionDTO]: ...
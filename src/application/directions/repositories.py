@@ -1,6 +1,7 @@
+from dataclasses import replace
 from typing import Optional, List
 
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -10,6 +11,8 @@ from src.application.directions.mappers import salary_orm_to_dto, salary_dto_to_
     direction_dto_to_orm
 from src.application.directions.models import Salary, Direction
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import paginate
+from src.infrastructure.dbs.returning import insert_returning, update_returning
 
 
 class DirectionRepository(IDirectionRepository):
@@ -61,36 +64,25 @@ class DirectionRepository(IDirectionRepository):
                 Direction.name.ilike(f"%{name}%")
             )
 
-        # --- total count ---
-        count_query = select(func.count()).select_from(
-            base_query.subquery()
-        )
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
         # --- pagination ---
-        if pagination is None or pagination.per_page is None:
-            query = base_query
-            page = 1
-            per_page = total
-        else:
-            page = max(pagination.page or 1, 1)
-            per_page = max(pagination.per_page or 10, 1)
-            offset = (page - 1) * per_page
-            query = base_query.offset(offset).limit(per_page)
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=[Direction.id],
+        )
 
         items: List[DirectionDTO] = [
             direction_orm_to_dto(row)
-            for row in rows
+            for row in paged.rows
         ]
 
         return PaginationDTO[DirectionDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
 
     async def add(
@@ -98,12 +90,7 @@ class DirectionRepository(IDirectionRepository):
         dto: DirectionDTO,
     ) -> Optional[DirectionDTO]:
 
-        row = direction_dto_to_orm(dto)
-
-        self._session.add(row)
-
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, direction_dto_to_orm(dto))
 
         return direction_orm_to_dto(row)
 
@@ -113,21 +100,15 @@ class DirectionRepository(IDirectionRepository):
         dto: DirectionDTO,
     ) -> Optional[DirectionDTO]:
 
-        query = select(Direction).where(
-            Direction.id == direction_id
+        row = await update_returning(
+            self._session,
+            direction_dto_to_orm(dto),
+            Direction.id == direction_id,
         )
 
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
-
         if not row:
             return None
 
-        row = direction_dto_to_orm(dto, row)
-
-        await self._session.flush()
-        await self._session.refresh(row)
-
         return direction_orm_to_dto(row)
 
     async def delete(
@@ -182,10 +163,8 @@ class SalaryRepository(ISalaryRepository):
     ) -> PaginationDTO[SalaryDTO]:
 
         pagination = pagination or PaginationDTO[SalaryDTO]()
-
-        page = max(pagination.page or 1, 1)
-        per_page = max(pagination.per_page or 10, 1)
-        offset = (page - 1) * per_page
+        if pagination.per_page is None:
+            pagination = replace(pagination, per_page=10)
 
         base_query = self._base_query(
             populate_city=populate_city,
@@ -203,17 +182,13 @@ class SalaryRepository(ISalaryRepository):
                 Salary.direction_id == direction_id
             )
 
-        # --- total count ---
-        count_query = select(func.count()).select_from(
-            base_query.subquery()
-        )
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
         # --- pagination ---
-        query = base_query.offset(offset).limit(per_page)
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=[Salary.id],
+        )
 
         items: List[SalaryDTO] = [
             salary_orm_to_dto(
@@ -221,14 +196,15 @@ class SalaryRepository(ISalaryRepository):
                 populate_city=populate_city,
                 populate_direction=populate_direction,
             )
-            for row in rows
+            for row in paged.rows
         ]
 
         return PaginationDTO[SalaryDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
 
     async def get_by_city_and_direction(
@@ -264,12 +240,7 @@ class SalaryRepository(ISalaryRepository):
         dto: SalaryDTO,
     ) -> Optional[SalaryDTO]:
 
-        row = salary_dto_to_orm(dto)
-
-        self._session.add(row)
-
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, salary_dto_to_orm(dto))
 
         return salary_orm_to_dto(row)
 
@@ -279,18 +250,15 @@ class SalaryRepository(ISalaryRepository):
         dto: SalaryDTO,
     ) -> Optional[SalaryDTO]:
 
-        query = select(Salary).where(Salary.id == salary_id)
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
+        row = await update_returning(
+            self._session,
+            salary_dto_to_orm(dto),
+            Salary.id == salary_id,
+        )
 
         if not row:
             return None
 
-        row = salary_dto_to_orm(dto, row)
-
-        await self._session.flush()
-        await self._session.refresh(row)
-
         return salary_orm_to_dto(row)
 
     async def delete(
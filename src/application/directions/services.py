@@ -1,78 +1,119 @@
-﻿from typing import Optional, List
+﻿from typing import Optional, Dict, Any, AsyncIterator, Callable, List
 
 from elasticsearch import AsyncElasticsearch
 from elasticsearch.helpers import async_bulk
 
 from src.application.directions.dtos import DirectionDTO, ProgressStatisticsDTO
 from src.application.directions.interfaces import IDirectionStatisticsService
-from src.application.modules.interfaces import IModuleStatisticsService
-from src.application.skills.interfaces import IUserSkillRepository
+from src.application.modules.interfaces import IProgressStatisticsCache
+from src.application.questions.interfaces import IUserQuestionRepository
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.integrations.es_index import AliasedIndex, completion_inputs
 
 
 class DirectionSearchService:
 
     INDEX_NAME = "directions_index"
 
-    def __init__(self, es_client: AsyncElasticsearch):
-        self._es = es_client
-
-    # -----------------------------
-    # INDEX CREATION
-    # -----------------------------
-    async def create_index_if_not_exists(self) -> None:
-        exists = await self._es.indices.exists(index=self.INDEX_NAME)
-
-        if exists:
-            return
+    # Bump when the settings or mappings change; the app rebuilds outdated indices on startup
+    INDEX_VERSION = 3
 
-        await self._es.indices.create(
-            index=self.INDEX_NAME,
-            settings={
-                "index": {
-                    "max_ngram_diff": 18  # max_gram - min_gram
-                },
-                "analysis": {
-                    "analyzer": {
-                        "autocomplete_analyzer": {
-                            "tokenizer": "ngram_tokenizer",
-                            "filter": ["lowercase"]
-                        }
-                    },
-                    "tokenizer": {
-                        "ngram_tokenizer": {
-                            "type": "ngram",
-                            "min_gram": 2,
-                            "max_gram": 20,
-                            "token_chars": ["letter", "digit"]
-                        }
-                    }
+    INDEX_SETTINGS = {
+        "analysis": {
+            "filter": {
+                "autocomplete_edge_ngram": {
+                    "type": "edge_ngram",
+                    "min_gram": 1,
+                    "max_gram": 20
                 }
             },
-            mappings={
-                "properties": {
-                    "name": {
-                        "type": "text",
-                        "analyzer": "autocomplete_analyzer",
-                        "search_analyzer": "standard"
-                    }
+            "analyzer": {
+                # Indexes word prefixes only ("pyt" for "python"), not every infix
+                "autocomplete_analyzer": {
+                    "tokenizer": "standard",
+                    "filter": ["lowercase", "asciifolding", "autocomplete_edge_ngram"]
+                },
+                "autocomplete_search_analyzer": {
+                    "tokenizer": "standard",
+                    "filter": ["lowercase", "asciifolding"]
                 }
             }
+        }
+    }
+
+    INDEX_MAPPINGS = {
+        "properties": {
+            "id": {
+                "type": "integer"
+            },
+            "name": {
+                "type": "text",
+                "analyzer": "autocomplete_analyzer",
+                "search_analyzer": "autocomplete_search_analyzer"
+            },
+            "suggest": {
+                "type": "completion",
+                "analyzer": "autocomplete_search_analyzer"
+            }
+        }
+    }
+
+    def __init__(self, es_client: AsyncElasticsearch):
+        self._es = es_client
+        # INDEX_NAME is an alias over the current physical index
+        self._index = AliasedIndex(
+            es_client,
+            alias=self.INDEX_NAME,
+            settings=self.INDEX_SETTINGS,
+            mappings=self.INDEX_MAPPINGS,
+            version=self.INDEX_VERSION,
         )
 
-    async def delete_index(self) -> bool:
-        try:
-            exists = await self._es.indices.exists(index=self.INDEX_NAME)
+    @staticmethod
+    def _document(direction_id: int, name: str) -> Dict[str, Any]:
+        return {
+            "id": direction_id,
+            "name": name,
+            # Each word starts a completion input, so "learn" also suggests "Machine Learning"
+            "suggest": {"input": completion_inputs(name)},
+        }
 
-            if not exists:
-                return False
+    # -----------------------------
+    # INDEX CREATION
+    # -----------------------------
+    async def create_index_if_not_exists(self) -> bool:
+        return await self._index.ensure()
 
-            await self._es.indices.delete(index=self.INDEX_NAME)
-            return True
+    async def is_index_current(self) -> bool:
+        return await self._index.is_current()
 
+    async def delete_index(self) -> bool:
+        try:
+            return await self._index.delete()
         except Exception:
             return False
 
+    # -----------------------------
+    # REBUILD
+    # -----------------------------
+    async def rebuild(
+            self,
+            batches: AsyncIterator[List[DirectionDTO]],
+            catch_up: Optional[Callable[[int], AsyncIterator[List[DirectionDTO]]]] = None,
+    ) -> int:
+        async def documents(source: AsyncIterator[List[DirectionDTO]]):
+            async for directions in source:
+                yield [
+                    self._document(direction.id, direction.name)
+                    for direction in directions
+                    if direction.id is not None and direction.name
+                ]
+
+        return await self._index.rebuild(
+            documents(batches),
+            catch_up=(lambda max_id: documents(catch_up(max_id))) if catch_up is not None else None,
+        )
+
     # -----------------------------
     # COUNT
     # -----------------------------
@@ -94,10 +135,7 @@ class DirectionSearchService:
             {
                 "_index": self.INDEX_NAME,
                 "_id": direction.id,
-                "_source": {
-                    "id": direction.id,
-                    "name": direction.name,
-                },
+                "_source": self._document(direction.id, direction.name),
             }
             for direction in directions
             if direction.id is not None and direction.name
@@ -115,10 +153,7 @@ class DirectionSearchService:
         await self._es.index(
             index=self.INDEX_NAME,
             id=direction_id,
-            document={
-                "id": direction_id,
-                "name": name,
-            }
+            document=self._document(direction_id, name),
         )
 
     # -----------------------------
@@ -154,18 +189,13 @@ class DirectionSearchService:
         }
 
         if name:
+            # Every query word must prefix a word of the name
             query_body["query"] = {
-                "bool": {
-                    "should": [
-                        {
-                            "match": {
-                                "name": {
-                                    "query": name,
-                                    "fuzziness": "AUTO",
-                                }
-                            }
-                        }
-                    ]
+                "match": {
+                    "name": {
+                        "query": name,
+                        "operator": "and",
+                    }
                 }
             }
 
@@ -192,54 +222,88 @@ class DirectionSearchService:
             items=items,
         )
 
+    # -----------------------------
+    # SUGGEST
+    # -----------------------------
+    async def suggest(self, prefix: str, size: int = 10) -> List[DirectionDTO]:
+        prefix = prefix.strip()
+        if not prefix:
+            return []
+
+        response = await self._es.search(
+            index=self.INDEX_NAME,
+            source=["id", "name"],
+            suggest={
+                "name_suggest": {
+                    "prefix": prefix,
+                    "completion": {
+                        "field": "suggest",
+                        # No skip_duplicates: it drops different documents sharing an input
+                        "size": min(max(size, 1), 100),
+                    },
+                }
+            },
+        )
+
+        # A direction matching through several of its inputs is returned once
+        items: Dict[int, DirectionDTO] = {}
+        for option in response["suggest"]["name_suggest"][0]["options"]:
+            source = option["_source"]
+            items.setdefault(source["id"], DirectionDTO(id=source["id"], name=source["name"]))
+
+        return list(items.values())
+
 
 class DirectionStatisticsService(IDirectionStatisticsService):
     def __init__(
         self,
-        module_statistics_service: IModuleStatisticsService,
-        user_skill_repository: IUserSkillRepository,
+        user_question_repository: IUserQuestionRepository,
+        statistics_cache: IProgressStatisticsCache,
     ):
-        self._module_statistics_service = module_statistics_service
-        self._user_skill_repository = user_skill_repository
+        self._user_question_repository = user_question_repository
+        self._statistics_cache = statistics_cache
 
     async def get_statistics(
         self,
         user_id: int,
     ) -> ProgressStatisticsDTO:
 
-        modules = await self._user_skill_repository.get_by_user_id(
-            user_id=user_id,
-            to_learn=True,
-        )
-        skills = modules.items or []
+        cached = await self._statistics_cache.get_direction(user_id=user_id)
+        if cached is not None:
+            return cached
+
+        # Read before the query, so the result is not cached if an answer lands meanwhile
+        generation = await self._statistics_cache.get_generation(user_id=user_id)
+
+        # Per-module counts for all to-learn modules in one round trip
+        progress = await self._user_question_repository.get_learning_progress(user_id=user_id)
 
         total_questions = 0
         met_questions = 0
         correct_answers = 0
         incorrect_answers = 0
 
-        for module in skills:
-            if module.skill_id is None:
-                continue
-
-            stats = await self._module_statistics_service.get_statistics(
-                user_id=user_id,
-                module_id=module.skill_id,
-            )
-
-            total_questions += stats.total_questions or 0
-            met_questions += stats.met_questions or 0
-            correct_answers += stats.correct_answers or 0
-            incorrect_answers += stats.incorrect_answers or 0
+        for module_progress in progress.values():
+            total_questions += module_progress.total_questions
+            met_questions += module_progress.met_questions
+            correct_answers += module_progress.correct_answers
+            incorrect_answers += module_progress.incorrect_answers
 
         readiness_percentage = 0.0
         if total_questions > 0:
             readiness_percentage = (correct_answers / total_questions) * 100
 
-        return ProgressStatisticsDTO(
+        statistics = ProgressStatisticsDTO(
             total_questions=total_questions,
             met_questions=met_questions,
             correct_answers=correct_answers,
             incorrect_answers=incorrect_answers,
             readiness_percentage=readiness_percentage,
         )
+        await self._statistics_cache.set_direction(
+            user_id=user_id,
+            statistics=statistics,
+            module_ids=list(progress.keys()),
+            generation=generation,
+        )
+        return statistics
@@ -1,20 +1,30 @@
-﻿import random
+﻿import asyncio
+import logging
+import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, BinaryIO, List, Dict, Any, Optional
 from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException, status as s
 
-from src.application.interview.dtos import InterviewSessionDTO, InterviewQuestionDTO
-from src.application.interview.interfaces import IInterviewController, IInterviewSessionRepository, IInterviewQuestionRepository
+from src.application.interview.dtos import InterviewSessionDTO, InterviewQuestionDTO, InterviewSessionStateDTO
+from src.application.interview.interfaces import (
+    IInterviewController,
+    IInterviewSessionRepository,
+    IInterviewQuestionRepository,
+    IInterviewStateCache,
+)
+from src.application.modules.interfaces import IProgressStatisticsCache
 from src.application.questions.dtos import QuestionDTO, UserQuestionDTO
-from src.application.questions.interfaces import IQuestionRepository, IUserQuestionRepository
+from src.application.questions.interfaces import IQuestionRepository, IUserQuestionRepository, IQuestionSeedService
 from src.application.skills.interfaces import IUserSkillRepository
 from src.application.users.dtos import UserDTO
 from src.application.users.interfaces import IUserRepository
 from src.domain.interfaces import IUoW, IOpenAIService
 from src.domain.value_objects import InterviewStatus, ChatGPTModel, QuestionStatus
 
+logger = logging.getLogger(__name__)
+
 
 class InterviewController(IInterviewController):
     def __init__(
@@ -26,7 +36,11 @@ class InterviewController(IInterviewController):
         user_question_repository: IUserQuestionRepository,
         user_repository: IUserRepository,
         openai_service: IOpenAIService,
+        question_seed_service: IQuestionSeedService,
+        interview_state_cache: IInterviewStateCache,
+        statistics_cache: IProgressStatisticsCache,
         uow: IUoW,
+        max_audio_bytes: int = 26214400,
     ):
         self._interview_session_repository = interview_session_repository
         self._interview_question_repository = interview_question_repository
@@ -35,7 +49,11 @@ class InterviewController(IInterviewController):
         self._user_question_repository = user_question_repository
         self._user_repository = user_repository
         self._openai_service = openai_service
+        self._question_seed_service = question_seed_service
+        self._interview_state_cache = interview_state_cache
+        self._statistics_cache = statistics_cache
         self._uow = uow
+        self._max_audio_bytes = max_audio_bytes
 
     async def start(self, user_id: int) -> Dict[str, Any]:
         # Prevent parallel active interview sessions
@@ -47,6 +65,7 @@ class InterviewController(IInterviewController):
         modules = await self._user_skill_repository.get_by_user_id(
             user_id=user_id,
             to_learn=True,
+            populate_skill=True,
         )
         # Extract module ids, skipping missing ones
         module_ids = [m.skill_id for m in (modules.items or []) if m.skill_id is not None]
@@ -55,25 +74,41 @@ class InterviewController(IInterviewController):
         if not module_ids:
             raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="No modules to learn")
 
-        # Collect questions for each module
-        questions: List[QuestionDTO] = []
-        for module_id in module_ids:
-            res = await self._question_repository.get(
-                pagination=None,
-                module_id=module_id,
-            )
-            # Append only when repository returned items
-            if res.items:
-                questions.extend(res.items)
+        # Sample 10 questions across modules in the database, weighting modules by
+        # how well they match the user's direction (unknown match counts as average)
+        # and questions by the user's progress on them
+        module_weights = {
+            m.skill_id: max(m.match_percentage if m.match_percentage is not None else 50.0, 1.0)
+            for m in modules.items
+            if m.skill_id is not None
+        }
+        selected: List[QuestionDTO] = await self._question_repository.sample_for_modules(
+            module_weights=module_weights,
+            limit=10,
+            user_id=user_id,
+        )
 
         # Ensure we can provide 10 main questions
-        if len(questions) < 10:
+        if len(selected) < 10:
+            question_counts = await self._question_repository.count_by_modules(module_ids)
+            empty_module_ids = [module_id for module_id in module_ids if not question_counts.get(module_id)]
+
+            # Modules without questions may still be in the seeding queue; re-enqueue
+            # the ones whose job is gone (enqueueing is idempotent per module).
+            if empty_module_ids:
+                await self._question_seed_service.enqueue(
+                    [m for m in modules.items if m.skill_id in empty_module_ids]
+                )
+                pending = await self._question_seed_service.get_pending_module_ids(empty_module_ids)
+                if pending:
+                    return {
+                        "status": "preparing",
+                        "detail": "Questions are still being prepared",
+                        "pending_modules": pending,
+                        "retry_after": 10,
+                    }
             raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Not enough questions to start interview")
 
-        # Randomize and take exactly 10 for this interview
-        random.shuffle(questions)
-        selected = questions[:10]
-
         async with self._uow:
             # Create interview session with initial counters
             session = await self._interview_session_repository.add(
@@ -92,14 +127,18 @@ class InterviewController(IInterviewController):
                     question_id=q.id,
                     question_text=q.question,
                     is_followup=False,
+                    main_index=main_index,
                 )
-                for q in selected
-                if q.id is not None
+                for main_index, q in enumerate((q for q in selected if q.id is not None), start=1)
             ]
 
             # Persist all main questions for this session
             created_questions = await self._interview_question_repository.add_many(question_rows)
 
+        await self._interview_state_cache.set(
+            InterviewSessionStateDTO(session=session, main_questions=created_questions)
+        )
+
         # Return the first question to start the interview
         first_question = created_questions[0]
         return {
@@ -118,30 +157,133 @@ class InterviewController(IInterviewController):
         self,
         session_id: int,
         interview_question_id: int,
-        audio: bytes,
+        audio: BinaryIO,
         filename: str,
         user_id: int,
         content_type: Optional[str] = None,
     ) -> Dict[str, Any]:
-        # Load session to validate ownership
-        session = await self._interview_session_repository.get_by_id(session_id)
-        if session is None or session.user_id != user_id:
+        self._check_audio(audio)
+        transcription = asyncio.create_task(self._transcribe(audio, filename, content_type))
+        context = await self._load_answer_context_during(
+            transcription, session_id, interview_question_id, user_id
+        )
+
+        transcript = await transcription
+
+        # Evaluate answer with AI
+        ai_result = await self._openai_service.evaluate_answer(
+            question=context["question_text"],
+            answer=transcript,
+            model=ChatGPTModel.GPT_4_1,
+        )
+
+        if not ai_result:
+            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Failed to evaluate answer")
+
+        return await self._save_answer(context, interview_question_id, user_id, transcript, ai_result)
+
+    async def answer_stream(
+        self,
+        session_id: int,
+        interview_question_id: int,
+        audio: BinaryIO,
+        filename: str,
+        user_id: int,
+        content_type: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # Validate before the response starts so these still fail with a status code
+        self._check_audio(audio)
+        transcription = asyncio.create_task(self._transcribe(audio, filename, content_type))
+        context = await self._load_answer_context_during(
+            transcription, session_id, interview_question_id, user_id
+        )
+        return self._stream_answer(context, interview_question_id, transcription, user_id)
+
+    async def _stream_answer(
+        self,
+        context: Dict[str, Any],
+        interview_question_id: int,
+        transcription: "asyncio.Task[str]",
+        user_id: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            transcript = await transcription
+            yield {"event": "transcript", "text": transcript}
+
+            ai_result: Dict[str, Any] = {}
+            async for chunk in self._openai_service.stream_evaluate_answer(
+                question=context["question_text"],
+                answer=transcript,
+                model=ChatGPTModel.GPT_4_1,
+            ):
+                if isinstance(chunk, str):
+                    yield {"event": "feedback", "delta": chunk}
+                else:
+                    ai_result = chunk
+
+            if not ai_result:
+                raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Failed to evaluate answer")
+
+            result = await self._save_answer(context, interview_question_id, user_id, transcript, ai_result)
+            yield {"event": "result", "data": result}
+
+        except HTTPException as e:
+            yield {"event": "error", "status_code": e.status_code, "detail": e.detail}
+        except asyncio.CancelledError:
+            # The client went away: stop. Only a cancelled transcription is reported.
+            if asyncio.current_task().cancelling():
+                raise
+            logger.warning("Transcription cancelled for interview question %s", interview_question_id)
+            yield {"event": "error", "status_code": s.HTTP_500_INTERNAL_SERVER_ERROR, "detail": "Failed to transcribe audio"}
+        except Exception:
+            # The response has started, so the client only learns of failures from this event
+            logger.exception("Streaming answer for interview question %s failed", interview_question_id)
+            yield {"event": "error", "status_code": s.HTTP_500_INTERNAL_SERVER_ERROR, "detail": "Failed to process answer"}
+
+    async def _load_answer_context_during(
+        self,
+        transcription: "asyncio.Task[str]",
+        session_id: int,
+        interview_question_id: int,
+        user_id: int,
+    ) -> Dict[str, Any]:
+        # Transcription does not depend on the DB checks, so it runs while they do;
+        # when a check fails the transcription is dropped.
+        try:
+            return await self._load_answer_context(session_id, interview_question_id, user_id)
+        except BaseException:
+            if transcription.done():
+                if not transcription.cancelled():
+                    transcription.exception()
+            else:
+                transcription.cancel()
+            raise
+
+    async def _load_answer_context(
+        self,
+        session_id: int,
+        interview_question_id: int,
+        user_id: int,
+    ) -> Dict[str, Any]:
+        # Load session state (cached) to validate ownership
+        state = await self._get_state(session_id)
+        if state is None or state.session.user_id != user_id:
             raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail="Interview session not found")
+        session = state.session
 
         # Prevent answering if session is already finished
         if session.status != InterviewStatus.ACTIVE:
             raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Interview session is not active")
 
-        # Load the interview question (main or followup)
-        iq = await self._interview_question_repository.get_by_id(interview_question_id)
-        if iq is None or iq.session_id != session_id:
+        # Find the interview question (main or followup)
+        iq = self._find_question(state, interview_question_id)
+        if iq is None:
             raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail="Interview question not found")
 
-        # Ensure the user answers the current main question (or its followups only)
-        current_main = await self._interview_question_repository.get_current_main(
-            session_id=session_id,
-            index=session.current_main_index or 1,
-        )
+        # Ensure the user answers the current main question (or its followups only);
+        # the next main question is kept for the response
+        current_main = self._main_question_at(state, session.current_main_index or 1)
+        next_main = self._main_question_at(state, (session.current_main_index or 1) + 1)
         if current_main is None:
             raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail="Current main question not found")
         if iq.is_followup:
@@ -156,12 +298,8 @@ class InterviewController(IInterviewController):
         if main_question_id is None:
             raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Invalid interview question")
 
-        # Load main question when current is a followup
-        main_question = iq
-        if iq.is_followup:
-            main_question = await self._interview_question_repository.get_by_id(main_question_id)
-            if main_question is None:
-                raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail="Main question not found")
+        # A followup's main question is the current main question checked above
+        main_question = current_main if iq.is_followup else iq
 
         # Base question is the original question from questions table
         base_question_id = main_question.question_id
@@ -176,8 +314,28 @@ class InterviewController(IInterviewController):
         if not question_text:
             raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Question text not found")
 
-        # Detect container from bytes to set proper filename
-        sniff = audio[:16]
+        return {
+            "state": state,
+            "main_question_id": main_question_id,
+            "base_question_id": base_question_id,
+            "question_text": question_text,
+            "next_main": next_main,
+        }
+
+    def _check_audio(self, audio: BinaryIO) -> None:
+        # The upload is already spooled by the server; only its size is read here.
+        # Declared sizes are rejected earlier (BoundedUploadRoute), this catches chunked uploads.
+        size = audio.seek(0, os.SEEK_END)
+        audio.seek(0)
+        if size == 0:
+            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Audio file is empty")
+        if size > self._max_audio_bytes:
+            raise HTTPException(status_code=s.HTTP_413_CONTENT_TOO_LARGE, detail="Audio file is too large")
+
+    async def _transcribe(self, audio: BinaryIO, filename: str, content_type: Optional[str]) -> str:
+        # Detect container from the first bytes to set proper filename
+        sniff = audio.read(16)
+        audio.seek(0)
         if sniff.startswith(b"OggS"):
             filename = "audio.ogg"
         elif len(sniff) >= 8 and sniff[4:8] == b"ftyp":
@@ -190,21 +348,45 @@ class InterviewController(IInterviewController):
         # Transcribe audio to text
         transcript = await self._openai_service.transcribe_audio(
             filename=filename,
-            data=audio,
+            file=audio,
             content_type=content_type,
         )
         if not transcript:
             raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Failed to transcribe audio")
+        return transcript
 
-        # Evaluate answer with AI
-        ai_result = await self._openai_service.evaluate_answer(
-            question=question_text,
-            answer=transcript,
-            model=ChatGPTModel.GPT_4_1,
-        )
-
-        if not ai_result:
-            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Failed to evaluate answer")
+    async def _save_answer(
+        self,
+        context: Dict[str, Any],
+        interview_question_id: int,
+        user_id: int,
+        transcript: str,
+        ai_result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        state: InterviewSessionStateDTO = context["state"]
+
+        # Write-through: drop the cached state first so a failed write leaves
+        # nothing stale behind, then store the updated state once committed.
+        await self._interview_state_cache.delete(state.session.id)
+        result = await self._persist_answer(context, interview_question_id, user_id, transcript, ai_result)
+        await self._interview_state_cache.set(state)
+        # The new answer changes the user's progress statistics
+        await self._statistics_cache.delete_for_user(user_id)
+        return result
+
+    async def _persist_answer(
+        self,
+        context: Dict[str, Any],
+        interview_question_id: int,
+        user_id: int,
+        transcript: str,
+        ai_result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        state: InterviewSessionStateDTO = context["state"]
+        session = state.session
+        session_id = session.id
+        main_question_id = context["main_question_id"]
+        base_question_id = context["base_question_id"]
 
         # Extract AI payload
         status = ai_result.get("status")
@@ -228,7 +410,8 @@ class InterviewController(IInterviewController):
             )
 
             # Check followup count for this main question
-            followup_count = await self._interview_question_repository.count_followups(session_id, main_question_id)
+            followups = state.followups.setdefault(main_question_id, [])
+            followup_count = len(followups)
 
             # Create followup when AI requested and limit not reached
             if followup_question and followup_count < 2:
@@ -241,6 +424,7 @@ class InterviewController(IInterviewController):
                         followup_index=followup_count + 1,
                     )
                 )
+                followups.append(created_followup)
 
                 return {
                     "status": "need_followup",
@@ -262,6 +446,8 @@ class InterviewController(IInterviewController):
                     session_id,
                     InterviewSessionDTO(status=InterviewStatus.COMPLETED, current_main_index=next_index),
                 )
+                session.status = InterviewStatus.COMPLETED
+                session.current_main_index = next_index
 
                 user = await self._user_repository.get_by_id(user_id)
                 if user is None:
@@ -312,9 +498,10 @@ class InterviewController(IInterviewController):
                 session_id,
                 InterviewSessionDTO(current_main_index=next_index),
             )
+            session.current_main_index = next_index
 
-        # Load next main question to return in response
-        next_main = await self._interview_question_repository.get_current_main(session_id, next_index)
+        # Next main question was resolved from the session state
+        next_main: Optional[InterviewQuestionDTO] = context["next_main"]
         if next_main is None:
             raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail="Next question not found")
 
@@ -350,27 +537,80 @@ class InterviewController(IInterviewController):
             iq.question_text = text
         return iq
 
-    async def _get_current_question_for_session(self, session: InterviewSessionDTO) -> Optional[InterviewQuestionDTO]:
-        current_main = await self._interview_question_repository.get_current_main(
-            session_id=session.id,
-            index=session.current_main_index or 1,
-        )
+    async def _get_state(self, session_id: int) -> Optional[InterviewSessionStateDTO]:
+        state = await self._interview_state_cache.get(session_id)
+        if state is not None:
+            return state
+
+        # Cache miss: rebuild from the session and all of its questions. The
+        # generation is read first so a concurrent write-through is not undone.
+        generation = await self._interview_state_cache.get_generation(session_id)
+        session = await self._interview_session_repository.get_by_id(session_id)
+        if session is None:
+            return None
+
+        state = InterviewSessionStateDTO(session=session)
+        for q in await self._interview_question_repository.get_by_session(session_id):
+            if q.is_followup:
+                state.followups.setdefault(q.main_question_id, []).append(q)
+            else:
+                state.main_questions.append(q)
+        for followups in state.followups.values():
+            followups.sort(key=lambda q: (q.followup_index or 0, q.id))
+
+        await self._interview_state_cache.set_if_current(state, generation)
+        return state
+
+    @staticmethod
+    def _find_question(state: InterviewSessionStateDTO, interview_question_id: int) -> Optional[InterviewQuestionDTO]:
+        for q in state.main_questions:
+            if q.id == interview_question_id:
+                return q
+        for followups in state.followups.values():
+            for q in followups:
+                if q.id == interview_question_id:
+                    return q
+        return None
+
+    @staticmethod
+    def _main_question_at(state: InterviewSessionStateDTO, index: int) -> Optional[InterviewQuestionDTO]:
+        if 1 <= index <= len(state.main_questions):
+            return state.main_questions[index - 1]
+        return None
+
+    def _get_current_question(self, state: InterviewSessionStateDTO) -> Optional[InterviewQuestionDTO]:
+        current_main = self._main_question_at(state, state.session.current_main_index or 1)
         if current_main is None or current_main.id is None:
             return current_main
 
-        latest_followup = await self._interview_question_repository.get_latest_followup(
+        followups = state.followups.get(current_main.id)
+        return followups[-1] if followups else current_main
+
+    async def _get_current_question_for_session(self, session: InterviewSessionDTO) -> Optional[InterviewQuestionDTO]:
+        state = await self._interview_state_cache.get(session.id)
+        if state is not None:
+            return self._get_current_question(state)
+        return await self._load_current_question(session)
+
+    async def _load_current_question(self, session: InterviewSessionDTO) -> Optional[InterviewQuestionDTO]:
+        # Not cached: one indexed lookup instead of rebuilding the whole state
+        current_main, latest_followup = await self._interview_question_repository.get_current_main_with_latest_followup(
             session_id=session.id,
-            main_question_id=current_main.id,
+            index=session.current_main_index or 1,
         )
         return latest_followup or current_main
 
     async def get_session(self, session_id: int, user_id: int) -> Dict[str, Any]:
         # Validate session ownership
-        session = await self._interview_session_repository.get_by_id(session_id)
+        state = await self._interview_state_cache.get(session_id)
+        session = state.session if state else await self._interview_session_repository.get_by_id(session_id)
         if session is None or session.user_id != user_id:
             raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail="Interview session not found")
 
-        current_question = await self._get_current_question_for_session(session)
+        if state is not None:
+            current_question = self._get_current_question(state)
+        else:
+            current_question = await self._load_current_question(session)
 
         # Return minimal session state
         return {
@@ -1,6 +1,6 @@
-﻿from dataclasses import dataclass
+﻿from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from src.domain.value_objects import InterviewStatus
 
@@ -25,5 +25,14 @@ class InterviewQuestionDTO:
     is_followup: Optional[bool] = None
     main_question_id: Optional[int] = None
     followup_index: Optional[int] = None
+    main_index: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+
+@dataclass
+class InterviewSessionStateDTO:
+    session: InterviewSessionDTO
+    # Main questions in interview order, followups keyed by their main question id
+    main_questions: List[InterviewQuestionDTO] = field(default_factory=list)
+    followups: Dict[int, List[InterviewQuestionDTO]] = field(default_factory=dict)
@@ -1,7 +1,7 @@
 ﻿from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import AsyncIterator, BinaryIO, Optional, List, Dict, Any, Tuple
 
-from src.application.interview.dtos import InterviewSessionDTO, InterviewQuestionDTO
+from src.application.interview.dtos import InterviewSessionDTO, InterviewQuestionDTO, InterviewSessionStateDTO
 
 
 class IInterviewSessionRepository(ABC):
@@ -32,19 +32,35 @@ class IInterviewQuestionRepository(ABC):
     async def get_by_id(self, interview_question_id: int) -> Optional[InterviewQuestionDTO]: ...
 
     @abstractmethod
-    async def get_main_questions(self, session_id: int) -> List[InterviewQuestionDTO]: ...
+    async def get_current_main_with_latest_followup(
+        self, session_id: int, index: int
+    ) -> Tuple[Optional[InterviewQuestionDTO], Optional[InterviewQuestionDTO]]: ...
 
     @abstractmethod
-    async def get_current_main(self, session_id: int, index: int) -> Optional[InterviewQuestionDTO]: ...
+    async def get_by_session(self, session_id: int) -> List[InterviewQuestionDTO]: ...
 
     @abstractmethod
-    async def get_latest_followup(self, session_id: int, main_question_id: int) -> Optional[InterviewQuestionDTO]: ...
+    async def delete_by_user(self, user_id: int) -> int: ...
+
 
+class IInterviewStateCache(ABC):
     @abstractmethod
-    async def count_followups(self, session_id: int, main_question_id: int) -> int: ...
+    async def get(self, session_id: int) -> Optional[InterviewSessionStateDTO]: ...
 
     @abstractmethod
-    async def delete_by_user(self, user_id: int) -> int: ...
+    async def set(self, state: InterviewSessionStateDTO) -> None: ...
+
+    @abstractmethod
+    async def get_generation(self, session_id: int) -> Optional[str]: ...
+
+    @abstractmethod
+    async def set_if_current(self, state: InterviewSessionStateDTO, generation: Optional[str]) -> None: ...
+
+    @abstractmethod
+    async def delete(self, session_id: int) -> None: ...
+
+    @abstractmethod
+    async def delete_for_user(self, user_id: int) -> None: ...
 
 
 class IInterviewController(ABC):
@@ -52,7 +68,10 @@ class IInterviewController(ABC):
     async def start(self, user_id: int) -> Dict[str, Any]: ...
 
     @abstractmethod
-    async def answer(self, session_id: int, interview_question_id: int, audio: bytes, filename: str, user_id: int, content_type: Optional[str] = None) -> Dict[str, Any]: ...
+    async def answer(self, session_id: int, interview_question_id: int, audio: BinaryIO, filename: str, user_id: int, content_type: Optional[str] = None) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def answer_stream(self, session_id: int, interview_question_id: int, audio: BinaryIO, filename: str, user_id: int, content_type: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]: ...
 
     @abstractmethod
     async def get_question(self, interview_question_id: int, user_id: int) -> InterviewQuestionDTO: ...
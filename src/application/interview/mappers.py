@@ -1,7 +1,8 @@
-﻿from typing import Optional
+﻿from typing import Any, Dict, Optional
 
-from src.application.interview.dtos import InterviewSessionDTO, InterviewQuestionDTO
+from src.application.interview.dtos import InterviewSessionDTO, InterviewQuestionDTO, InterviewSessionStateDTO
 from src.application.interview.models import InterviewSession, InterviewQuestion
+from src.domain.value_objects import InterviewStatus
 
 
 def interview_session_orm_to_dto(row: InterviewSession) -> Optional[InterviewSessionDTO]:
@@ -49,6 +50,7 @@ def interview_question_orm_to_dto(row: InterviewQuestion) -> Optional[InterviewQ
         is_followup=row.is_followup,
         main_question_id=row.main_question_id,
         followup_index=row.followup_index,
+        main_index=row.main_index,
         created_at=row.created_at,
         updated_at=row.updated_at,
     )
@@ -81,4 +83,67 @@ def interview_question_dto_to_orm(
     if dto.followup_index is not None:
         row.followup_index = dto.followup_index
 
+    if dto.main_index is not None:
+        row.main_index = dto.main_index
+
     return row
+
+
+def _state_question_to_dict(dto: InterviewQuestionDTO) -> Dict[str, Any]:
+    return {
+        "id": dto.id,
+        "question_id": dto.question_id,
+        "question_text": dto.question_text,
+        "main_question_id": dto.main_question_id,
+        "followup_index": dto.followup_index,
+        "main_index": dto.main_index,
+    }
+
+
+def _state_question_from_dict(data: Dict[str, Any], session_id: int, is_followup: bool) -> InterviewQuestionDTO:
+    return InterviewQuestionDTO(
+        id=data["id"],
+        session_id=session_id,
+        question_id=data.get("question_id"),
+        question_text=data.get("question_text"),
+        is_followup=is_followup,
+        main_question_id=data.get("main_question_id"),
+        followup_index=data.get("followup_index"),
+        main_index=data.get("main_index"),
+    )
+
+
+def interview_state_to_dict(state: InterviewSessionStateDTO) -> Dict[str, Any]:
+    session = state.session
+    return {
+        "id": session.id,
+        "user_id": session.user_id,
+        "status": session.status.value if session.status is not None else None,
+        "current_main_index": session.current_main_index,
+        "total_main_questions": session.total_main_questions,
+        "main_questions": [_state_question_to_dict(q) for q in state.main_questions],
+        "followups": {
+            str(main_id): [_state_question_to_dict(q) for q in followups]
+            for main_id, followups in state.followups.items()
+        },
+    }
+
+
+def interview_state_from_dict(data: Dict[str, Any]) -> InterviewSessionStateDTO:
+    session_id = data["id"]
+    return InterviewSessionStateDTO(
+        session=InterviewSessionDTO(
+            id=session_id,
+            user_id=data["user_id"],
+            status=InterviewStatus(data["status"]) if data.get("status") else None,
+            current_main_index=data.get("current_main_index"),
+            total_main_questions=data.get("total_main_questions"),
+        ),
+        main_questions=[
+            _state_question_from_dict(q, session_id, is_followup=False) for q in data.get("main_questions") or []
+        ],
+        followups={
+            int(main_id): [_state_question_from_dict(q, session_id, is_followup=True) for q in followups]
+            for main_id, followups in (data.get("followups") or {}).items()
+        },
+    )
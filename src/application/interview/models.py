@@ -1,6 +1,6 @@
 ﻿from typing import Optional, List
 
-from sqlalchemy import Integer, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import Integer, ForeignKey, Enum as SQLEnum, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.dbs.postgre import Base
@@ -56,6 +56,10 @@ class InterviewSession(Base, TimestampMixin):
 
 class InterviewQuestion(Base, TimestampMixin):
     __tablename__ = "interview_questions"
+    __table_args__ = (
+        Index("ix_interview_questions_session_followup_main_index", "session_id", "is_followup", "main_index"),
+        Index("ix_interview_questions_main_question_followup_index", "main_question_id", "followup_index"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -94,6 +98,12 @@ class InterviewQuestion(Base, TimestampMixin):
         nullable=True,
     )
 
+    # 1-based position of a main question within its session; NULL for followups
+    main_index: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
     # --- Relations ---
     session: Mapped["InterviewSession"] = relationship(
         "InterviewSession",
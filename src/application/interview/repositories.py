@@ -1,7 +1,8 @@
-﻿from typing import Optional, List
+﻿from typing import Optional, List, Tuple
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, delete, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.application.interview.dtos import InterviewSessionDTO, InterviewQuestionDTO
 from src.application.interview.interfaces import IInterviewSessionRepository, IInterviewQuestionRepository
@@ -13,6 +14,7 @@ from src.application.interview.mappers import (
 )
 from src.application.interview.models import InterviewSession, InterviewQuestion
 from src.domain.value_objects import InterviewStatus
+from src.infrastructure.dbs.returning import insert_returning, insert_many_returning, update_returning
 
 
 class InterviewSessionRepository(IInterviewSessionRepository):
@@ -20,10 +22,7 @@ class InterviewSessionRepository(IInterviewSessionRepository):
         self._session = session
 
     async def add(self, dto: InterviewSessionDTO) -> Optional[InterviewSessionDTO]:
-        row = interview_session_dto_to_orm(dto)
-        self._session.add(row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, interview_session_dto_to_orm(dto))
         return interview_session_orm_to_dto(row)
 
     async def get_by_id(self, session_id: int) -> Optional[InterviewSessionDTO]:
@@ -33,16 +32,14 @@ class InterviewSessionRepository(IInterviewSessionRepository):
         return interview_session_orm_to_dto(row) if row else None
 
     async def update(self, session_id: int, dto: InterviewSessionDTO) -> Optional[InterviewSessionDTO]:
-        query = select(InterviewSession).where(InterviewSession.id == session_id)
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
+        row = await update_returning(
+            self._session,
+            interview_session_dto_to_orm(dto),
+            InterviewSession.id == session_id,
+        )
 
         if not row:
             return None
-
-        row = interview_session_dto_to_orm(dto, row)
-        await self._session.flush()
-        await self._session.refresh(row)
         return interview_session_orm_to_dto(row)
 
     async def get_active_by_user(self, user_id: int) -> Optional[InterviewSessionDTO]:
@@ -66,18 +63,14 @@ class InterviewQuestionRepository(IInterviewQuestionRepository):
         self._session = session
 
     async def add_many(self, dtos: List[InterviewQuestionDTO]) -> List[InterviewQuestionDTO]:
-        rows = [interview_question_dto_to_orm(dto) for dto in dtos]
-        self._session.add_all(rows)
-        await self._session.flush()
-        for row in rows:
-            await self._session.refresh(row)
+        rows = await insert_many_returning(
+            self._session,
+            [interview_question_dto_to_orm(dto) for dto in dtos],
+        )
         return [interview_question_orm_to_dto(r) for r in rows]
 
     async def add(self, dto: InterviewQuestionDTO) -> Optional[InterviewQuestionDTO]:
-        row = interview_question_dto_to_orm(dto)
-        self._session.add(row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, interview_question_dto_to_orm(dto))
         return interview_question_orm_to_dto(row)
 
     async def get_by_id(self, interview_question_id: int) -> Optional[InterviewQuestionDTO]:
@@ -86,42 +79,46 @@ class InterviewQuestionRepository(IInterviewQuestionRepository):
         row = result.scalar_one_or_none()
         return interview_question_orm_to_dto(row) if row else None
 
-    async def get_main_questions(self, session_id: int) -> List[InterviewQuestionDTO]:
-        query = select(InterviewQuestion).where(
-            InterviewQuestion.session_id == session_id,
-            InterviewQuestion.is_followup.is_(False),
+    async def get_current_main_with_latest_followup(
+        self, session_id: int, index: int
+    ) -> Tuple[Optional[InterviewQuestionDTO], Optional[InterviewQuestionDTO]]:
+        main = aliased(InterviewQuestion)
+        followup = aliased(InterviewQuestion)
+        latest_followup = (
+            select(followup)
+            .where(
+                followup.main_question_id == main.id,
+                followup.is_followup.is_(True),
+            )
+            .order_by(followup.followup_index.desc(), followup.id.desc())
+            .limit(1)
+            .lateral()
+        )
+        latest = aliased(followup, latest_followup)
+        query = (
+            select(main, latest)
+            .outerjoin(latest_followup, true())
+            .where(
+                main.session_id == session_id,
+                main.is_followup.is_(False),
+                main.main_index == index,
+            )
         )
         result = await self._session.execute(query)
-        rows = result.scalars().all()
-        return [interview_question_orm_to_dto(r) for r in rows]
-
-    async def get_current_main(self, session_id: int, index: int) -> Optional[InterviewQuestionDTO]:
-        query = select(InterviewQuestion).where(
-            InterviewQuestion.session_id == session_id,
-            InterviewQuestion.is_followup.is_(False),
-        ).order_by(InterviewQuestion.id).offset(index - 1).limit(1)
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
-        return interview_question_orm_to_dto(row) if row else None
+        row = result.first()
+        if row is None:
+            return None, None
+        return (
+            interview_question_orm_to_dto(row[0]),
+            interview_question_orm_to_dto(row[1]) if row[1] else None,
+        )
 
-    async def get_latest_followup(self, session_id: int, main_question_id: int) -> Optional[InterviewQuestionDTO]:
+    async def get_by_session(self, session_id: int) -> List[InterviewQuestionDTO]:
         query = select(InterviewQuestion).where(
             InterviewQuestion.session_id == session_id,
-            InterviewQuestion.main_question_id == main_question_id,
-            InterviewQuestion.is_followup.is_(True),
-        ).order_by(InterviewQuestion.followup_index.desc(), InterviewQuestion.id.desc()).limit(1)
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
-        return interview_question_orm_to_dto(row) if row else None
-
-    async def count_followups(self, session_id: int, main_question_id: int) -> int:
-        query = select(func.count()).select_from(InterviewQuestion).where(
-            InterviewQuestion.session_id == session_id,
-            InterviewQuestion.main_question_id == main_question_id,
-            InterviewQuestion.is_followup.is_(True),
-        )
+        ).order_by(InterviewQuestion.main_index, InterviewQuestion.id)
         result = await self._session.execute(query)
-        return int(result.scalar_one())
+        return [interview_question_orm_to_dto(row) for row in result.scalars().all()]
 
     async def delete_by_user(self, user_id: int) -> int:
         session_ids_subq = select(InterviewSession.id).where(InterviewSession.user_id == user_id)
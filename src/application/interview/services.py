@@ -0,0 +1,119 @@
+import json
+import logging
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.application.interview.dtos import InterviewSessionStateDTO
+from src.application.interview.interfaces import IInterviewStateCache
+from src.application.interview.mappers import interview_state_from_dict, interview_state_to_dict
+
+logger = logging.getLogger(__name__)
+
+
+class InterviewStateCache(IInterviewStateCache):
+    """Write-through Redis copy of an interview session and its questions.
+
+    ``interview:state:<session_id>``            the serialized session state
+    ``interview:state:generation:<session_id>`` counter bumped by every write-through ``set`` and delete
+    ``interview:state:user:<user_id>``          ids of the user's cached sessions, for bulk invalidation
+
+    A state rebuilt from the database on a miss is stored with ``set_if_current``
+    and the generation read before the rebuild, so it never replaces a newer
+    write-through state or revives a deleted one.
+
+    Redis errors are logged and treated as a miss, so callers fall back to the database.
+    """
+
+    # KEYS: generation, state, user sessions; ARGV: generation, value, ttl, session_id
+    _SET_IF_CURRENT = """
+        if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+            return 0
+        end
+        redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+        redis.call('SADD', KEYS[3], ARGV[4])
+        redis.call('EXPIRE', KEYS[3], ARGV[3])
+        return 1
+    """
+
+    def __init__(self, redis: Redis, ttl: int = 21600):
+        self._redis = redis
+        self._ttl = ttl
+        self._set_if_current = redis.register_script(self._SET_IF_CURRENT)
+
+    @staticmethod
+    def _key(session_id: int) -> str:
+        return f"interview:state:{session_id}"
+
+    @staticmethod
+    def _generation_key(session_id: int) -> str:
+        return f"interview:state:generation:{session_id}"
+
+    @staticmethod
+    def _user_key(user_id: int) -> str:
+        return f"interview:state:user:{user_id}"
+
+    def _bump_generation(self, pipe, session_id: int) -> None:
+        pipe.incr(self._generation_key(session_id))
+        pipe.expire(self._generation_key(session_id), self._ttl)
+
+    async def get(self, session_id: int) -> Optional[InterviewSessionStateDTO]:
+        try:
+            raw = await self._redis.get(self._key(session_id))
+        except RedisError:
+            logger.exception("Interview state read failed")
+            return None
+        return interview_state_from_dict(json.loads(raw)) if raw else None
+
+    async def get_generation(self, session_id: int) -> Optional[str]:
+        try:
+            return await self._redis.get(self._generation_key(session_id)) or "0"
+        except RedisError:
+            logger.exception("Interview state read failed")
+            return None
+
+    async def set(self, state: InterviewSessionStateDTO) -> None:
+        session = state.session
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.set(self._key(session.id), json.dumps(interview_state_to_dict(state)), ex=self._ttl)
+                self._bump_generation(pipe, session.id)
+                pipe.sadd(self._user_key(session.user_id), session.id)
+                pipe.expire(self._user_key(session.user_id), self._ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Interview state write failed")
+
+    async def set_if_current(self, state: InterviewSessionStateDTO, generation: Optional[str]) -> None:
+        if generation is None:
+            return
+        session = state.session
+        try:
+            await self._set_if_current(
+                keys=[self._generation_key(session.id), self._key(session.id), self._user_key(session.user_id)],
+                args=[generation, json.dumps(interview_state_to_dict(state)), self._ttl, session.id],
+            )
+        except RedisError:
+            logger.exception("Interview state write failed")
+
+    async def delete(self, session_id: int) -> None:
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                self._bump_generation(pipe, session_id)
+                pipe.delete(self._key(session_id))
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Interview state delete failed")
+
+    async def delete_for_user(self, user_id: int) -> None:
+        try:
+            session_ids = await self._redis.smembers(self._user_key(user_id))
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for session_id in session_ids:
+                    self._bump_generation(pipe, int(session_id))
+                keys = [self._key(int(session_id)) for session_id in session_ids]
+                pipe.delete(self._user_key(user_id), *keys)
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Interview state delete failed")
@@ -50,14 +50,10 @@ class LearningRecommendationController(ILearningRecommendationController):
                 "sources": [r.source for r in existing if r.source],
             }
 
-        sources: List[str] = []
-        for _ in range(3):
-            sources = await self._openai_service.get_learning_recommendations(
-                skill_name=skill_name,
-                model=ChatGPTModel.GPT_4_1,
-            )
-            if sources:
-                break
+        sources = await self._openai_service.get_learning_recommendations(
+            skill_name=skill_name,
+            model=ChatGPTModel.GPT_4_1,
+        )
         if not sources:
             raise HTTPException(
                 status_code=s.HTTP_408_REQUEST_TIMEOUT,
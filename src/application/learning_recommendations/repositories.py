@@ -10,6 +10,7 @@ from src.application.learning_recommendations.mappers import (
     learning_recommendation_dto_to_orm,
 )
 from src.application.learning_recommendations.models import LearningRecommendation
+from src.infrastructure.dbs.returning import insert_many_returning
 
 
 class LearningRecommendationRepository(ILearningRecommendationRepository):
@@ -17,12 +18,10 @@ class LearningRecommendationRepository(ILearningRecommendationRepository):
         self._session = session
 
     async def add_many(self, dtos: List[LearningRecommendationDTO]) -> List[LearningRecommendationDTO]:
-        rows = [learning_recommendation_dto_to_orm(dto) for dto in dtos]
-        self._session.add_all(rows)
-
-        await self._session.flush()
-        for row in rows:
-            await self._session.refresh(row)
+        rows = await insert_many_returning(
+            self._session,
+            [learning_recommendation_dto_to_orm(dto) for dto in dtos],
+        )
 
         return [learning_recommendation_orm_to_dto(row) for row in rows]
 
@@ -5,6 +5,7 @@ from fastapi import HTTPException, status as s
 from src.application.locations.dtos import CountryDTO, CityDTO
 from src.application.locations.interfaces import ILocationController, ICountryRepository, ICityRepository
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import InvalidCursorError
 
 
 class LocationController(ILocationController):
@@ -17,8 +18,10 @@ class LocationController(ILocationController):
         self._city_repository = city_repository
 
     async def get_countries_by_name(self, pagination: PaginationDTO[CountryDTO], q: Optional[str]) -> PaginationDTO[CountryDTO]:
-        res = await self._country_repository.get(name=q, pagination=pagination)
-        return res
+        try:
+            return await self._country_repository.get(name=q, pagination=pagination)
+        except InvalidCursorError:
+            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
 
     async def get_country_by_id(self, country_id: int) -> Optional[CountryDTO]:
         res = await self._country_repository.get_by_id(country_id)
@@ -34,8 +37,10 @@ class LocationController(ILocationController):
             country_id: Optional[int],
             populate_country: bool = False,
     ) -> PaginationDTO[CityDTO]:
-        res = await self._city_repository.get(name=q, pagination=pagination, populate_country=populate_country, country_id=country_id)
-        return res
+        try:
+            return await self._city_repository.get(name=q, pagination=pagination, populate_country=populate_country, country_id=country_id)
+        except InvalidCursorError:
+            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
 
     async def get_city_by_id(self, city_id: int, populate_country: bool = False) -> Optional[CityDTO]:
         res = await self._city_repository.get_by_id(city_id=city_id, populate_country=populate_country)
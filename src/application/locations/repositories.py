@@ -1,6 +1,6 @@
 from typing import Optional, List
 
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -9,6 +9,7 @@ from src.application.locations.models import Country, City
 from src.application.locations.dtos import CountryDTO, CityDTO
 from src.application.locations.mappers import country_orm_to_dto, city_orm_to_dto
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import paginate
 
 
 class CountryRepository(ICountryRepository):
@@ -44,31 +45,23 @@ class CountryRepository(ICountryRepository):
                 Country.name.ilike(f"%{name}%")
             )
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
-        if pagination is None or pagination.per_page is None:
-            query = base_query
-            page = 1
-            per_page = total
-        else:
-            page = max(pagination.page or 1, 1)
-            per_page = max(pagination.per_page or 10, 1)
-            offset = (page - 1) * per_page
-            query = base_query.offset(offset).limit(per_page)
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=[Country.name, Country.id],
+        )
 
         items: List[CountryDTO] = [
-            country_orm_to_dto(row) for row in rows
+            country_orm_to_dto(row) for row in paged.rows
         ]
 
         return PaginationDTO[CountryDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
 
 
@@ -133,30 +126,22 @@ class CityRepository(ICityRepository):
                 City.country_id == country_id
             )
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
-        if pagination is None or pagination.per_page is None:
-            query = base_query
-            page = 1
-            per_page = total
-        else:
-            page = max(pagination.page or 1, 1)
-            per_page = max(pagination.per_page or 10, 1)
-            offset = (page - 1) * per_page
-            query = base_query.offset(offset).limit(per_page)
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=[City.name, City.id],
+        )
 
         items: List[CityDTO] = [
             city_orm_to_dto(row, populate_country=populate_country)
-            for row in rows
+            for row in paged.rows
         ]
 
         return PaginationDTO[CityDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
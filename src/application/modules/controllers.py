@@ -7,6 +7,7 @@ from src.application.directions.dtos import ProgressStatisticsDTO
 from src.application.skills.dtos import UserSkillDTO
 from src.application.skills.interfaces import IUserSkillRepository
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import InvalidCursorError
 
 
 class ModuleController(IModuleController):
@@ -24,12 +25,15 @@ class ModuleController(IModuleController):
         pagination: Optional[PaginationDTO[UserSkillDTO]] = None,
         populate_skill: bool = False,
     ) -> PaginationDTO[UserSkillDTO]:
-        return await self._user_skill_repository.get_by_user_id(
-            user_id=user_id,
-            pagination=pagination,
-            populate_skill=populate_skill,
-            to_learn=True,
-        )
+        try:
+            return await self._user_skill_repository.get_by_user_id(
+                user_id=user_id,
+                pagination=pagination,
+                populate_skill=populate_skill,
+                to_learn=True,
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
 
     async def get_statistics(
         self,
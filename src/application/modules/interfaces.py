@@ -1,11 +1,46 @@
 ﻿from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from src.application.skills.dtos import UserSkillDTO
 from src.domain.base_dto import PaginationDTO
 from src.application.directions.dtos import ProgressStatisticsDTO
 
 
+class IProgressStatisticsCache(ABC):
+    @abstractmethod
+    async def get_module(self, user_id: int, module_id: int) -> Optional[ProgressStatisticsDTO]: ...
+
+    @abstractmethod
+    async def get_generation(self, user_id: int) -> Optional[str]: ...
+
+    @abstractmethod
+    async def set_module(
+        self,
+        user_id: int,
+        module_id: int,
+        statistics: ProgressStatisticsDTO,
+        generation: Optional[str],
+    ) -> None: ...
+
+    @abstractmethod
+    async def get_direction(self, user_id: int) -> Optional[ProgressStatisticsDTO]: ...
+
+    @abstractmethod
+    async def set_direction(
+        self,
+        user_id: int,
+        statistics: ProgressStatisticsDTO,
+        module_ids: List[int],
+        generation: Optional[str],
+    ) -> None: ...
+
+    @abstractmethod
+    async def delete_for_user(self, user_id: int) -> None: ...
+
+    @abstractmethod
+    async def delete_for_module(self, module_id: int) -> None: ...
+
+
 class IModuleStatisticsService(ABC):
     @abstractmethod
     async def get_statistics(
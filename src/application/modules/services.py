@@ -1,62 +1,203 @@
-﻿from typing import Optional, Dict
+﻿import json
+import logging
+from dataclasses import asdict
+from typing import List, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from src.application.directions.dtos import ProgressStatisticsDTO
-from src.application.modules.interfaces import IModuleStatisticsService
-from src.application.questions.interfaces import IQuestionRepository, IUserQuestionRepository
-from src.domain.value_objects import QuestionStatus
+from src.application.modules.interfaces import IModuleStatisticsService, IProgressStatisticsCache
+from src.application.questions.interfaces import IUserQuestionRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressStatisticsCache(IProgressStatisticsCache):
+    """Per-user progress statistics in Redis.
+
+    ``statistics:progress:<user_id>``            hash with ``module:<module_id>`` and ``direction`` fields
+    ``statistics:progress:generation:<user_id>`` counter bumped on every invalidation of the user
+    ``statistics:progress:module:<module_id>``   ids of users whose cached statistics include the module
+
+    Entries are dropped when the user answers a question or changes modules, and
+    when questions are added to a module. Callers read ``get_generation`` before
+    querying the database and pass it to ``set_*``, which only writes while the
+    generation is unchanged, so a read that raced an invalidation is not cached.
+    The hash expires ``ttl`` seconds after its first field was written.
+
+    Redis errors are logged and treated as a miss, so callers fall back to the database.
+    """
+
+    DIRECTION_FIELD = "direction"
+
+    # KEYS: generation, hash, module sets...; ARGV: generation, field, value, ttl, user_id
+    _SET_IF_CURRENT = """
+        if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+            return 0
+        end
+        redis.call('HSET', KEYS[2], ARGV[2], ARGV[3])
+        if redis.call('TTL', KEYS[2]) < 0 then
+            redis.call('EXPIRE', KEYS[2], ARGV[4])
+        end
+        for i = 3, #KEYS do
+            redis.call('SADD', KEYS[i], ARGV[5])
+            redis.call('EXPIRE', KEYS[i], ARGV[4])
+        end
+        return 1
+    """
+
+    def __init__(self, redis: Redis, ttl: int = 3600):
+        self._redis = redis
+        self._ttl = ttl
+        self._set_if_current = redis.register_script(self._SET_IF_CURRENT)
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"statistics:progress:{user_id}"
+
+    @staticmethod
+    def _generation_key(user_id: int) -> str:
+        return f"statistics:progress:generation:{user_id}"
+
+    @staticmethod
+    def _module_key(module_id: int) -> str:
+        return f"statistics:progress:module:{module_id}"
+
+    @staticmethod
+    def _module_field(module_id: int) -> str:
+        return f"module:{module_id}"
+
+    async def _get(self, user_id: int, field: str) -> Optional[ProgressStatisticsDTO]:
+        try:
+            raw = await self._redis.hget(self._key(user_id), field)
+        except RedisError:
+            logger.exception("Progress statistics read failed")
+            return None
+        return ProgressStatisticsDTO(**json.loads(raw)) if raw else None
+
+    async def _set(
+        self,
+        user_id: int,
+        field: str,
+        statistics: ProgressStatisticsDTO,
+        module_ids: List[int],
+        generation: Optional[str],
+    ) -> None:
+        if generation is None:
+            return
+        try:
+            await self._set_if_current(
+                keys=[
+                    self._generation_key(user_id),
+                    self._key(user_id),
+                    *(self._module_key(module_id) for module_id in module_ids),
+                ],
+                args=[generation, field, json.dumps(asdict(statistics)), self._ttl, user_id],
+            )
+        except RedisError:
+            logger.exception("Progress statistics write failed")
+
+    def _invalidate(self, pipe, user_id: int) -> None:
+        pipe.incr(self._generation_key(user_id))
+        # Outlives any read that started before the invalidation
+        pipe.expire(self._generation_key(user_id), self._ttl)
+        pipe.delete(self._key(user_id))
+
+    async def get_generation(self, user_id: int) -> Optional[str]:
+        try:
+            return await self._redis.get(self._generation_key(user_id)) or "0"
+        except RedisError:
+            logger.exception("Progress statistics read failed")
+            return None
+
+    async def get_module(self, user_id: int, module_id: int) -> Optional[ProgressStatisticsDTO]:
+        return await self._get(user_id, self._module_field(module_id))
+
+    async def set_module(
+        self,
+        user_id: int,
+        module_id: int,
+        statistics: ProgressStatisticsDTO,
+        generation: Optional[str],
+    ) -> None:
+        await self._set(user_id, self._module_field(module_id), statistics, [module_id], generation)
+
+    async def get_direction(self, user_id: int) -> Optional[ProgressStatisticsDTO]:
+        return await self._get(user_id, self.DIRECTION_FIELD)
+
+    async def set_direction(
+        self,
+        user_id: int,
+        statistics: ProgressStatisticsDTO,
+        module_ids: List[int],
+        generation: Optional[str],
+    ) -> None:
+        await self._set(user_id, self.DIRECTION_FIELD, statistics, module_ids, generation)
+
+    async def delete_for_user(self, user_id: int) -> None:
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                self._invalidate(pipe, user_id)
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Progress statistics delete failed")
+
+    async def delete_for_module(self, module_id: int) -> None:
+        try:
+            user_ids = await self._redis.smembers(self._module_key(module_id))
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for user_id in user_ids:
+                    self._invalidate(pipe, int(user_id))
+                pipe.delete(self._module_key(module_id))
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Progress statistics delete failed")
 
 
 class ModuleStatisticsService(IModuleStatisticsService):
     def __init__(
         self,
-        question_repository: IQuestionRepository,
         user_question_repository: IUserQuestionRepository,
+        statistics_cache: IProgressStatisticsCache,
     ):
-        self._question_repository = question_repository
         self._user_question_repository = user_question_repository
+        self._statistics_cache = statistics_cache
 
     async def get_statistics(
         self,
         user_id: int,
         module_id: int,
     ) -> ProgressStatisticsDTO:
-        questions_page = await self._question_repository.get(
-            pagination=None,
-            module_id=module_id,
-        )
-        total_questions = questions_page.total or 0
+        cached = await self._statistics_cache.get_module(user_id=user_id, module_id=module_id)
+        if cached is not None:
+            return cached
+
+        # Read before the query, so the result is not cached if an answer lands meanwhile
+        generation = await self._statistics_cache.get_generation(user_id=user_id)
 
-        user_questions_page = await self._user_question_repository.get(
-            pagination=None,
+        progress = await self._user_question_repository.get_module_progress(
             user_id=user_id,
-            module_id=module_id,
+            module_ids=[module_id],
         )
-        user_questions = user_questions_page.items or []
-
-        latest_by_question: Dict[int, int] = {}
-        status_by_question: Dict[int, QuestionStatus] = {}
-
-        for uq in user_questions:
-            if uq.question_id is None or uq.id is None or uq.status is None:
-                continue
-
-            prev_id = latest_by_question.get(uq.question_id)
-            if prev_id is None or uq.id > prev_id:
-                latest_by_question[uq.question_id] = uq.id
-                status_by_question[uq.question_id] = uq.status
-
-        correct_answers = sum(1 for s in status_by_question.values() if s == QuestionStatus.SATISFACTORY)
-        incorrect_answers = sum(1 for s in status_by_question.values() if s == QuestionStatus.UNSATISFACTORY)
-        met_questions = len(status_by_question)
+        module_progress = progress[module_id]
+        total_questions = module_progress.total_questions
 
         readiness_percentage = 0.0
         if total_questions > 0:
-            readiness_percentage = (correct_answers / total_questions) * 100
+            readiness_percentage = (module_progress.correct_answers / total_questions) * 100
 
-        return ProgressStatisticsDTO(
+        statistics = ProgressStatisticsDTO(
             total_questions=total_questions,
-            met_questions=met_questions,
-            correct_answers=correct_answers,
-            incorrect_answers=incorrect_answers,
+            met_questions=module_progress.met_questions,
+            correct_answers=module_progress.correct_answers,
+            incorrect_answers=module_progress.incorrect_answers,
             readiness_percentage=readiness_percentage,
         )
+        await self._statistics_cache.set_module(
+            user_id=user_id,
+            module_id=module_id,
+            statistics=statistics,
+            generation=generation,
+        )
+        return statistics
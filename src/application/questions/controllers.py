@@ -10,6 +10,7 @@ from src.application.questions.interfaces import (
 )
 from src.application.skills.interfaces import ISkillRepository, IUserSkillRepository
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import InvalidCursorError
 
 
 class QuestionController(IQuestionController):
@@ -54,11 +55,14 @@ class QuestionController(IQuestionController):
         )
         if user_module is None or not user_module.to_learn:
             raise HTTPException(status_code=s.HTTP_403_FORBIDDEN, detail=f"You do not have access to this module")
-        return await self._question_repository.get(
-            pagination=pagination,
-            module_id=module_id,
-            populate_skill=populate_skill,
-        )
+        try:
+            return await self._question_repository.get(
+                pagination=pagination,
+                module_id=module_id,
+                populate_skill=populate_skill,
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
 
     async def get_user_answers(
         self,
@@ -85,10 +89,13 @@ class QuestionController(IQuestionController):
             if question is None:
                 raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail=f"Question {question_id} not found")
 
-        return await self._user_question_repository.get(
-            pagination=pagination,
-            user_id=user_id,
-            module_id=module_id,
-            question_id=question_id,
-            populate_question=populate_question,
-        )
+        try:
+            return await self._user_question_repository.get(
+                pagination=pagination,
+                user_id=user_id,
+                module_id=module_id,
+                question_id=question_id,
+                populate_question=populate_question,
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
@@ -24,3 +24,12 @@ class UserQuestionDTO:
     status: Optional[QuestionStatus] = None
     interview_question_id: Optional[int] = None
     question: Optional[QuestionDTO] = None
+
+
+@dataclass
+class ModuleProgressDTO:
+    module_id: Optional[int] = None
+    total_questions: int = 0
+    met_questions: int = 0
+    correct_answers: int = 0
+    incorrect_answers: int = 0
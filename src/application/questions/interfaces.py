@@ -1,7 +1,8 @@
 ﻿from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional, List
 
-from src.application.questions.dtos import QuestionDTO, UserQuestionDTO
+from src.application.questions.dtos import QuestionDTO, UserQuestionDTO, ModuleProgressDTO
+from src.application.skills.dtos import UserSkillDTO
 from src.domain.base_dto import PaginationDTO
 
 
@@ -9,6 +10,9 @@ class IQuestionRepository(ABC):
     @abstractmethod
     async def add(self, dto: QuestionDTO) -> Optional[QuestionDTO]: ...
 
+    @abstractmethod
+    async def add_many(self, dtos: List[QuestionDTO]) -> List[QuestionDTO]: ...
+
     @abstractmethod
     async def get(
         self,
@@ -35,6 +39,17 @@ class IQuestionRepository(ABC):
     @abstractmethod
     async def delete(self, question_id: int) -> bool: ...
 
+    @abstractmethod
+    async def sample_for_modules(
+        self,
+        module_weights: Dict[int, float],
+        limit: int,
+        user_id: Optional[int] = None,
+    ) -> List[QuestionDTO]: ...
+
+    @abstractmethod
+    async def count_by_modules(self, module_ids: List[int]) -> Dict[int, int]: ...
+
 
 class IUserQuestionRepository(ABC):
     @abstractmethod
@@ -80,6 +95,27 @@ class IUserQuestionRepository(ABC):
         module_id: int,
     ) -> int: ...
 
+    @abstractmethod
+    async def get_module_progress(
+        self,
+        user_id: int,
+        module_ids: List[int],
+    ) -> Dict[int, ModuleProgressDTO]: ...
+
+    @abstractmethod
+    async def get_learning_progress(
+        self,
+        user_id: int,
+    ) -> Dict[int, ModuleProgressDTO]: ...
+
+
+class IQuestionSeedService(ABC):
+    @abstractmethod
+    async def enqueue(self, modules: List[UserSkillDTO]) -> List[int]: ...
+
+    @abstractmethod
+    async def get_pending_module_ids(self, module_ids: List[int]) -> List[int]: ...
+
 
 class IQuestionController(ABC):
     @abstractmethod
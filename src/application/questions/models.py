@@ -1,6 +1,7 @@
-﻿from typing import Optional
+﻿from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Integer, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Integer, Text, ForeignKey, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.dbs.postgre import Base
@@ -30,6 +31,7 @@ class Question(Base, TimestampMixin):
     skill_id: Mapped[int] = mapped_column(
         ForeignKey("skills.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
     # --- Relations ---
@@ -101,3 +103,44 @@ class UserQuestion(Base, TimestampMixin):
         "InterviewQuestion",
         back_populates="user_questions",
     )
+
+
+class UserQuestionProgress(Base):
+    """Latest answer state per user and question, maintained on every answer."""
+
+    __tablename__ = "user_question_progress"
+    __table_args__ = (
+        Index("ix_user_question_progress_user_skill", "user_id", "skill_id"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    question_id: Mapped[int] = mapped_column(
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Copy of questions.skill_id, so per-module lookups stay on this table
+    skill_id: Mapped[int] = mapped_column(
+        ForeignKey("skills.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    last_status: Mapped[QuestionStatus] = mapped_column(
+        SQLEnum(QuestionStatus, name="question_status"),
+        nullable=False,
+    )
+
+    last_seen_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+    )
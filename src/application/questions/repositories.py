@@ -1,12 +1,14 @@
-﻿from typing import Optional, List
+﻿from typing import Dict, Optional, List
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, delete, func, any_, and_, case, bindparam, column, Integer, Float
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.application.questions.dtos import QuestionDTO, UserQuestionDTO
+from src.application.questions.dtos import QuestionDTO, UserQuestionDTO, ModuleProgressDTO
 from src.application.questions.interfaces import IQuestionRepository, IUserQuestionRepository
-from src.application.questions.models import Question, UserQuestion
+from src.application.questions.models import Question, UserQuestion, UserQuestionProgress
+from src.application.skills.models import UserSkill
 from src.application.questions.mappers import (
     question_orm_to_dto,
     question_dto_to_orm,
@@ -14,6 +16,17 @@ from src.application.questions.mappers import (
     user_question_dto_to_orm,
 )
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import paginate
+from src.domain.value_objects import QuestionStatus
+from src.infrastructure.dbs.returning import insert_returning, insert_many_returning, update_returning
+
+# Per-user sampling priorities, relative to a question answered satisfactorily long ago
+UNSEEN_PRIORITY = 4.0
+UNSATISFACTORY_PRIORITY = 3.0
+# A satisfactory answer first drops its question to this priority, which then
+# recovers linearly back to 1 over SATISFACTORY_RECOVERY_DAYS
+SATISFACTORY_MIN_PRIORITY = 0.25
+SATISFACTORY_RECOVERY_DAYS = 28
 
 
 class QuestionRepository(IQuestionRepository):
@@ -32,14 +45,85 @@ class QuestionRepository(IQuestionRepository):
         return query
 
     async def add(self, dto: QuestionDTO) -> Optional[QuestionDTO]:
-        row = question_dto_to_orm(dto)
-
-        self._session.add(row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, question_dto_to_orm(dto))
 
         return question_orm_to_dto(row)
 
+    async def add_many(self, dtos: List[QuestionDTO]) -> List[QuestionDTO]:
+        rows = await insert_many_returning(
+            self._session,
+            [question_dto_to_orm(dto) for dto in dtos],
+        )
+
+        return [question_orm_to_dto(row) for row in rows]
+
+    async def sample_for_modules(
+        self,
+        module_weights: Dict[int, float],
+        limit: int,
+        user_id: Optional[int] = None,
+    ) -> List[QuestionDTO]:
+        """Random ``limit`` questions across modules, without replacement.
+
+        Weighted random sampling (Efraimidis-Spirakis): each row gets the key
+        ``-ln(u) / w`` and the smallest keys win. ``w`` is the module weight divided
+        by the module's question count, so each module's expected share follows
+        its weight rather than its size.
+
+        With ``user_id`` the weight is also scaled by the user's progress on the
+        question (see the ``*_PRIORITY`` constants), favouring unseen questions and
+        questions last answered unsatisfactorily.
+        """
+        if not module_weights or limit <= 0:
+            return []
+
+        weights = func.unnest(
+            bindparam("module_ids", list(module_weights.keys()), type_=ARRAY(Integer)),
+            bindparam("module_weights", [float(w) for w in module_weights.values()], type_=ARRAY(Float)),
+        ).table_valued(column("module_id", Integer), column("weight", Float)).render_derived()
+
+        query = select(Question).join(weights, Question.skill_id == weights.c.module_id)
+        weight = weights.c.weight
+
+        if user_id is not None:
+            query = query.outerjoin(
+                UserQuestionProgress,
+                and_(
+                    UserQuestionProgress.user_id == user_id,
+                    UserQuestionProgress.question_id == Question.id,
+                ),
+            )
+            days_since_seen = func.extract("epoch", func.now() - UserQuestionProgress.last_seen_at) / 86400
+            priority = case(
+                (UserQuestionProgress.question_id.is_(None), UNSEEN_PRIORITY),
+                (UserQuestionProgress.last_status == QuestionStatus.UNSATISFACTORY, UNSATISFACTORY_PRIORITY),
+                else_=func.least(
+                    SATISFACTORY_MIN_PRIORITY
+                    + (1 - SATISFACTORY_MIN_PRIORITY) * days_since_seen / SATISFACTORY_RECOVERY_DAYS,
+                    1.0,
+                ),
+            )
+            weight = weight * priority
+
+        # 1 - random() is in (0, 1], so the logarithm is always defined
+        sort_key = (
+            -func.ln(1 - func.random())
+            * func.count().over(partition_by=Question.skill_id)
+            / weight
+        )
+        query = query.order_by(sort_key).limit(limit)
+        result = await self._session.execute(query)
+        return [question_orm_to_dto(row) for row in result.scalars().all()]
+
+    async def count_by_modules(self, module_ids: List[int]) -> Dict[int, int]:
+        query = (
+            select(Question.skill_id, func.count())
+            .where(Question.skill_id == any_(bindparam("module_ids", list(module_ids), type_=ARRAY(Integer))))
+            .group_by(Question.skill_id)
+        )
+        result = await self._session.execute(query)
+        return {skill_id: int(count) for skill_id, count in result.all()}
+
     async def get(
         self,
         pagination: Optional[PaginationDTO[QuestionDTO]] = None,
@@ -56,33 +140,25 @@ class QuestionRepository(IQuestionRepository):
         if q:
             base_query = base_query.where(Question.question.ilike(f"%{q}%"))
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
-        if pagination is None or pagination.per_page is None:
-            query = base_query
-            page = 1
-            per_page = total
-        else:
-            page = max(pagination.page or 1, 1)
-            per_page = max(pagination.per_page or 10, 1)
-            offset = (page - 1) * per_page
-            query = base_query.offset(offset).limit(per_page)
-
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=[Question.id],
+            default_count_mode="window",
+        )
 
         items: List[QuestionDTO] = [
             question_orm_to_dto(row, populate_skill=populate_skill)
-            for row in rows
+            for row in paged.rows
         ]
 
         return PaginationDTO[QuestionDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
 
     async def get_by_id(
@@ -100,17 +176,15 @@ class QuestionRepository(IQuestionRepository):
         question_id: int,
         dto: QuestionDTO,
     ) -> Optional[QuestionDTO]:
-        query = select(Question).where(Question.id == question_id)
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
+        row = await update_returning(
+            self._session,
+            question_dto_to_orm(dto),
+            Question.id == question_id,
+        )
 
         if not row:
             return None
 
-        row = question_dto_to_orm(dto, row)
-        await self._session.flush()
-        await self._session.refresh(row)
-
         return question_orm_to_dto(row)
 
     async def delete(self, question_id: int) -> bool:
@@ -142,14 +216,61 @@ class UserQuestionRepository(IUserQuestionRepository):
         return query
 
     async def add(self, dto: UserQuestionDTO) -> Optional[UserQuestionDTO]:
-        row = user_question_dto_to_orm(dto)
-
-        self._session.add(row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, user_question_dto_to_orm(dto))
+
+        query = pg_insert(UserQuestionProgress).values(
+            user_id=row.user_id,
+            question_id=row.question_id,
+            skill_id=select(Question.skill_id).where(Question.id == row.question_id).scalar_subquery(),
+            last_status=row.status,
+            last_seen_at=func.now(),
+            attempts=1,
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[UserQuestionProgress.user_id, UserQuestionProgress.question_id],
+            set_={
+                "last_status": query.excluded.last_status,
+                "last_seen_at": query.excluded.last_seen_at,
+                "attempts": UserQuestionProgress.attempts + 1,
+            },
+        )
+        await self._session.execute(query)
 
         return user_question_orm_to_dto(row)
 
+    async def _refresh_progress(self, user_id: int, question_id: int) -> None:
+        """Rebuild the progress row of one question from its remaining answers."""
+        await self._session.execute(
+            delete(UserQuestionProgress).where(
+                UserQuestionProgress.user_id == user_id,
+                UserQuestionProgress.question_id == question_id,
+            )
+        )
+
+        latest = (
+            select(
+                UserQuestion.user_id,
+                UserQuestion.question_id,
+                Question.skill_id,
+                UserQuestion.status,
+                UserQuestion.created_at,
+                func.count().over(),
+            )
+            .join(Question, Question.id == UserQuestion.question_id)
+            .where(
+                UserQuestion.user_id == user_id,
+                UserQuestion.question_id == question_id,
+            )
+            .order_by(UserQuestion.id.desc())
+            .limit(1)
+        )
+        await self._session.execute(
+            pg_insert(UserQuestionProgress).from_select(
+                ["user_id", "question_id", "skill_id", "last_status", "last_seen_at", "attempts"],
+                latest,
+            )
+        )
+
     async def get(
         self,
         pagination: Optional[PaginationDTO[UserQuestionDTO]] = None,
@@ -170,33 +291,25 @@ class UserQuestionRepository(IUserQuestionRepository):
         if module_id is not None:
             base_query = base_query.join(Question).where(Question.skill_id == module_id)
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
-        if pagination is None or pagination.per_page is None:
-            query = base_query
-            page = 1
-            per_page = total
-        else:
-            page = max(pagination.page or 1, 1)
-            per_page = max(pagination.per_page or 10, 1)
-            offset = (page - 1) * per_page
-            query = base_query.offset(offset).limit(per_page)
-
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=[UserQuestion.id],
+            default_count_mode="window",
+        )
 
         items: List[UserQuestionDTO] = [
             user_question_orm_to_dto(row, populate_question=populate_question)
-            for row in rows
+            for row in paged.rows
         ]
 
         return PaginationDTO[UserQuestionDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
 
     async def get_by_id(
@@ -214,16 +327,17 @@ class UserQuestionRepository(IUserQuestionRepository):
         user_question_id: int,
         dto: UserQuestionDTO,
     ) -> Optional[UserQuestionDTO]:
-        query = select(UserQuestion).where(UserQuestion.id == user_question_id)
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
+        row = await update_returning(
+            self._session,
+            user_question_dto_to_orm(dto),
+            UserQuestion.id == user_question_id,
+        )
 
         if not row:
             return None
 
-        row = user_question_dto_to_orm(dto, row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        if dto.status is not None:
+            await self._refresh_progress(row.user_id, row.question_id)
 
         return user_question_orm_to_dto(row)
 
@@ -236,12 +350,17 @@ class UserQuestionRepository(IUserQuestionRepository):
             return False
 
         await self._session.delete(row)
+        await self._session.flush()
+        await self._refresh_progress(row.user_id, row.question_id)
         return True
 
     async def delete_by_user(
         self,
         user_id: int,
     ) -> int:
+        await self._session.execute(
+            delete(UserQuestionProgress).where(UserQuestionProgress.user_id == user_id)
+        )
         result = await self._session.execute(
             delete(UserQuestion).where(UserQuestion.user_id == user_id)
         )
@@ -252,6 +371,12 @@ class UserQuestionRepository(IUserQuestionRepository):
         user_id: int,
         module_id: int,
     ) -> int:
+        await self._session.execute(
+            delete(UserQuestionProgress).where(
+                UserQuestionProgress.user_id == user_id,
+                UserQuestionProgress.skill_id == module_id,
+            )
+        )
         question_ids_subq = select(Question.id).where(Question.skill_id == module_id)
         result = await self._session.execute(
             delete(UserQuestion).where(
@@ -260,3 +385,79 @@ class UserQuestionRepository(IUserQuestionRepository):
             )
         )
         return int(result.rowcount or 0)
+
+    async def get_module_progress(
+        self,
+        user_id: int,
+        module_ids: List[int],
+    ) -> Dict[int, ModuleProgressDTO]:
+        """Question and latest-answer counts per module, from ``user_question_progress``."""
+        if not module_ids:
+            return {}
+
+        query = (
+            self._progress_query(Question.skill_id)
+            .select_from(Question)
+            .outerjoin(UserQuestionProgress, self._progress_join(user_id))
+            .where(Question.skill_id == any_(bindparam("module_ids", list(module_ids), type_=ARRAY(Integer))))
+            .group_by(Question.skill_id)
+        )
+        result = await self._session.execute(query)
+
+        progress = {module_id: ModuleProgressDTO(module_id=module_id) for module_id in module_ids}
+        progress.update(self._progress_rows(result.all()))
+        return progress
+
+    async def get_learning_progress(
+        self,
+        user_id: int,
+    ) -> Dict[int, ModuleProgressDTO]:
+        """Counts for every module the user learns (``to_learn``), in one query."""
+        query = (
+            self._progress_query(UserSkill.skill_id)
+            .select_from(UserSkill)
+            .outerjoin(Question, Question.skill_id == UserSkill.skill_id)
+            .outerjoin(UserQuestionProgress, self._progress_join(user_id))
+            .where(
+                UserSkill.user_id == user_id,
+                UserSkill.to_learn.is_(True),
+            )
+            .group_by(UserSkill.skill_id)
+        )
+        result = await self._session.execute(query)
+        return self._progress_rows(result.all())
+
+    @staticmethod
+    def _progress_query(module_id_column):
+        is_correct = UserQuestionProgress.last_status == QuestionStatus.SATISFACTORY
+        is_incorrect = UserQuestionProgress.last_status == QuestionStatus.UNSATISFACTORY
+
+        # Counting questions and progress rows over the same join gives the totals
+        # and the latest-status split per module in a single pass
+        return select(
+            module_id_column,
+            func.count(Question.id),
+            func.count(UserQuestionProgress.question_id),
+            func.count(UserQuestionProgress.question_id).filter(is_correct),
+            func.count(UserQuestionProgress.question_id).filter(is_incorrect),
+        )
+
+    @staticmethod
+    def _progress_join(user_id: int):
+        return and_(
+            UserQuestionProgress.user_id == user_id,
+            UserQuestionProgress.question_id == Question.id,
+        )
+
+    @staticmethod
+    def _progress_rows(rows) -> Dict[int, ModuleProgressDTO]:
+        return {
+            module_id: ModuleProgressDTO(
+                module_id=module_id,
+                total_questions=int(total),
+                met_questions=int(met),
+                correct_answers=int(correct),
+                incorrect_answers=int(incorrect),
+            )
+            for module_id, total, met, correct, incorrect in rows
+        }
@@ -0,0 +1,79 @@
+from typing import List
+
+from src.application.questions.dtos import QuestionDTO
+from src.application.questions.interfaces import IQuestionRepository, IQuestionSeedService
+from src.application.skills.dtos import UserSkillDTO
+from src.domain.base_dto import PaginationDTO
+from src.domain.interfaces import IUoW, IOpenAIService
+from src.domain.value_objects import ChatGPTModel
+from src.infrastructure.jobs.queue import RedisJobQueue
+
+QUESTION_SEED_QUEUE = "question_seed"
+
+
+class QuestionSeedService(IQuestionSeedService):
+    """Hands question generation for new modules over to the background worker."""
+
+    def __init__(self, queue: RedisJobQueue):
+        self._queue = queue
+
+    async def enqueue(self, modules: List[UserSkillDTO]) -> List[int]:
+        enqueued: List[int] = []
+        for module in modules:
+            if module.skill_id is None or not module.skill or not module.skill.name:
+                continue
+
+            # One job per module: the module id is the idempotency key.
+            created = await self._queue.enqueue(
+                job_id=str(module.skill_id),
+                payload={"module_id": module.skill_id, "skill_name": module.skill.name},
+            )
+            if created:
+                enqueued.append(module.skill_id)
+
+        return enqueued
+
+    async def get_pending_module_ids(self, module_ids: List[int]) -> List[int]:
+        statuses = await self._queue.get_statuses([str(module_id) for module_id in module_ids])
+        return [
+            module_id
+            for module_id in module_ids
+            if statuses.get(str(module_id)) in ("queued", "running")
+        ]
+
+
+class QuestionSeeder:
+    """Job handler that generates and stores the theoretical questions of one module."""
+
+    def __init__(
+        self,
+        question_repository: IQuestionRepository,
+        openai_service: IOpenAIService,
+        uow: IUoW,
+    ):
+        self._question_repository = question_repository
+        self._openai_service = openai_service
+        self._uow = uow
+
+    async def seed(self, module_id: int, skill_name: str) -> None:
+        async with self._uow:
+            existing_questions = await self._question_repository.get(
+                pagination=PaginationDTO[QuestionDTO](per_page=1, include_total=False),
+                module_id=module_id,
+            )
+        if existing_questions.items:
+            return
+
+        # No transaction is held while waiting on OpenAI.
+        ai_questions = await self._openai_service.get_skill_theoretical_questions(
+            skill_name=skill_name,
+            model=ChatGPTModel.GPT_4_1,
+        )
+        if not ai_questions:
+            raise ValueError(f"No questions generated for module {module_id}")
+
+        for q in ai_questions:
+            q.skill_id = module_id
+
+        async with self._uow:
+            await self._question_repository.add_many(ai_questions)
@@ -5,6 +5,7 @@ from fastapi import HTTPException, status as s
 from src.application.skills.dtos import SkillDTO, UserSkillDTO
 from src.application.skills.interfaces import ISkillController, ISkillSearchService, ISkillRepository, IUserSkillRepository
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import InvalidCursorError
 from src.domain.interfaces import IUoW
 
 
@@ -22,17 +23,12 @@ class SkillController(ISkillController):
         self._skill_search_service = skill_search_service
 
     async def skill_autocomplete(self, pagination: PaginationDTO[SkillDTO], q: Optional[str] = None) -> PaginationDTO[SkillDTO]:
-        count = await self._skill_search_service.count()
-
-        if count < 1:
-            skills = await self._skill_repository.get()
-            skills = skills.items
-
-            await self._skill_search_service.bulk_index(skills)
-
         res = await self._skill_search_service.search(pagination=pagination, name=q)
         return res
 
+    async def skill_suggest(self, q: str, size: int = 10) -> List[SkillDTO]:
+        return await self._skill_search_service.suggest(prefix=q, size=size)
+
     async def get_by_id(self, skill_id: int) -> Optional[SkillDTO]:
         res = await self._skill_repository.get_by_id(skill_id)
 
@@ -60,9 +56,12 @@ class SkillController(ISkillController):
         pagination: Optional[PaginationDTO[UserSkillDTO]] = None,
         populate_skill: bool = False,
     ) -> PaginationDTO[UserSkillDTO]:
-        return await self._user_skill_repository.get_by_user_id(
-            user_id=user_id,
-            pagination=pagination,
-            populate_skill=populate_skill,
-            to_learn=False,
-        )
+        try:
+            return await self._user_skill_repository.get_by_user_id(
+                user_id=user_id,
+                pagination=pagination,
+                populate_skill=populate_skill,
+                to_learn=False,
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=s.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
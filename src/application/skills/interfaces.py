@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List, Tuple
 
 from src.application.skills.dtos import SkillDTO, UserSkillDTO
 from src.domain.base_dto import PaginationDTO
@@ -9,6 +9,9 @@ class ISkillRepository(ABC):
     @abstractmethod
     async def get_by_id(self, skill_id: int) -> Optional[SkillDTO]: ...
 
+    @abstractmethod
+    async def get_by_ids(self, skill_ids: List[int]) -> Dict[int, SkillDTO]: ...
+
     @abstractmethod
     async def get_by_name(self, name: str) -> Optional[SkillDTO]: ...
 
@@ -21,6 +24,12 @@ class ISkillRepository(ABC):
     @abstractmethod
     async def add(self, dto: SkillDTO) -> Optional[SkillDTO]: ...
 
+    @abstractmethod
+    async def get_or_create_many(
+        self,
+        names: List[str],
+    ) -> Tuple[Dict[str, SkillDTO], List[SkillDTO]]: ...
+
     @abstractmethod
     async def update(
         self,
@@ -35,6 +44,9 @@ class ISkillController(ABC):
     @abstractmethod
     async def skill_autocomplete(self, pagination: PaginationDTO[SkillDTO], q: Optional[str] = None) -> PaginationDTO[SkillDTO]:  ...
 
+    @abstractmethod
+    async def skill_suggest(self, q: str, size: int = 10) -> List[SkillDTO]: ...
+
     @abstractmethod
     async def get_by_id(self, skill_id: int) -> Optional[SkillDTO]: ...
 
@@ -72,6 +84,9 @@ class IUserSkillRepository(ABC):
     @abstractmethod
     async def add(self, dto: UserSkillDTO) -> Optional[UserSkillDTO]: ...
 
+    @abstractmethod
+    async def add_many(self, dtos: List[UserSkillDTO]) -> List[UserSkillDTO]: ...
+
     @abstractmethod
     async def update(
         self,
@@ -97,11 +112,21 @@ class IUserSkillRepository(ABC):
 class ISkillSearchService(ABC):
 
     @abstractmethod
-    async def create_index_if_not_exists(self) -> None: ...
+    async def create_index_if_not_exists(self) -> bool: ...
+
+    @abstractmethod
+    async def is_index_current(self) -> bool: ...
 
     @abstractmethod
     async def delete_index(self) -> bool: ...
 
+    @abstractmethod
+    async def rebuild(
+        self,
+        batches: AsyncIterator[List[SkillDTO]],
+        catch_up: Optional[Callable[[int], AsyncIterator[List[SkillDTO]]]] = None,
+    ) -> int: ...
+
     @abstractmethod
     async def count(self) -> int: ...
 
@@ -120,3 +145,6 @@ class ISkillSearchService(ABC):
         name: Optional[str] = None,
         pagination: Optional[PaginationDTO[SkillDTO]] = None,
     ) -> PaginationDTO[SkillDTO]: ...
+
+    @abstractmethod
+    async def suggest(self, prefix: str, size: int = 10) -> List[SkillDTO]: ...
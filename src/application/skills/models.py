@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import Integer, String, Boolean, ForeignKey
+from sqlalchemy import Integer, String, Boolean, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.dbs.postgre import Base
@@ -9,6 +9,10 @@ from src.domain.base_model import TimestampMixin
 
 class Skill(Base, TimestampMixin):
     __tablename__ = "skills"
+    __table_args__ = (
+        # Skills are matched case-insensitively; this is the conflict target for bulk upserts.
+        Index("ux_skills_name_lower", text("lower(name)"), unique=True),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
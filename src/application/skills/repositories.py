@@ -1,6 +1,7 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
-from sqlalchemy import select, func, desc, delete
+from sqlalchemy import select, func, delete, any_, bindparam, Integer, literal_column, text
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,6 +15,8 @@ from src.application.skills.mappers import (
     user_skill_dto_to_orm,
 )
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import paginate
+from src.infrastructure.dbs.returning import insert_returning, insert_many_returning, update_returning
 
 
 class SkillRepository(ISkillRepository):
@@ -33,6 +36,17 @@ class SkillRepository(ISkillRepository):
         query = self._base_query().where(Skill.id == skill_id)
         return await self._fetch_one(query)
 
+    async def get_by_ids(self, skill_ids: List[int]) -> Dict[int, SkillDTO]:
+        if not skill_ids:
+            return {}
+
+        # One array parameter keeps the statement text the same for any number of ids.
+        query = self._base_query().where(
+            Skill.id == any_(bindparam("skill_ids", list(skill_ids), type_=ARRAY(Integer)))
+        )
+        result = await self._session.execute(query)
+        return {row.id: skill_orm_to_dto(row) for row in result.scalars().all()}
+
     async def get_by_name(self, name: str) -> Optional[SkillDTO]:
         query = self._base_query().where(
             func.lower(Skill.name) == func.lower(name)
@@ -51,44 +65,68 @@ class SkillRepository(ISkillRepository):
                 Skill.name.ilike(f"%{name}%")
             )
 
-        count_query = select(func.count()).select_from(
-            base_query.subquery()
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=[Skill.id],
         )
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
-        if pagination is None or pagination.per_page is None:
-            query = base_query
-            page = 1
-            per_page = total
-        else:
-            page = max(pagination.page or 1, 1)
-            per_page = max(pagination.per_page or 10, 1)
-            offset = (page - 1) * per_page
-            query = base_query.offset(offset).limit(per_page)
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
 
         items: List[SkillDTO] = [
-            skill_orm_to_dto(row) for row in rows
+            skill_orm_to_dto(row) for row in paged.rows
         ]
 
         return PaginationDTO[SkillDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
 
     async def add(self, dto: SkillDTO) -> Optional[SkillDTO]:
-        row = skill_dto_to_orm(dto)
+        row = await insert_returning(self._session, skill_dto_to_orm(dto))
 
-        self._session.add(row)
+        return skill_orm_to_dto(row)
 
-        await self._session.flush()
-        await self._session.refresh(row)
+    async def get_or_create_many(
+        self,
+        names: List[str],
+    ) -> Tuple[Dict[str, SkillDTO], List[SkillDTO]]:
+        unique_names: Dict[str, str] = {}
+        for name in names:
+            name = (name or "").strip()
+            if name:
+                unique_names.setdefault(name.lower(), name)
+
+        if not unique_names:
+            return {}, []
+
+        # Sorted so that concurrent upserts lock conflicting rows in the same order.
+        query = pg_insert(Skill).values(
+            [{"name": unique_names[key]} for key in sorted(unique_names)]
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[text("lower(name)")],
+            # No-op update so that existing rows are returned too.
+            set_={"name": Skill.name},
+        ).returning(
+            Skill.id,
+            Skill.name,
+            literal_column("xmax = 0").label("created"),
+        )
 
-        return skill_orm_to_dto(row)
+        result = await self._session.execute(query)
+
+        skills: Dict[str, SkillDTO] = {}
+        created: List[SkillDTO] = []
+        for row in result.all():
+            dto = SkillDTO(id=row.id, name=row.name)
+            skills[row.name.lower()] = dto
+            if row.created:
+                created.append(dto)
+
+        return skills, created
 
     async def update(
         self,
@@ -96,20 +134,15 @@ class SkillRepository(ISkillRepository):
         dto: SkillDTO,
     ) -> Optional[SkillDTO]:
 
-        query = self._base_query().where(
-            Skill.id == skill_id
+        row = await update_returning(
+            self._session,
+            skill_dto_to_orm(dto),
+            Skill.id == skill_id,
         )
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
 
         if not row:
             return None
 
-        row = skill_dto_to_orm(dto, row)
-
-        await self._session.flush()
-        await self._session.refresh(row)
-
         return skill_orm_to_dto(row)
 
     async def delete(self, skill_id: int) -> bool:
@@ -150,39 +183,41 @@ class UserSkillRepository(IUserSkillRepository):
     ) -> PaginationDTO[UserSkillDTO]:
 
         base_query = self._base_query(populate_skill).where(UserSkill.user_id == user_id)
+        sort_keys = [UserSkill.skill_id]
+        descending = False
 
         if to_learn is not None:
             base_query = base_query.where(UserSkill.to_learn == to_learn)
             if to_learn is True:
-                base_query = base_query.order_by(desc(UserSkill.match_percentage))
-
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
-        if pagination is None or pagination.per_page is None:
-            query = base_query
-            page = 1
-            per_page = total
-        else:
-            page = max(pagination.page or 1, 1)
-            per_page = max(pagination.per_page or 10, 1)
-            offset = (page - 1) * per_page
-            query = base_query.offset(offset).limit(per_page)
-
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
+                # Modules go by relevance; missing percentages sort last.
+                sort_keys = [
+                    (
+                        func.coalesce(UserSkill.match_percentage, -1.0),
+                        lambda row: row.match_percentage if row.match_percentage is not None else -1.0,
+                    ),
+                    UserSkill.skill_id,
+                ]
+                descending = True
+
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=sort_keys,
+            descending=descending,
+        )
 
         items: List[UserSkillDTO] = [
             user_skill_orm_to_dto(row, populate_skill=populate_skill)
-            for row in rows
+            for row in paged.rows
         ]
 
         return PaginationDTO[UserSkillDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
 
     async def get_by_user_and_skill(
@@ -200,14 +235,18 @@ class UserSkillRepository(IUserSkillRepository):
         return user_skill_orm_to_dto(row, populate_skill=populate_skill) if row else None
 
     async def add(self, dto: UserSkillDTO) -> Optional[UserSkillDTO]:
-        row = user_skill_dto_to_orm(dto)
-
-        self._session.add(row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, user_skill_dto_to_orm(dto))
 
         return user_skill_orm_to_dto(row)
 
+    async def add_many(self, dtos: List[UserSkillDTO]) -> List[UserSkillDTO]:
+        rows = await insert_many_returning(
+            self._session,
+            [user_skill_dto_to_orm(dto) for dto in dtos],
+        )
+
+        return [user_skill_orm_to_dto(row) for row in rows]
+
     async def update(
         self,
         user_id: int,
@@ -215,22 +254,16 @@ class UserSkillRepository(IUserSkillRepository):
         dto: UserSkillDTO,
     ) -> Optional[UserSkillDTO]:
 
-        query = select(UserSkill).where(
+        row = await update_returning(
+            self._session,
+            user_skill_dto_to_orm(dto),
             UserSkill.user_id == user_id,
             UserSkill.skill_id == skill_id,
         )
 
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
-
         if not row:
             return None
 
-        row = user_skill_dto_to_orm(dto, row)
-
-        await self._session.flush()
-        await self._session.refresh(row)
-
         return user_skill_orm_to_dto(row)
 
     async def delete(
@@ -1,75 +1,116 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List
 
 from elasticsearch import AsyncElasticsearch
 from elasticsearch.helpers import async_bulk
 
 from src.application.skills.dtos import SkillDTO
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.integrations.es_index import AliasedIndex, completion_inputs
 
 
 class SkillSearchService:
 
     INDEX_NAME = "skills_index"
 
-    def __init__(self, es_client: AsyncElasticsearch):
-        self._es = es_client
-
-    # -----------------------------
-    # INDEX CREATION
-    # -----------------------------
-    async def create_index_if_not_exists(self) -> None:
-        exists = await self._es.indices.exists(index=self.INDEX_NAME)
-
-        if exists:
-            return
+    # Bump when the settings or mappings change; the app rebuilds outdated indices on startup
+    INDEX_VERSION = 3
 
-        await self._es.indices.create(
-            index=self.INDEX_NAME,
-            settings={
-                "index": {
-                    "max_ngram_diff": 18  # max_gram - min_gram
-                },
-                "analysis": {
-                    "analyzer": {
-                        "autocomplete_analyzer": {
-                            "tokenizer": "ngram_tokenizer",
-                            "filter": ["lowercase"]
-                        }
-                    },
-                    "tokenizer": {
-                        "ngram_tokenizer": {
-                            "type": "ngram",
-                            "min_gram": 2,
-                            "max_gram": 20,
-                            "token_chars": ["letter", "digit"]
-                        }
-                    }
+    INDEX_SETTINGS = {
+        "analysis": {
+            "filter": {
+                "autocomplete_edge_ngram": {
+                    "type": "edge_ngram",
+                    "min_gram": 1,
+                    "max_gram": 20
                 }
             },
-            mappings={
-                "properties": {
-                    "name": {
-                        "type": "text",
-                        "analyzer": "autocomplete_analyzer",
-                        "search_analyzer": "standard"
-                    }
+            "analyzer": {
+                # Indexes word prefixes only ("pyt" for "python"), not every infix
+                "autocomplete_analyzer": {
+                    "tokenizer": "standard",
+                    "filter": ["lowercase", "asciifolding", "autocomplete_edge_ngram"]
+                },
+                "autocomplete_search_analyzer": {
+                    "tokenizer": "standard",
+                    "filter": ["lowercase", "asciifolding"]
                 }
             }
+        }
+    }
+
+    INDEX_MAPPINGS = {
+        "properties": {
+            "id": {
+                "type": "integer"
+            },
+            "name": {
+                "type": "text",
+                "analyzer": "autocomplete_analyzer",
+                "search_analyzer": "autocomplete_search_analyzer"
+            },
+            "suggest": {
+                "type": "completion",
+                "analyzer": "autocomplete_search_analyzer"
+            }
+        }
+    }
+
+    def __init__(self, es_client: AsyncElasticsearch):
+        self._es = es_client
+        # INDEX_NAME is an alias over the current physical index
+        self._index = AliasedIndex(
+            es_client,
+            alias=self.INDEX_NAME,
+            settings=self.INDEX_SETTINGS,
+            mappings=self.INDEX_MAPPINGS,
+            version=self.INDEX_VERSION,
         )
 
-    async def delete_index(self) -> bool:
-        try:
-            exists = await self._es.indices.exists(index=self.INDEX_NAME)
+    @staticmethod
+    def _document(skill_id: int, name: str) -> Dict[str, Any]:
+        return {
+            "id": skill_id,
+            "name": name,
+            # Each word starts a completion input, so "learn" also suggests "Machine Learning"
+            "suggest": {"input": completion_inputs(name)},
+        }
 
-            if not exists:
-                return False
+    # -----------------------------
+    # INDEX CREATION
+    # -----------------------------
+    async def create_index_if_not_exists(self) -> bool:
+        return await self._index.ensure()
 
-            await self._es.indices.delete(index=self.INDEX_NAME)
-            return True
+    async def is_index_current(self) -> bool:
+        return await self._index.is_current()
 
+    async def delete_index(self) -> bool:
+        try:
+            return await self._index.delete()
         except Exception:
             return False
 
+    # -----------------------------
+    # REBUILD
+    # -----------------------------
+    async def rebuild(
+            self,
+            batches: AsyncIterator[List[SkillDTO]],
+            catch_up: Optional[Callable[[int], AsyncIterator[List[SkillDTO]]]] = None,
+    ) -> int:
+        async def documents(source: AsyncIterator[List[SkillDTO]]):
+            async for skills in source:
+                yield [
+                    self._document(skill.id, skill.name)
+                    for skill in skills
+                    if skill.id is not None and skill.name
+                ]
+
+        return await self._index.rebuild(
+            documents(batches),
+            catch_up=(lambda max_id: documents(catch_up(max_id))) if catch_up is not None else None,
+        )
+
     # -----------------------------
     # COUNT
     # -----------------------------
@@ -91,10 +132,7 @@ class SkillSearchService:
             {
                 "_index": self.INDEX_NAME,
                 "_id": skill.id,
-                "_source": {
-                    "id": skill.id,
-                    "name": skill.name,
-                },
+                "_source": self._document(skill.id, skill.name),
             }
             for skill in skills
             if skill.id is not None and skill.name
@@ -112,10 +150,7 @@ class SkillSearchService:
         await self._es.index(
             index=self.INDEX_NAME,
             id=skill_id,
-            document={
-                "id": skill_id,
-                "name": name,
-            }
+            document=self._document(skill_id, name),
         )
 
     # -----------------------------
@@ -150,18 +185,13 @@ class SkillSearchService:
         }
 
         if name:
+            # Every query word must prefix a word of the name
             query_body["query"] = {
-                "bool": {
-                    "should": [
-                        {
-                            "match": {
-                                "name": {
-                                    "query": name,
-                                    "fuzziness": "AUTO",
-                                }
-                            }
-                        }
-                    ]
+                "match": {
+                    "name": {
+                        "query": name,
+                        "operator": "and",
+                    }
                 }
             }
 
@@ -187,3 +217,34 @@ class SkillSearchService:
             total=total,
             items=items,
         )
+
+    # -----------------------------
+    # SUGGEST
+    # -----------------------------
+    async def suggest(self, prefix: str, size: int = 10) -> List[SkillDTO]:
+        prefix = prefix.strip()
+        if not prefix:
+            return []
+
+        response = await self._es.search(
+            index=self.INDEX_NAME,
+            source=["id", "name"],
+            suggest={
+                "name_suggest": {
+                    "prefix": prefix,
+                    "completion": {
+                        "field": "suggest",
+                        # No skip_duplicates: it drops different documents sharing an input
+                        "size": min(max(size, 1), 100),
+                    },
+                }
+            },
+        )
+
+        # A skill matching through several of its inputs is returned once
+        items: Dict[int, SkillDTO] = {}
+        for option in response["suggest"]["name_suggest"][0]["options"]:
+            source = option["_source"]
+            items.setdefault(source["id"], SkillDTO(id=source["id"], name=source["name"]))
+
+        return list(items.values())
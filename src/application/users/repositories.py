@@ -9,6 +9,7 @@ from src.application.users.interfaces import IUserRepository
 from src.application.users.models import User
 from src.application.skills.models import UserSkill
 from src.application.users.mappers import user_orm_to_dto, user_dto_to_orm
+from src.infrastructure.dbs.returning import insert_returning, update_returning
 
 
 class UserRepository(IUserRepository):
@@ -107,28 +108,20 @@ class UserRepository(IUserRepository):
         )
 
     async def add(self, dto: UserDTO) -> Optional[UserDTO]:
-        row = user_dto_to_orm(dto)
-
-        self._session.add(row)
-
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, user_dto_to_orm(dto))
 
         return user_orm_to_dto(row)
 
     async def update(self, user_id: int, dto: UserDTO) -> Optional[UserDTO]:
-        query = self._base_query().where(User.id == user_id)
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
+        row = await update_returning(
+            self._session,
+            user_dto_to_orm(dto),
+            User.id == user_id,
+        )
 
         if not row:
             return None
 
-        row = user_dto_to_orm(dto, row)
-
-        await self._session.flush()
-        await self._session.refresh(row)
-
         return user_orm_to_dto(row)
 
     async def delete(self, user_id: int) -> bool:
@@ -65,8 +65,9 @@ class UserController(IUserController):
         # Load selected skills and prepare list for AI
         skill_name_list = []
         unique_skill_ids = list(dict.fromkeys(skill_ids))
+        skills_by_id = await self._skill_repository.get_by_ids(unique_skill_ids)
         for skill_id in unique_skill_ids:
-            skill = await self._skill_repository.get_by_id(skill_id)
+            skill = skills_by_id.get(skill_id)
             if not skill:
                 raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail=f"Skill {skill_id} not found")
             if skill.name:
@@ -212,8 +213,9 @@ class UserController(IUserController):
         if skill_ids is not None:
             unique_skill_ids = list(dict.fromkeys(skill_ids))
             skill_name_list = []
+            skills_by_id = await self._skill_repository.get_by_ids(unique_skill_ids)
             for skill_id in unique_skill_ids:
-                skill = await self._skill_repository.get_by_id(skill_id)
+                skill = skills_by_id.get(skill_id)
                 if not skill:
                     raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail=f"Skill {skill_id} not found")
                 if skill.name:
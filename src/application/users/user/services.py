@@ -1,21 +1,24 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from fastapi import HTTPException, status as s
 
 from src.application.users.dtos import UserDTO
 from src.application.users.interfaces import IUserRepository
 from src.application.locations.interfaces import ICityRepository
+from src.application.modules.interfaces import IProgressStatisticsCache
 from src.application.directions.interfaces import IDirectionRepository
 from src.application.questions.interfaces import IUserQuestionRepository
-from src.application.interview.interfaces import IInterviewSessionRepository, IInterviewQuestionRepository
+from src.application.interview.interfaces import (
+    IInterviewSessionRepository,
+    IInterviewQuestionRepository,
+    IInterviewStateCache,
+)
 from src.application.skills.dtos import SkillDTO, UserSkillDTO
 from src.application.skills.interfaces import ISkillRepository, IUserSkillRepository, ISkillSearchService
-from src.application.questions.dtos import QuestionDTO
-from src.application.questions.interfaces import IQuestionRepository
+from src.application.questions.interfaces import IQuestionRepository, IQuestionSeedService
 from src.application.directions.dtos import SalaryDTO, DirectionDTO
 from src.application.directions.interfaces import ISalaryRepository
 from src.application.vacancies.interfaces import IUserVacancyRepository
-from src.domain.base_dto import PaginationDTO
 from src.domain.interfaces import IUoW, IOpenAIService
 from src.domain.value_objects import ChatGPTModel
 from src.application.users.user.interfaces import IUserService
@@ -40,6 +43,9 @@ class UserService(IUserService):
         openai_service: IOpenAIService,
         skill_search_service: ISkillSearchService,
         airflow_client: AirflowClient,
+        question_seed_service: IQuestionSeedService,
+        interview_state_cache: IInterviewStateCache,
+        statistics_cache: IProgressStatisticsCache,
     ):
         self._uow = uow
         self._user_repository = user_repository
@@ -56,6 +62,9 @@ class UserService(IUserService):
         self._openai_service = openai_service
         self._skill_search_service = skill_search_service
         self._airflow_client = airflow_client
+        self._question_seed_service = question_seed_service
+        self._interview_state_cache = interview_state_cache
+        self._statistics_cache = statistics_cache
 
     async def get_theoretical_skills(
         self,
@@ -82,6 +91,7 @@ class UserService(IUserService):
     ) -> UserDTO:
         skills_list: List[UserSkillDTO] = []
         modules_list: List[UserSkillDTO] = []
+        created_skills: List[SkillDTO] = []
 
         async with self._uow:
             user = await self._update_user_profile(
@@ -106,13 +116,20 @@ class UserService(IUserService):
                 unique_skill_ids=unique_skill_ids,
             )
 
-            modules_list = await self._attach_ai_skills_as_modules(
+            modules_list, created_skills = await self._attach_ai_skills_as_modules(
                 user_id=user_id,
                 ai_skills=ai_skills,
                 existing_skill_names=skill_name_list,
                 existing_skill_ids=unique_skill_ids,
             )
 
+        # Indexed after commit: the autocomplete index reloads from Postgres on invalidation
+        await self._index_created_skills(created_skills)
+
+        # Questions are generated by the background worker once the modules are committed.
+        await self._question_seed_service.enqueue(modules_list)
+        await self._statistics_cache.delete_for_user(user_id)
+
         user.name = name
         user.city_id = city_id
         user.direction_id = direction_id
@@ -128,21 +145,29 @@ class UserService(IUserService):
         existing_skill_names: List[str],
         existing_skill_ids: List[int],
     ) -> List[UserSkillDTO]:
-        return await self._attach_ai_skills_as_modules(
-            user_id=user_id,
-            ai_skills=ai_skills,
-            existing_skill_names=existing_skill_names,
-            existing_skill_ids=existing_skill_ids,
-        )
+        async with self._uow:
+            modules_list, created_skills = await self._attach_ai_skills_as_modules(
+                user_id=user_id,
+                ai_skills=ai_skills,
+                existing_skill_names=existing_skill_names,
+                existing_skill_ids=existing_skill_ids,
+            )
+
+        await self._index_created_skills(created_skills)
+        return modules_list
 
     async def seed_questions_if_needed(
         self,
         module_id: int,
         canonical_name: str,
     ) -> None:
-        await self._seed_questions_if_needed(
-            module_id=module_id,
-            canonical_name=canonical_name,
+        await self._question_seed_service.enqueue(
+            [
+                UserSkillDTO(
+                    skill_id=module_id,
+                    skill=SkillDTO(id=module_id, name=canonical_name),
+                )
+            ]
         )
 
     async def update_profile(
@@ -164,8 +189,9 @@ class UserService(IUserService):
 
         if unique_skill_ids is not None and skill_name_list is None:
             skill_name_list = []
+            skills_by_id = await self._skill_repository.get_by_ids(unique_skill_ids)
             for skill_id in unique_skill_ids:
-                skill = await self._skill_repository.get_by_id(skill_id)
+                skill = skills_by_id.get(skill_id)
                 if not skill:
                     raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail=f"Skill {skill_id} not found")
                 if skill.name:
@@ -184,8 +210,9 @@ class UserService(IUserService):
         if unique_skill_ids is None and direction_changed:
             unique_skill_ids = list(existing_base_ids)
             skill_name_list = []
+            skills_by_id = await self._skill_repository.get_by_ids(unique_skill_ids)
             for skill_id in unique_skill_ids:
-                skill = await self._skill_repository.get_by_id(skill_id)
+                skill = skills_by_id.get(skill_id)
                 if not skill:
                     raise HTTPException(status_code=s.HTTP_404_NOT_FOUND, detail=f"Skill {skill_id} not found")
                 if skill.name:
@@ -222,8 +249,9 @@ class UserService(IUserService):
             added_base_ids = new_ids_set - existing_base_ids
 
             if removed_base_ids and effective_direction is not None:
+                removed_skills = await self._skill_repository.get_by_ids(list(removed_base_ids))
                 for skill_id in removed_base_ids:
-                    skill = await self._skill_repository.get_by_id(skill_id)
+                    skill = removed_skills.get(skill_id)
                     if not skill or not skill.name:
                         continue
 
@@ -255,6 +283,8 @@ class UserService(IUserService):
         elif removed_to_module:
             ai_skills = removed_to_module
 
+        new_modules: List[UserSkillDTO] = []
+        created_skills: List[SkillDTO] = []
         effective_city_id = city_id if city_id is not None else user.city_id
         effective_direction_id = direction_id if direction_id is not None else user.direction_id
 
@@ -310,7 +340,7 @@ class UserService(IUserService):
             if ai_skills and effective_direction is not None:
                 attach_skill_names = skill_name_list or []
                 attach_skill_ids = unique_skill_ids or list(existing_base_ids)
-                await self.attach_ai_skills_as_modules(
+                new_modules, created_skills = await self._attach_ai_skills_as_modules(
                     user_id=user.id,
                     ai_skills=ai_skills,
                     existing_skill_names=attach_skill_names,
@@ -374,6 +404,18 @@ class UserService(IUserService):
             if should_refresh_vacancies:
                 await self._user_vacancy_repository.delete_by_user(user_id=user.id)
 
+        await self._index_created_skills(created_skills)
+
+        if direction_changed:
+            # The user's interview sessions were deleted above
+            await self._interview_state_cache.delete_for_user(user.id)
+
+        if direction_changed or unique_skill_ids is not None or new_modules:
+            # Modules or answers changed, so the cached progress statistics are stale
+            await self._statistics_cache.delete_for_user(user.id)
+
+        await self._question_seed_service.enqueue(new_modules)
+
         if should_refresh_vacancies:
             try:
                 await self._airflow_client.trigger_dag(
@@ -435,21 +477,16 @@ class UserService(IUserService):
         user_id: int,
         unique_skill_ids: List[int],
     ) -> List[UserSkillDTO]:
-        skills_list: List[UserSkillDTO] = []
-        for skill_id in unique_skill_ids:
-            await self._user_skill_repository.add(
-                UserSkillDTO(
-                    user_id=user_id,
-                    skill_id=skill_id,
-                )
-            )
-            skills_list.append(
-                UserSkillDTO(
-                    user_id=user_id,
-                    skill_id=skill_id,
-                    to_learn=False,
-                )
+        skills_list = [
+            UserSkillDTO(
+                user_id=user_id,
+                skill_id=skill_id,
+                to_learn=False,
             )
+            for skill_id in unique_skill_ids
+        ]
+        if skills_list:
+            await self._user_skill_repository.add_many(skills_list)
         return skills_list
 
     async def _attach_ai_skills_as_modules(
@@ -458,12 +495,16 @@ class UserService(IUserService):
         ai_skills: List[UserSkillDTO],
         existing_skill_names: List[str],
         existing_skill_ids: List[int],
-    ) -> List[UserSkillDTO]:
-        modules_list: List[UserSkillDTO] = []
+    ) -> Tuple[List[UserSkillDTO], List[SkillDTO]]:
+        """Attach ``ai_skills`` as modules; returns the modules and the skills created for them.
 
+        The created skills are not search-indexed here: callers index them after
+        their transaction commits.
+        """
         added_skill_ids = set(existing_skill_ids)
         added_skill_names = {name.strip().lower() for name in existing_skill_names}
 
+        candidates: List[UserSkillDTO] = []
         for ai_skill in ai_skills:
             if not ai_skill.skill or not ai_skill.skill.name:
                 continue
@@ -475,61 +516,45 @@ class UserService(IUserService):
             if skill_name.lower() in added_skill_names:
                 continue
 
-            skill_id, canonical_name = await self._get_or_create_skill(skill_name=skill_name)
+            added_skill_names.add(skill_name.lower())
+            candidates.append(ai_skill)
 
-            if not skill_id or skill_id in added_skill_ids:
+        if not candidates:
+            return [], []
+
+        skills_by_name, created_skills = await self._skill_repository.get_or_create_many(
+            [ai_skill.skill.name for ai_skill in candidates]
+        )
+
+        modules_list: List[UserSkillDTO] = []
+        skills_by_id: Dict[int, SkillDTO] = {}
+        for ai_skill in candidates:
+            skill = skills_by_name.get(ai_skill.skill.name.strip().lower())
+            if not skill or not skill.id or skill.id in added_skill_ids:
                 continue
+            skills_by_id[skill.id] = skill
 
-            await self._user_skill_repository.add(
-                UserSkillDTO(
-                    user_id=user_id,
-                    skill_id=skill_id,
-                    to_learn=True,
-                    match_percentage=ai_skill.match_percentage,
-                )
-            )
             modules_list.append(
                 UserSkillDTO(
                     user_id=user_id,
-                    skill_id=skill_id,
+                    skill_id=skill.id,
                     to_learn=True,
                     match_percentage=ai_skill.match_percentage,
                 )
             )
+            added_skill_ids.add(skill.id)
 
-            added_skill_ids.add(skill_id)
-            added_skill_names.add(skill_name.lower())
+        if not modules_list:
+            return [], created_skills
 
-            await self._seed_questions_if_needed(
-                module_id=skill_id,
-                canonical_name=canonical_name,
-            )
+        await self._user_skill_repository.add_many(modules_list)
 
-        return modules_list
+        # Carry the canonical skill so questions can be enqueued after commit.
+        for module in modules_list:
+            module.skill = skills_by_id[module.skill_id]
 
-    async def _get_or_create_skill(self, skill_name: str) -> tuple[Optional[int], str]:
-        existing_skill = await self._skill_repository.get_by_name(skill_name)
-        if existing_skill and existing_skill.name and existing_skill.name.lower() == skill_name.lower():
-            return existing_skill.id, existing_skill.name
-
-        created_skill = await self._skill_repository.add(SkillDTO(name=skill_name))
-        if not created_skill:
-            return None, skill_name
-        await self._skill_search_service.index(skill_id=created_skill.id, name=created_skill.name)
-        return created_skill.id, created_skill.name
-
-    async def _seed_questions_if_needed(self, module_id: int, canonical_name: str) -> None:
-        existing_questions = await self._question_repository.get(
-            pagination=PaginationDTO[QuestionDTO](per_page=1),
-            module_id=module_id,
-        )
-        if existing_questions.total != 0:
-            return
+        return modules_list, created_skills
 
-        ai_questions = await self._openai_service.get_skill_theoretical_questions(
-            skill_name=canonical_name,
-            model=ChatGPTModel.GPT_4_1,
-        )
-        for q in ai_questions:
-            q.skill_id = module_id
-            await self._question_repository.add(q)
+    async def _index_created_skills(self, created_skills: List[SkillDTO]) -> None:
+        if created_skills:
+            await self._skill_search_service.bulk_index(created_skills)
@@ -1,6 +1,6 @@
 from typing import Optional, List
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -20,6 +20,8 @@ from src.application.vacancies.mappers import (
     user_vacancy_dto_to_orm,
 )
 from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import paginate
+from src.infrastructure.dbs.returning import insert_returning, insert_many_returning, update_returning
 
 
 class VacancyRepository(IVacancyRepository):
@@ -49,10 +51,7 @@ class VacancyRepository(IVacancyRepository):
         return vacancy_orm_to_dto(row) if row else None
 
     async def add(self, dto: VacancyDTO) -> Optional[VacancyDTO]:
-        row = vacancy_dto_to_orm(dto)
-        self._session.add(row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, vacancy_dto_to_orm(dto))
         return vacancy_orm_to_dto(row)
 
     async def get_by_id(
@@ -97,42 +96,32 @@ class VacancyRepository(IVacancyRepository):
         if q:
             base_query = base_query.where(Vacancy.title.ilike(f"%{q}%"))
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._session.execute(count_query)
-        total = count_result.scalar_one()
-
-        if pagination is None or pagination.per_page is None:
-            query = base_query
-            page = 1
-            per_page = total
-        else:
-            page = max(pagination.page or 1, 1)
-            per_page = max(pagination.per_page or 10, 1)
-            offset = (page - 1) * per_page
-            query = base_query.offset(offset).limit(per_page)
-
-        result = await self._session.execute(query)
-        rows = result.scalars().all()
-        items = [vacancy_orm_to_dto(row) for row in rows]
+        paged = await paginate(
+            self._session,
+            base_query,
+            pagination,
+            sort_keys=[Vacancy.id],
+            default_count_mode="window",
+        )
+        items = [vacancy_orm_to_dto(row) for row in paged.rows]
 
         return PaginationDTO[VacancyDTO](
-            page=page,
-            per_page=per_page,
-            total=total,
+            page=paged.page,
+            per_page=paged.per_page,
+            total=paged.total,
             items=items,
+            next_cursor=paged.next_cursor,
         )
 
     async def update(self, vacancy_id: int, dto: VacancyDTO) -> Optional[VacancyDTO]:
-        query = self._base_query().where(Vacancy.id == vacancy_id)
-        result = await self._session.execute(query)
-        row = result.scalar_one_or_none()
+        row = await update_returning(
+            self._session,
+            vacancy_dto_to_orm(dto),
+            Vacancy.id == vacancy_id,
+        )
 
         if not row:
             return None
-
-        row = vacancy_dto_to_orm(dto, row)
-        await self._session.flush()
-        await self._session.refresh(row)
         return vacancy_orm_to_dto(row)
 
     async def delete(self, vacancy_id: int) -> bool:
@@ -158,18 +147,11 @@ class VacancySkillRepository(IVacancySkillRepository):
         return query
 
     async def add(self, dto: VacancySkillDTO) -> Optional[VacancySkillDTO]:
-        row = vacancy_skill_dto_to_orm(dto)
-        self._session.add(row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, vacancy_skill_dto_to_orm(dto))
         return vacancy_skill_orm_to_dto(row)
 
     async def add_many(self, dtos: List[VacancySkillDTO]) -> List[VacancySkillDTO]:
-        rows = [vacancy_skill_dto_to_orm(dto) for dto in dtos]
-        self._session.add_all(rows)
-        await self._session.flush()
-        for row in rows:
-            await self._session.refresh(row)
+        rows = await insert_many_returning(self._session, [vacancy_skill_dto_to_orm(dto) for dto in dtos])
         return [vacancy_skill_orm_to_dto(row) for row in rows]
 
     async def get_by_vacancy_id(
@@ -222,18 +204,11 @@ class UserVacancyRepository(IUserVacancyRepository):
         return query
 
     async def add(self, dto: UserVacancyDTO) -> Optional[UserVacancyDTO]:
-        row = user_vacancy_dto_to_orm(dto)
-        self._session.add(row)
-        await self._session.flush()
-        await self._session.refresh(row)
+        row = await insert_returning(self._session, user_vacancy_dto_to_orm(dto))
         return user_vacancy_orm_to_dto(row)
 
     async def add_many(self, dtos: List[UserVacancyDTO]) -> List[UserVacancyDTO]:
-        rows = [user_vacancy_dto_to_orm(dto) for dto in dtos]
-        self._session.add_all(rows)
-        await self._session.flush()
-        for row in rows:
-            await self._session.refresh(row)
+        rows = await insert_many_returning(self._session, [user_vacancy_dto_to_orm(dto) for dto in dtos])
         return [user_vacancy_orm_to_dto(row) for row in rows]
 
     async def get_by_user_id(
@@ -38,9 +38,17 @@ class SortDTO:
 
 T = TypeVar("T")
 
+# exact: separate COUNT(*) query, window: COUNT(*) OVER () in the page query,
+# estimate: planner row estimate from EXPLAIN.
+CountMode = Literal["exact", "window", "estimate"]
+
 @dataclass
 class PaginationDTO(Generic[T]):
     page: Optional[int] = None
     per_page: Optional[int] = None
     total: Optional[int] = None
-    items: Optional[List[T]] = None
\ No newline at end of file
+    items: Optional[List[T]] = None
+    cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
+    include_total: Optional[bool] = None
+    count_mode: Optional[CountMode] = None
\ No newline at end of file
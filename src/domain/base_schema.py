@@ -5,6 +5,8 @@ from typing import Any, Optional, Literal
 from fastapi import Form, Query, HTTPException, status
 from pydantic import BaseModel, Field, field_validator
 
+from src.domain.base_dto import CountMode
+
 
 class BaseSchema(BaseModel):
     @classmethod
@@ -92,3 +94,6 @@ class SortSchema(BaseSchema):
 class PaginationSchema(BaseSchema):
     page: int = 1
     per_page: Optional[int] = None
+    cursor: Optional[str] = None
+    include_total: Optional[bool] = None
+    count_mode: Optional[CountMode] = None
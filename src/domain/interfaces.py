@@ -1,4 +1,4 @@
-from typing import Protocol, Optional, List
+from typing import AsyncIterator, BinaryIO, Protocol, Optional, List, Union
 
 from src.application.directions.dtos import SalaryDTO
 from src.application.skills.dtos import UserSkillDTO
@@ -72,7 +72,7 @@ class IOpenAIService(Protocol):
     async def transcribe_audio(
         self,
         filename: str,
-        data: bytes,
+        file: BinaryIO,
         content_type: Optional[str] = None,
     ) -> str:
         ...
@@ -86,6 +86,15 @@ class IOpenAIService(Protocol):
     ) -> dict:
         ...
 
+    def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        model: ChatGPTModel,
+        temperature: float = 0.2,
+    ) -> AsyncIterator[Union[str, dict]]:
+        ...
+
     async def get_direction_salary(
         self,
         country: str,
@@ -73,6 +73,17 @@ RESPONSE_409 = {
     }
 }
 
+RESPONSE_413 = {
+    "description": "Content Too Large",
+    "content": {
+        "application/json": {
+            "example": {
+                "detail": "Audio file is too large"
+            }
+        }
+    }
+}
+
 RESPONSE_500 = {
     "description": "Internal Server Error",
     "content": {
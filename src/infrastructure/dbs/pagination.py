@@ -0,0 +1,198 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from sqlalchemy import Select, select, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.domain.base_dto import PaginationDTO, CountMode
+
+# A sort key is either a mapped column (value read from the row attribute of the
+# same name) or a pair of SQL expression and a function reading its value from a row.
+SortKey = Union[InstrumentedAttribute, Tuple[Any, Callable[[Any], Any]]]
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """A pagination cursor that was not produced by ``encode_cursor`` for this query."""
+
+
+@dataclass
+class Page:
+    rows: List[Any]
+    page: Optional[int]
+    per_page: Optional[int]
+    total: Optional[int]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError) as e:
+        raise InvalidCursorError(cursor) from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(cursor)
+
+    return values
+
+
+def _expression(key: SortKey):
+    return key if isinstance(key, InstrumentedAttribute) else key[0]
+
+
+def _value(key: SortKey, row: Any) -> Any:
+    if isinstance(key, InstrumentedAttribute):
+        return getattr(row, key.key)
+    return key[1](row)
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` wrapper that keeps the statement's bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_exact(session: AsyncSession, base_query: Select) -> int:
+    count_query = select(func.count()).select_from(base_query.order_by(None).subquery())
+    count_result = await session.execute(count_query)
+    return count_result.scalar_one()
+
+
+async def count_estimate(session: AsyncSession, base_query: Select) -> int:
+    """Planner row estimate for ``base_query``; cheap but approximate."""
+    result = await session.execute(Explain(base_query.order_by(None)))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def paginate(
+    session: AsyncSession,
+    base_query: Select,
+    pagination: Optional[PaginationDTO] = None,
+    sort_keys: Sequence[SortKey] = (),
+    descending: bool = False,
+    default_count_mode: CountMode = "exact",
+) -> Page:
+    """Run ``base_query`` page by page.
+
+    ``sort_keys`` must end with a unique column so that the order is total.
+    When ``pagination.cursor`` is set the page is located with a keyset
+    predicate on the sort keys instead of OFFSET, and ``page`` is ignored.
+
+    ``pagination.include_total=False`` skips counting (``total`` is None);
+    ``pagination.count_mode`` picks how ``total`` is computed, see ``CountMode``.
+    """
+    expressions = [_expression(key) for key in sort_keys]
+    ordering = [e.desc() if descending else e.asc() for e in expressions]
+    ordered_query = base_query.order_by(None).order_by(*ordering)
+
+    cursor = pagination.cursor if pagination is not None else None
+    include_total = pagination is None or pagination.include_total is not False
+    count_mode = (pagination.count_mode if pagination is not None else None) or default_count_mode
+
+    if cursor is None and (pagination is None or pagination.per_page is None):
+        result = await session.execute(ordered_query)
+        rows = list(result.scalars().all())
+        return Page(
+            rows=rows,
+            page=1,
+            per_page=len(rows),
+            total=len(rows),
+            next_cursor=None,
+        )
+
+    per_page = max(pagination.per_page or 10, 1)
+
+    if cursor is not None:
+        page = None
+        values = decode_cursor(cursor, len(expressions))
+        if len(expressions) == 1:
+            left, right = expressions[0], values[0]
+        else:
+            left, right = tuple_(*expressions), tuple_(*values)
+        query = ordered_query.where(left < right if descending else left > right)
+    else:
+        page = max(pagination.page or 1, 1)
+        query = ordered_query.offset((page - 1) * per_page)
+
+    # A window count over a keyset-filtered query would only see the rows
+    # after the cursor, so cursor pages count separately.
+    use_window = include_total and count_mode == "window" and cursor is None
+
+    total: Optional[int] = None
+    if include_total and not use_window:
+        if count_mode == "estimate":
+            total = await count_estimate(session, base_query)
+        else:
+            total = await count_exact(session, base_query)
+
+    # Fetch one extra row to know whether another page exists.
+    query = query.limit(per_page + 1)
+    if use_window:
+        result = await session.execute(query.add_columns(func.count().over()))
+        fetched = result.all()
+        rows = [r[0] for r in fetched]
+        if fetched:
+            total = int(fetched[0][1])
+        elif page == 1:
+            total = 0
+        else:
+            total = await count_exact(session, base_query)
+    else:
+        result = await session.execute(query)
+        rows = list(result.scalars().all())
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor([_value(key, rows[-1]) for key in sort_keys])
+
+    return Page(
+        rows=rows,
+        page=page,
+        per_page=per_page,
+        total=total,
+        next_cursor=next_cursor,
+    )
+
+
+async def iter_batches(
+    fetch: Callable[[PaginationDTO], Awaitable[PaginationDTO[T]]],
+    batch_size: int,
+    cursor: Optional[str] = None,
+) -> AsyncIterator[List[T]]:
+    """Stream all rows of a cursor-paginated ``fetch`` (e.g. ``repository.get``) in batches.
+
+    Starts after ``cursor`` when given, e.g. ``encode_cursor([last_id])``.
+    """
+    while True:
+        page = await fetch(PaginationDTO(per_page=batch_size, cursor=cursor, include_total=False))
+        if page.items:
+            yield page.items
+        cursor = page.next_cursor
+        if cursor is None:
+            return
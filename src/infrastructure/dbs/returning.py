@@ -0,0 +1,61 @@
+from typing import Any, Dict, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import inspect, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+M = TypeVar("M")
+
+
+def column_values(row: Any) -> Dict[str, Any]:
+    """Column values explicitly set on a transient row built by a ``*_dto_to_orm`` mapper."""
+    mapper = inspect(type(row))
+    return {
+        attr.key: row.__dict__[attr.key]
+        for attr in mapper.column_attrs
+        if attr.key in row.__dict__
+    }
+
+
+async def insert_returning(session: AsyncSession, row: M) -> M:
+    """``INSERT ... RETURNING *`` for one row, in a single round trip."""
+    model = type(row)
+    result = await session.execute(
+        insert(model).values(**column_values(row)).returning(model)
+    )
+    return result.scalar_one()
+
+
+async def insert_many_returning(session: AsyncSession, rows: Sequence[M]) -> List[M]:
+    """Multi-row ``INSERT ... RETURNING *``; the result keeps the order of ``rows``."""
+    if not rows:
+        return []
+
+    model = type(rows[0])
+    result = await session.scalars(
+        insert(model).returning(model, sort_by_parameter_order=True),
+        [column_values(row) for row in rows],
+    )
+    return list(result.all())
+
+
+async def update_returning(
+    session: AsyncSession,
+    row: M,
+    *criteria: Any,
+) -> Optional[M]:
+    """``UPDATE ... RETURNING *`` with the values set on ``row``; None when nothing matched."""
+    model = type(row)
+    values = column_values(row)
+
+    if not values:
+        result = await session.execute(select(model).where(*criteria))
+        return result.scalars().first()
+
+    result = await session.execute(
+        update(model)
+        .where(*criteria)
+        .values(**values)
+        .returning(model)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
@@ -0,0 +1,174 @@
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from elasticsearch import AsyncElasticsearch, BadRequestError, NotFoundError
+from elasticsearch.helpers import async_bulk
+
+logger = logging.getLogger(__name__)
+
+
+def completion_inputs(name: str) -> List[str]:
+    """Completion suggester inputs for ``name``: the name from each of its words on.
+
+    Words are split like the standard analyzer, so punctuation never starts an
+    input ("Unit - Testing" gives "Unit Testing" and "Testing").
+    """
+    words = re.findall(r"\w+", name)
+    return [" ".join(words[i:]) for i in range(len(words))] or [name]
+
+
+class AliasedIndex:
+    """Elasticsearch index addressed through an alias.
+
+    ``<alias>`` points to one physical ``<alias>_<timestamp>`` index. Searches and
+    single-document writes go through the alias, while ``rebuild`` fills a fresh
+    index and swaps the alias over in one atomic ``update_aliases`` call, so
+    readers never see a partial index.
+
+    Documents written through the alias while a rebuild runs land in the old
+    index, which is dropped after the swap. ``rebuild`` therefore takes a
+    ``catch_up`` source and, once the alias points to the new index, indexes
+    the documents with an id above the highest one it read. Rows are written
+    to Postgres before they are indexed, so any row missed by the catch-up
+    read is indexed through the alias after the swap.
+
+    Rebuilt indices carry ``version`` in their mapping ``_meta``. An index built
+    for another version (or never built, see ``ensure``) is not current.
+    """
+
+    def __init__(
+        self,
+        es_client: AsyncElasticsearch,
+        alias: str,
+        settings: Dict[str, Any],
+        mappings: Dict[str, Any],
+        version: int = 1,
+    ):
+        self._es = es_client
+        self._alias = alias
+        self._settings = settings
+        self._mappings = mappings
+        self._version = version
+
+    def _new_index_name(self) -> str:
+        return f"{self._alias}_{datetime.now(timezone.utc):%Y%m%d%H%M%S%f}"
+
+    async def _backing_indices(self) -> List[str]:
+        try:
+            response = await self._es.indices.get_alias(name=self._alias)
+        except NotFoundError:
+            return []
+        return list(response.body.keys())
+
+    async def is_current(self) -> bool:
+        """True when the alias points to an index rebuilt for this version."""
+        indices = await self._backing_indices()
+        if not indices:
+            return False
+
+        response = await self._es.indices.get_mapping(index=",".join(indices))
+        return all(
+            mapping.get("mappings", {}).get("_meta", {}).get("version") == self._version
+            for mapping in response.body.values()
+        )
+
+    async def ensure(self) -> bool:
+        """Create an empty index behind the alias unless one exists; True when created.
+
+        The empty index only keeps searches and single writes working until the
+        first ``rebuild``, so it is not stamped with a version.
+        """
+        # A concrete index named like the alias predates aliasing; it keeps
+        # serving until the first rebuild replaces it.
+        if await self._es.indices.exists(index=self._alias):
+            return False
+
+        try:
+            await self._es.indices.create(
+                index=f"{self._alias}_initial",
+                settings=self._settings,
+                mappings=self._mappings,
+                aliases={self._alias: {}},
+            )
+        except BadRequestError as e:
+            if e.error != "resource_already_exists_exception":
+                raise
+            # Another process created it first
+            return False
+        return True
+
+    async def _bulk(self, index: str, documents: List[Dict[str, Any]]) -> int:
+        actions = [
+            {"_index": index, "_id": document["id"], "_source": document}
+            for document in documents
+        ]
+        if not actions:
+            return 0
+        success, _ = await async_bulk(self._es, actions)
+        return success
+
+    async def rebuild(
+        self,
+        batches: AsyncIterator[List[Dict[str, Any]]],
+        catch_up: Optional[Callable[[int], AsyncIterator[List[Dict[str, Any]]]]] = None,
+    ) -> int:
+        """Index ``batches`` of documents (each with an ``id``) into a new index, then swap the alias.
+
+        ``catch_up(max_id)`` yields the documents with an id above ``max_id``
+        (those created while the rebuild ran); they are indexed after the swap.
+        """
+        index = self._new_index_name()
+        # Refreshing while bulk loading only slows the load down
+        await self._es.indices.create(
+            index=index,
+            settings={**self._settings, "refresh_interval": "-1"},
+            mappings={**self._mappings, "_meta": {"version": self._version}},
+        )
+
+        indexed = 0
+        max_id = 0
+        try:
+            async for batch in batches:
+                indexed += await self._bulk(index, batch)
+                max_id = max([max_id, *(document["id"] for document in batch)])
+
+            await self._es.indices.put_settings(index=index, settings={"refresh_interval": None})
+            await self._es.indices.refresh(index=index)
+        except Exception:
+            await self._es.indices.delete(index=index, ignore_unavailable=True)
+            raise
+
+        old_indices = await self._backing_indices()
+        actions: List[Dict[str, Any]] = [{"add": {"index": index, "alias": self._alias}}]
+        actions += [{"remove": {"index": old, "alias": self._alias}} for old in old_indices]
+        if not old_indices and await self._es.indices.exists(index=self._alias):
+            # Replace the pre-alias concrete index in the same atomic step
+            actions.append({"remove_index": {"index": self._alias}})
+        await self._es.indices.update_aliases(actions=actions)
+
+        if catch_up is not None:
+            caught_up = 0
+            async for batch in catch_up(max_id):
+                caught_up += await self._bulk(index, batch)
+            if caught_up:
+                logger.info("Caught up %s with %s documents created during the rebuild", self._alias, caught_up)
+            indexed += caught_up
+
+        for old in old_indices:
+            await self._es.indices.delete(index=old, ignore_unavailable=True)
+
+        logger.info("Rebuilt %s into %s with %s documents", self._alias, index, indexed)
+        return indexed
+
+    async def delete(self) -> bool:
+        """Delete the index (or indices) behind the alias; False when there is none."""
+        indices = await self._backing_indices()
+        if not indices:
+            if not await self._es.indices.exists(index=self._alias):
+                return False
+            indices = [self._alias]
+
+        await self._es.indices.delete(index=",".join(indices), ignore_unavailable=True)
+        return True
@@ -0,0 +1,322 @@
+import copy
+import hashlib
+import json
+import logging
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, List, Optional, Union
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.application.directions.dtos import SalaryDTO
+from src.application.questions.dtos import QuestionDTO
+from src.application.skills.dtos import SkillDTO, UserSkillDTO
+from src.domain.interfaces import IOpenAIService
+from src.domain.value_objects import ChatGPTModel
+from src.infrastructure.jobs.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(value: str) -> str:
+    return " ".join((value or "").split()).lower()
+
+
+def _encode_questions(items: List[QuestionDTO]) -> List[Dict[str, Any]]:
+    return [{"question": q.question, "ideal_answer": q.ideal_answer} for q in items]
+
+
+def _decode_questions(data: List[Dict[str, Any]]) -> List[QuestionDTO]:
+    return [QuestionDTO(question=item["question"], ideal_answer=item["ideal_answer"]) for item in data]
+
+
+def _encode_skills(items: List[UserSkillDTO]) -> List[Dict[str, Any]]:
+    return [
+        {"name": s.skill.name if s.skill else None, "match_percentage": s.match_percentage}
+        for s in items
+    ]
+
+
+def _decode_skills(data: List[Dict[str, Any]]) -> List[UserSkillDTO]:
+    return [
+        UserSkillDTO(
+            skill=SkillDTO(name=item["name"]),
+            to_learn=True,
+            match_percentage=item["match_percentage"],
+        )
+        for item in data
+        if item.get("name")
+    ]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class CachedOpenAIService:
+    """Redis cache in front of ``OpenAIService`` for prompts whose answer only depends on their input.
+
+    Keys are ``llm:v<PROMPT_VERSION>:<method>:<sha256 of normalized args, model, temperature>``,
+    so bumping ``PROMPT_VERSION`` after a prompt change retires every cached answer.
+    Empty answers (the service's failure value) are never cached.
+    Concurrent misses of the same key go through ``single_flight`` so only one
+    request reaches OpenAI; the others get its answer.
+    """
+
+    PROMPT_VERSION = 2
+    KEY_PREFIX = "llm"
+
+    def __init__(
+        self,
+        service: IOpenAIService,
+        redis: Redis,
+        ttl: int = 30 * 24 * 3600,
+        single_flight: Optional[SingleFlight] = None,
+    ):
+        self._service = service
+        self._redis = redis
+        self._ttl = ttl
+        self._single_flight = single_flight
+
+    # -----------------------------
+    # KEYS / INVALIDATION
+    # -----------------------------
+    def cache_key(self, method: str, **params: Any) -> str:
+        raw = json.dumps(params, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:v{self.PROMPT_VERSION}:{method}:{digest}"
+
+    async def invalidate(self, method: str, **params: Any) -> bool:
+        """Drop one cached answer; ``params`` are the normalized key params of ``method``."""
+        return bool(await self._redis.delete(self.cache_key(method, **params)))
+
+    async def clear(self, method: Optional[str] = None) -> int:
+        """Drop every cached answer of ``method`` (or of all methods)."""
+        pattern = f"{self.KEY_PREFIX}:v{self.PROMPT_VERSION}:{method or '*'}:*"
+        deleted = 0
+        async for key in self._redis.scan_iter(match=pattern, count=500):
+            deleted += await self._redis.delete(key)
+        return deleted
+
+    async def _cached(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        call: Callable[[], Any],
+        encode: Callable[[Any], Any] = _identity,
+        decode: Callable[[Any], Any] = _identity,
+    ) -> Any:
+        key = self.cache_key(method, **params)
+
+        async def lookup() -> Any:
+            try:
+                cached = await self._redis.get(key)
+            except RedisError:
+                logger.exception("LLM cache read failed")
+                return None
+            return decode(json.loads(cached)) if cached is not None else None
+
+        async def load() -> Any:
+            result = await call()
+            if not result:
+                return result
+
+            try:
+                await self._redis.set(key, json.dumps(encode(result), ensure_ascii=False), ex=self._ttl)
+            except RedisError:
+                logger.exception("LLM cache write failed")
+
+            return result
+
+        cached = await lookup()
+        if cached is not None:
+            return cached
+
+        if self._single_flight is None:
+            return await load()
+
+        # Callers sharing one in-flight answer each get their own DTOs to mutate.
+        return copy.deepcopy(await self._single_flight.do(key, load, lookup=lookup))
+
+    # -----------------------------
+    # CACHED
+    # -----------------------------
+    async def get_direction_description(
+            self,
+            direction_name: str,
+            model: ChatGPTModel,
+            temperature: float = 0.2,
+    ) -> str:
+        return await self._cached(
+            "direction_description",
+            {"direction": _normalize(direction_name), "model": model.value, "temperature": temperature},
+            lambda: self._service.get_direction_description(
+                direction_name=direction_name,
+                model=model,
+                temperature=temperature,
+            ),
+        )
+
+    async def get_direction_theoretical_skills(
+            self,
+            direction_name: str,
+            skills: List[str],
+            model: ChatGPTModel,
+            temperature: float = 0.3,
+    ) -> List[UserSkillDTO]:
+        return await self._cached(
+            "direction_theoretical_skills",
+            {
+                "direction": _normalize(direction_name),
+                "skills": sorted({_normalize(skill) for skill in skills}),
+                "model": model.value,
+                "temperature": temperature,
+            },
+            lambda: self._service.get_direction_theoretical_skills(
+                direction_name=direction_name,
+                skills=skills,
+                model=model,
+                temperature=temperature,
+            ),
+            encode=_encode_skills,
+            decode=_decode_skills,
+        )
+
+    async def get_skill_theoretical_questions(
+            self,
+            skill_name: str,
+            model: ChatGPTModel,
+            temperature: float = 0.3,
+    ) -> List[QuestionDTO]:
+        return await self._cached(
+            "skill_theoretical_questions",
+            {"skill": _normalize(skill_name), "model": model.value, "temperature": temperature},
+            lambda: self._service.get_skill_theoretical_questions(
+                skill_name=skill_name,
+                model=model,
+                temperature=temperature,
+            ),
+            encode=_encode_questions,
+            decode=_decode_questions,
+        )
+
+    async def get_direction_salary(
+            self,
+            country: str,
+            city: str,
+            direction: str,
+            model: ChatGPTModel,
+            temperature: float = 0.3,
+    ) -> dict:
+        return await self._cached(
+            "direction_salary",
+            {
+                "country": _normalize(country),
+                "city": _normalize(city),
+                "direction": _normalize(direction),
+                "model": model.value,
+                "temperature": temperature,
+            },
+            lambda: self._service.get_direction_salary(
+                country=country,
+                city=city,
+                direction=direction,
+                model=model,
+                temperature=temperature,
+            ),
+        )
+
+    async def check_skill_in_direction(
+            self,
+            direction_name: str,
+            skill_name: str,
+            model: ChatGPTModel,
+            temperature: float = 0.2,
+    ) -> dict:
+        return await self._cached(
+            "skill_in_direction",
+            {
+                "direction": _normalize(direction_name),
+                "skill": _normalize(skill_name),
+                "model": model.value,
+                "temperature": temperature,
+            },
+            lambda: self._service.check_skill_in_direction(
+                direction_name=direction_name,
+                skill_name=skill_name,
+                model=model,
+                temperature=temperature,
+            ),
+        )
+
+    # -----------------------------
+    # PASS-THROUGH
+    # -----------------------------
+    async def get_specializations(
+            self,
+            skills: List[str],
+            country: str,
+            city: str,
+            model: ChatGPTModel,
+            temperature: float = 0.4,
+    ) -> List[SalaryDTO]:
+        # Uses live web search, so answers are not reused.
+        return await self._service.get_specializations(
+            skills=skills,
+            country=country,
+            city=city,
+            model=model,
+            temperature=temperature,
+        )
+
+    async def get_learning_recommendations(
+            self,
+            skill_name: str,
+            model: ChatGPTModel,
+            temperature: float = 0.2,
+    ) -> List[str]:
+        # Already persisted per skill in learning_recommendations.
+        return await self._service.get_learning_recommendations(
+            skill_name=skill_name,
+            model=model,
+            temperature=temperature,
+        )
+
+    async def transcribe_audio(
+            self,
+            filename: str,
+            file: BinaryIO,
+            content_type: Optional[str] = None,
+    ) -> str:
+        return await self._service.transcribe_audio(
+            filename=filename,
+            file=file,
+            content_type=content_type,
+        )
+
+    async def evaluate_answer(
+            self,
+            question: str,
+            answer: str,
+            model: ChatGPTModel,
+            temperature: float = 0.2,
+    ) -> dict:
+        return await self._service.evaluate_answer(
+            question=question,
+            answer=answer,
+            model=model,
+            temperature=temperature,
+        )
+
+    def stream_evaluate_answer(
+            self,
+            question: str,
+            answer: str,
+            model: ChatGPTModel,
+            temperature: float = 0.2,
+    ) -> AsyncIterator[Union[str, dict]]:
+        return self._service.stream_evaluate_answer(
+            question=question,
+            answer=answer,
+            model=model,
+            temperature=temperature,
+        )
@@ -0,0 +1,63 @@
+"""Response schemas for OpenAI structured outputs.
+
+Each model is sent as a strict JSON schema (``text_format``), so the API only
+returns documents of this shape. Nullable fields are required-but-nullable,
+which is what strict mode expects.
+"""
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SpecializationItem(BaseModel):
+    title: str
+    description: str
+    salary: float
+    currency: str
+
+
+class SpecializationsResponse(BaseModel):
+    specializations: List[SpecializationItem]
+
+
+class DirectionDescriptionResponse(BaseModel):
+    description: str
+
+
+class TheoreticalSkillItem(BaseModel):
+    name: str
+    match_percentage: Optional[float]
+
+
+class TheoreticalSkillsResponse(BaseModel):
+    skills: List[TheoreticalSkillItem]
+
+
+class TheoreticalQuestionItem(BaseModel):
+    question: str
+    ideal_answer: str
+
+
+class TheoreticalQuestionsResponse(BaseModel):
+    questions: List[TheoreticalQuestionItem]
+
+
+class AnswerEvaluationResponse(BaseModel):
+    # feedback comes first so it can be streamed before the verdict is generated
+    feedback: str
+    status: Literal["satisfactory", "unsatisfactory"]
+    followup_question: Optional[str]
+
+
+class DirectionSalaryResponse(BaseModel):
+    amount: float
+    currency: str
+
+
+class LearningSourcesResponse(BaseModel):
+    sources: List[str]
+
+
+class SkillInDirectionResponse(BaseModel):
+    belongs: bool
+    match_percentage: Optional[float]
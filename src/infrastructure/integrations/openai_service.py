@@ -1,18 +1,80 @@
 import json
 import logging
 import re
-from typing import List
-from openai import AsyncOpenAI, OpenAIError
+from typing import AsyncIterator, BinaryIO, List, Optional, Type, TypeVar, Union
+from openai import AsyncOpenAI
+from pydantic import BaseModel
 
 from src.application.directions.dtos import SalaryDTO, DirectionDTO
 from src.application.skills.dtos import SkillDTO
 from src.application.skills.dtos import UserSkillDTO
 from src.application.questions.dtos import QuestionDTO
 from src.domain.value_objects import ChatGPTModel
+from src.infrastructure.integrations.openai_schemas import (
+    AnswerEvaluationResponse,
+    DirectionDescriptionResponse,
+    DirectionSalaryResponse,
+    LearningSourcesResponse,
+    SkillInDirectionResponse,
+    SpecializationsResponse,
+    TheoreticalQuestionsResponse,
+    TheoreticalSkillsResponse,
+)
 
 
 logger = logging.getLogger(__name__)
 
+S = TypeVar("S", bound=BaseModel)
+
+
+class _JsonStringField:
+    """Incrementally decodes one top-level string field from streamed JSON text."""
+
+    def __init__(self, name: str):
+        self._start = re.compile(r'"%s"\s*:\s*"' % re.escape(name))
+        self._buffer = ""
+        self._pos: Optional[int] = None
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        if self._done:
+            return ""
+
+        self._buffer += chunk
+        if self._pos is None:
+            match = self._start.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        out: List[str] = []
+        i, buf = self._pos, self._buffer
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._done = True
+                i += 1
+                break
+            if ch == "\\":
+                # Wait for the whole escape sequence before decoding it.
+                size = 2
+                if buf[i + 1:i + 2] == "u":
+                    size = 6
+                    # A high surrogate is only decodable together with its pair.
+                    if i + 6 <= len(buf) and 0xD800 <= int(buf[i + 2:i + 6], 16) <= 0xDBFF:
+                        size = 12
+                if i + size > len(buf):
+                    break
+                out.append(json.loads(f'"{buf[i:i + size]}"'))
+                i += size
+                continue
+            out.append(ch)
+            i += 1
+
+        self._pos = i
+        return "".join(out)
+
+
 class OpenAIService:
 
     def __init__(self, OPENAI_API_KEY: str):
@@ -20,6 +82,29 @@ class OpenAIService:
             api_key=OPENAI_API_KEY
         )
 
+    async def _parse(
+            self,
+            prompt: str,
+            schema: Type[S],
+            model: ChatGPTModel,
+            temperature: float,
+            web_search: bool = False,
+    ) -> Optional[S]:
+        """Ask for a structured output matching ``schema``; None on refusal or empty output."""
+        extra = {"tools": [{"type": "web_search"}]} if web_search else {}
+        response = await self._client.responses.parse(
+            model=model.value,
+            temperature=temperature,
+            input=prompt,
+            text_format=schema,
+            **extra,
+        )
+
+        parsed = response.output_parsed
+        if parsed is None:
+            logger.error(f"No structured output for {schema.__name__}: {response.output_text}")
+        return parsed
+
     async def get_specializations(
             self,
             skills: List[str],
@@ -37,17 +122,17 @@ class OpenAIService:
 
         Use web search ONLY to identify in-demand job roles in {city}, {country}
         that are relevant to the given skills.
-        
+
         DO NOT use web search to calculate salary.
-        
+
         Salary must be based on your internal knowledge about realistic
         entry-level monthly salary ranges in the specified country.
-        
+
         Skills: {skills}
         Location: {city}, {country}
-        
+
         ROLE REQUIREMENTS:
-        
+
         1. Return exactly 5 job roles.
         2. Roles can belong to any industry (IT, engineering, design, crafts, services, etc.).
         3. The role must include or strongly relate to the provided skills.
@@ -55,80 +140,43 @@ class OpenAIService:
         4. Job titles must NOT contain seniority words:
            Junior, Middle, Senior, Lead, Intern.
         5. Prefer practical, real-world job titles that exist in the labor market.
-        
+        6. Each description is 10-20 words.
+
         SALARY REQUIREMENTS:
-        
-        6. Salary must reflect entry-level level.
-        7. Salary must be MONTHLY gross income.
-        8. Currency must strictly match the official currency of {country}.
-        9. Salary must be realistic and market-aligned.
-        10. Avoid extremely low or unrealistic values.
-        
-        Return ONLY valid JSON:
-        
-        {{
-          "specializations": [
-            {{
-              "title": "string",
-              "description": "10-20 words description",
-              "salary": 0,
-              "currency": "string"
-            }}
-          ]
-        }}
-        """
 
+        7. Salary must reflect entry-level level.
+        8. Salary must be MONTHLY gross income.
+        9. Currency must strictly match the official currency of {country}.
+        10. Salary must be realistic and market-aligned.
+        11. Avoid extremely low or unrealistic values.
+        """
 
         try:
-            response = await self._client.responses.create(
-                model=model.value,
-                tools=[{"type": "web_search"}],
+            parsed = await self._parse(
+                prompt,
+                SpecializationsResponse,
+                model=model,
                 temperature=temperature,
-                input=prompt,
+                web_search=True,
             )
-
-            content = response.output_text
-
-            if not content:
-                logger.error("Empty response from AI")
+            if parsed is None:
                 return []
 
-            # 🔥 Вытаскиваем JSON даже если вокруг есть текст
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-
-            if not json_match:
-                logger.error(f"No JSON found in response: {content}")
-                return []
-
-            clean_json = json_match.group()
-
-            parsed = json.loads(clean_json)
-
-            directions: List[SalaryDTO] = []
-
-            for item in parsed.get("specializations", []):
-                try:
-                    direction = DirectionDTO(
-                        name=item["title"],
-                        description=item["description"],
-                    )
-
-                    salary = SalaryDTO(
-                        amount=float(item["salary"]),
-                        currency=item["currency"],
-                        direction=direction,
-                    )
-
-                    directions.append(salary)
-
-                except Exception as inner_error:
-                    logger.error(f"Item parsing error: {inner_error}")
-                    continue
-
-            return directions
+            return [
+                SalaryDTO(
+                    amount=item.salary,
+                    currency=item.currency.strip(),
+                    direction=DirectionDTO(
+                        name=item.title.strip(),
+                        description=item.description.strip(),
+                    ),
+                )
+                for item in parsed.specializations
+                if item.title.strip()
+            ]
 
-        except Exception as e:
-            logger.exception("Unexpected AI parsing error")
+        except Exception:
+            logger.exception("Unexpected AI error")
             return []
 
     async def get_direction_description(
@@ -152,43 +200,19 @@ class OpenAIService:
         1. Output 10-25 words.
         2. Do not mention seniority levels.
         3. Do not include salary, location, or company-specific details.
-        4. Return ONLY valid JSON in the format below.
-
-        {{
-          "description": "string"
-        }}
         """
 
         try:
-            response = await self._client.responses.create(
-                model=model.value,
+            parsed = await self._parse(
+                prompt,
+                DirectionDescriptionResponse,
+                model=model,
                 temperature=temperature,
-                input=prompt,
             )
-
-            content = response.output_text
-
-            if not content:
-                logger.error("Empty response from AI")
-                return ""
-
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-
-            if not json_match:
-                logger.error(f"No JSON found in response: {content}")
-                return ""
-
-            clean_json = json_match.group()
-            parsed = json.loads(clean_json)
-
-            description = parsed.get("description", "")
-            if not isinstance(description, str):
-                return ""
-
-            return description.strip()
+            return parsed.description.strip() if parsed else ""
 
         except Exception:
-            logger.exception("Unexpected AI parsing error")
+            logger.exception("Unexpected AI error")
             return ""
 
     async def get_direction_theoretical_skills(
@@ -217,75 +241,30 @@ class OpenAIService:
         3. Use short skill names (1-3 words each).
         4. For each skill, estimate a match percentage (0-100) for how
            relevant it is to the direction and interview questions.
-        5. Return ONLY valid JSON in the format below.
-
-        {{
-          "skills": [
-            {{
-              "name": "string",
-              "match_percentage": 0
-            }}
-          ]
-        }}
         """
 
         try:
-            response = await self._client.responses.create(
-                model=model.value,
+            parsed = await self._parse(
+                prompt,
+                TheoreticalSkillsResponse,
+                model=model,
                 temperature=temperature,
-                input=prompt,
             )
-
-            content = response.output_text
-
-            if not content:
-                logger.error("Empty response from AI")
+            if parsed is None:
                 return []
 
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-
-            if not json_match:
-                logger.error(f"No JSON found in response: {content}")
-                return []
-
-            clean_json = json_match.group()
-            parsed = json.loads(clean_json)
-
-            skills_list = parsed.get("skills", [])
-            if not isinstance(skills_list, list):
-                return []
-
-            result: List[UserSkillDTO] = []
-            for item in skills_list:
-                if not isinstance(item, dict):
-                    continue
-
-                name = item.get("name", "")
-                if not isinstance(name, str):
-                    continue
-
-                name = name.strip()
-                if not name:
-                    continue
-
-                match_percentage = item.get("match_percentage")
-                try:
-                    match_percentage_value = float(match_percentage)
-                except (TypeError, ValueError):
-                    match_percentage_value = None
-
-                result.append(
-                    UserSkillDTO(
-                        skill=SkillDTO(name=name),
-                        to_learn=True,
-                        match_percentage=match_percentage_value,
-                    )
+            return [
+                UserSkillDTO(
+                    skill=SkillDTO(name=item.name.strip()),
+                    to_learn=True,
+                    match_percentage=item.match_percentage,
                 )
-
-            return result
+                for item in parsed.skills
+                if item.name.strip()
+            ]
 
         except Exception:
-            logger.exception("Unexpected AI parsing error")
+            logger.exception("Unexpected AI error")
             return []
 
     async def get_skill_theoretical_questions(
@@ -310,89 +289,44 @@ class OpenAIService:
         REQUIREMENTS:
         1. Questions must be theoretical (concepts, principles, tradeoffs).
         2. Answers must be concise (2-5 sentences).
-        3. Return ONLY valid JSON in the format below.
-
-        {{
-          "questions": [
-            {{
-              "question": "string",
-              "ideal_answer": "string"
-            }}
-          ]
-        }}
         """
 
         try:
-            response = await self._client.chat.completions.create(
-                model=model.value,
+            parsed = await self._parse(
+                prompt,
+                TheoreticalQuestionsResponse,
+                model=model,
                 temperature=temperature,
-                messages=[
-                    {"role": "user", "content": prompt},
-                ],
             )
-
-            content = response.choices[0].message.content if response.choices else None
-
-            if not content:
-                logger.error("Empty response from AI")
+            if parsed is None:
                 return []
 
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-
-            if not json_match:
-                logger.error(f"No JSON found in response: {content}")
-                return []
-
-            clean_json = json_match.group()
-            parsed = json.loads(clean_json)
-
-            questions_list = parsed.get("questions", [])
-            if not isinstance(questions_list, list):
-                return []
-
-            result: List[QuestionDTO] = []
-            for item in questions_list:
-                if not isinstance(item, dict):
-                    continue
-
-                question = item.get("question", "")
-                ideal_answer = item.get("ideal_answer", "")
-
-                if not isinstance(question, str) or not isinstance(ideal_answer, str):
-                    continue
-
-                question = question.strip()
-                ideal_answer = ideal_answer.strip()
-
-                if not question or not ideal_answer:
-                    continue
-
-                result.append(
-                    QuestionDTO(
-                        question=question,
-                        ideal_answer=ideal_answer,
-                    )
+            return [
+                QuestionDTO(
+                    question=item.question.strip(),
+                    ideal_answer=item.ideal_answer.strip(),
                 )
-
-            return result
+                for item in parsed.questions
+                if item.question.strip() and item.ideal_answer.strip()
+            ]
 
         except Exception:
-            logger.exception("Unexpected AI parsing error")
+            logger.exception("Unexpected AI error")
             return []
 
     async def transcribe_audio(
             self,
             filename: str,
-            data: bytes,
+            file: BinaryIO,
             content_type: str | None = None,
     ) -> str:
         try:
-            import io
-            file_obj = io.BytesIO(data)
-            file_obj.name = filename
+            # The handle is streamed into the multipart body in chunks (and
+            # rewound on retries), so the audio is never copied into memory whole.
+            upload = (filename, file, content_type) if content_type else (filename, file)
             response = await self._client.audio.transcriptions.create(
                 model="whisper-1",
-                file=file_obj,
+                file=upload,
                 language="en",
             )
             text = getattr(response, "text", None)
@@ -401,17 +335,9 @@ class OpenAIService:
             logger.exception("Audio transcription error")
             return ""
 
-    async def evaluate_answer(
-            self,
-            question: str,
-            answer: str,
-            model: ChatGPTModel,
-            temperature: float = 0.2,
-    ) -> dict:
-        if not 0 <= temperature <= 2:
-            raise ValueError("temperature must be between 0 and 2")
-
-        prompt = f"""
+    @staticmethod
+    def _evaluation_prompt(question: str, answer: str) -> str:
+        return f"""
         You are a senior technical interviewer.
 
         Evaluate the candidate's answer to the question.
@@ -420,60 +346,89 @@ class OpenAIService:
         Answer: {answer}
 
         REQUIREMENTS:
-        1. Decide if the answer is satisfactory or unsatisfactory.
-        2. Provide brief feedback (1-3 sentences).
-        3. If the answer lacks detail, ask ONE follow-up question.
-        4. Return ONLY valid JSON:
-
-        {{
-          "status": "satisfactory|unsatisfactory",
-          "feedback": "string",
-          "followup_question": "string|null"
-        }}
+        1. Provide brief feedback (1-3 sentences).
+        2. Decide if the answer is satisfactory or unsatisfactory.
+        3. If the answer lacks detail, ask ONE follow-up question, otherwise
+           set followup_question to null.
         """
 
-        try:
-            response = await self._client.chat.completions.create(
-                model=model.value,
-                temperature=temperature,
-                messages=[{"role": "user", "content": prompt}],
-            )
+    @staticmethod
+    def _evaluation_result(parsed: Optional[AnswerEvaluationResponse]) -> dict:
+        if parsed is None:
+            return {}
 
-            content = response.choices[0].message.content if response.choices else None
-            if not content:
-                logger.error("Empty response from AI")
-                return {}
+        followup_question = (parsed.followup_question or "").strip() or None
+        return {
+            "status": parsed.status,
+            "feedback": parsed.feedback.strip(),
+            "followup_question": followup_question,
+        }
 
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-            if not json_match:
-                logger.error(f"No JSON found in response: {content}")
-                return {}
+    async def evaluate_answer(
+            self,
+            question: str,
+            answer: str,
+            model: ChatGPTModel,
+            temperature: float = 0.2,
+    ) -> dict:
 
-            clean_json = json_match.group()
-            parsed = json.loads(clean_json)
+        if not 0 <= temperature <= 2:
+            raise ValueError("temperature must be between 0 and 2")
 
-            status = parsed.get("status")
-            feedback = parsed.get("feedback")
-            followup_question = parsed.get("followup_question")
+        try:
+            parsed = await self._parse(
+                self._evaluation_prompt(question, answer),
+                AnswerEvaluationResponse,
+                model=model,
+                temperature=temperature,
+            )
+            return self._evaluation_result(parsed)
 
-            if status not in ("satisfactory", "unsatisfactory"):
-                return {}
+        except Exception:
+            logger.exception("Unexpected AI error")
+            return {}
 
-            if not isinstance(feedback, str):
-                return {}
+    async def stream_evaluate_answer(
+            self,
+            question: str,
+            answer: str,
+            model: ChatGPTModel,
+            temperature: float = 0.2,
+    ) -> AsyncIterator[Union[str, dict]]:
+        """Like ``evaluate_answer``, but yields feedback text as it is generated.
 
-            if followup_question is not None and not isinstance(followup_question, str):
-                followup_question = None
+        Yields ``str`` chunks of the feedback, then exactly one ``dict`` with the
+        same payload ``evaluate_answer`` returns (``{}`` on failure).
+        """
+        if not 0 <= temperature <= 2:
+            raise ValueError("temperature must be between 0 and 2")
 
-            return {
-                "status": status,
-                "feedback": feedback.strip(),
-                "followup_question": followup_question.strip() if isinstance(followup_question, str) else None,
-            }
+        feedback = _JsonStringField("feedback")
+        try:
+            async with self._client.responses.stream(
+                model=model.value,
+                temperature=temperature,
+                input=self._evaluation_prompt(question, answer),
+                text_format=AnswerEvaluationResponse,
+            ) as stream:
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        chunk = feedback.feed(event.delta)
+                        if chunk:
+                            yield chunk
+
+                response = await stream.get_final_response()
+
+            parsed = response.output_parsed
+            if parsed is None:
+                logger.error(f"No structured output for evaluation: {response.output_text}")
+            result = self._evaluation_result(parsed)
 
         except Exception:
-            logger.exception("Unexpected AI parsing error")
-            return {}
+            logger.exception("Unexpected AI error")
+            result = {}
+
+        yield result
 
     async def get_direction_salary(
             self,
@@ -483,6 +438,7 @@ class OpenAIService:
             model: ChatGPTModel,
             temperature: float = 0.3,
     ) -> dict:
+
         if not 0 <= temperature <= 2:
             raise ValueError("temperature must be between 0 and 2")
 
@@ -499,52 +455,25 @@ class OpenAIService:
         REQUIREMENTS:
         1. Salary must be monthly gross.
         2. Currency must match the official currency of the country.
-        3. Return ONLY valid JSON:
-
-        {{
-          "amount": 0,
-          "currency": "string"
-        }}
         """
 
         try:
-            response = await self._client.chat.completions.create(
-                model=model.value,
+            parsed = await self._parse(
+                prompt,
+                DirectionSalaryResponse,
+                model=model,
                 temperature=temperature,
-                messages=[{"role": "user", "content": prompt}],
             )
-
-            content = response.choices[0].message.content if response.choices else None
-            if not content:
-                logger.error("Empty response from AI")
-                return {}
-
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-            if not json_match:
-                logger.error(f"No JSON found in response: {content}")
-                return {}
-
-            clean_json = json_match.group()
-            parsed = json.loads(clean_json)
-
-            amount = parsed.get("amount")
-            currency = parsed.get("currency")
-
-            try:
-                amount_value = float(amount)
-            except (TypeError, ValueError):
-                return {}
-
-            if not isinstance(currency, str) or not currency.strip():
+            if parsed is None or not parsed.currency.strip():
                 return {}
 
             return {
-                "amount": amount_value,
-                "currency": currency.strip(),
+                "amount": parsed.amount,
+                "currency": parsed.currency.strip(),
             }
 
         except Exception:
-            logger.exception("Unexpected AI parsing error")
+            logger.exception("Unexpected AI error")
             return {}
 
     async def get_learning_recommendations(
@@ -553,6 +482,7 @@ class OpenAIService:
             model: ChatGPTModel,
             temperature: float = 0.2,
     ) -> List[str]:
+
         if not 0 <= temperature <= 2:
             raise ValueError("temperature must be between 0 and 2")
 
@@ -568,45 +498,22 @@ class OpenAIService:
         1. Return only direct URLs to resources (articles, docs, courses, videos).
         2. Resources must be free and currently accessible.
         3. Prefer official docs and reputable sources.
-        4. Return ONLY valid JSON in the format below.
-
-        {{
-          "sources": ["https://example.com/resource"]
-        }}
         """
 
         try:
-            response = await self._client.responses.create(
-                model=model.value,
-                tools=[{"type": "web_search"}],
+            parsed = await self._parse(
+                prompt,
+                LearningSourcesResponse,
+                model=model,
                 temperature=temperature,
-                input=prompt,
+                web_search=True,
             )
-
-            content = response.output_text
-            if not content:
-                logger.error("Empty response from AI")
-                return []
-
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-            if not json_match:
-                logger.error(f"No JSON found in response: {content}")
-                return []
-
-            clean_json = json_match.group()
-            parsed = json.loads(clean_json)
-
-            sources = parsed.get("sources", [])
-            if not isinstance(sources, list):
+            if parsed is None:
                 return []
 
             clean_sources: List[str] = []
-            for item in sources:
-                if not isinstance(item, str):
-                    continue
+            for item in parsed.sources:
                 url = item.strip()
-                if not url:
-                    continue
                 if not (url.startswith("http://") or url.startswith("https://")):
                     continue
                 if url not in clean_sources:
@@ -615,7 +522,7 @@ class OpenAIService:
             return clean_sources[:5]
 
         except Exception:
-            logger.exception("Unexpected AI parsing error")
+            logger.exception("Unexpected AI error")
             return []
 
     async def check_skill_in_direction(
@@ -625,6 +532,7 @@ class OpenAIService:
             model: ChatGPTModel,
             temperature: float = 0.2,
     ) -> dict:
+
         if not 0 <= temperature <= 2:
             raise ValueError("temperature must be between 0 and 2")
 
@@ -638,57 +546,26 @@ class OpenAIService:
         Skill: {skill_name}
 
         REQUIREMENTS:
-        1. If the skill belongs to the direction, return "belongs": true
-           and a match_percentage from 0 to 100.
-        2. If it does not belong, return "belongs": false and "match_percentage": null.
-        3. Return ONLY valid JSON:
-
-        {{
-          "belongs": true,
-          "match_percentage": 0
-        }}
+        1. If the skill belongs to the direction, set belongs to true
+           and match_percentage to a value from 0 to 100.
+        2. If it does not belong, set belongs to false and match_percentage to null.
         """
 
         try:
-            response = await self._client.responses.create(
-                model=model.value,
+            parsed = await self._parse(
+                prompt,
+                SkillInDirectionResponse,
+                model=model,
                 temperature=temperature,
-                input=prompt,
             )
-
-            content = response.output_text
-            if not content:
-                logger.error("Empty response from AI")
-                return {}
-
-            json_match = re.search(r"\{.*\}", content, re.DOTALL)
-            if not json_match:
-                logger.error(f"No JSON found in response: {content}")
-                return {}
-
-            clean_json = json_match.group()
-            parsed = json.loads(clean_json)
-
-            belongs = parsed.get("belongs")
-            match_percentage = parsed.get("match_percentage")
-
-            if not isinstance(belongs, bool):
+            if parsed is None:
                 return {}
 
-            if match_percentage is None:
-                match_value = None
-            else:
-                try:
-                    match_value = float(match_percentage)
-                except (TypeError, ValueError):
-                    match_value = None
-
             return {
-                "belongs": belongs,
-                "match_percentage": match_value,
+                "belongs": parsed.belongs,
+                "match_percentage": parsed.match_percentage,
             }
 
         except Exception:
-            logger.exception("Unexpected AI parsing error")
+            logger.exception("Unexpected AI error")
             return {}
-
@@ -0,0 +1,221 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, TypeVar
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+JobStatus = Literal["queued", "running", "done", "failed"]
+
+# Checks the status key and pushes the job atomically; only a job that ran out of
+# attempts may be queued again while its status is still around.
+_ENQUEUE_SCRIPT = """
+local status = redis.call('GET', KEYS[1])
+if status and status ~= 'failed' then
+    return 0
+end
+redis.call('SET', KEYS[1], 'queued', 'EX', ARGV[1])
+redis.call('LPUSH', KEYS[2], ARGV[2])
+return 1
+"""
+
+# Moves a failed job out of the processing list in one step, so it is always in
+# either the processing list (and recovered) or the delayed set.
+_FAIL_SCRIPT = """
+redis.call('LREM', KEYS[1], 1, ARGV[1])
+if ARGV[2] == '' then
+    redis.call('SET', KEYS[3], 'failed', 'EX', ARGV[4])
+    return 0
+end
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[2])
+redis.call('SET', KEYS[3], 'queued', 'EX', ARGV[4])
+return 1
+"""
+
+# ZREM succeeds for exactly one worker, so a job is never promoted twice.
+_PROMOTE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+for _, raw in ipairs(due) do
+    redis.call('ZREM', KEYS[1], raw)
+    redis.call('LPUSH', KEYS[2], raw)
+end
+return #due
+"""
+
+T = TypeVar("T")
+
+
+@dataclass
+class Job:
+    id: str
+    payload: Dict[str, Any]
+    attempts: int = 0
+    raw: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def dumps(self) -> str:
+        return json.dumps(
+            {"id": self.id, "payload": self.payload, "attempts": self.attempts},
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def loads(cls, raw: str) -> "Job":
+        data = json.loads(raw)
+        return cls(
+            id=data["id"],
+            payload=data.get("payload") or {},
+            attempts=int(data.get("attempts") or 0),
+            raw=raw,
+        )
+
+
+class RedisJobQueue:
+    """Reliable Redis list queue with per-job idempotency keys and delayed retries.
+
+    ``jobs:<name>:ready``                  jobs waiting for a worker (LPUSH / BLMOVE from the right)
+    ``jobs:<name>:processing:<worker_id>`` jobs a worker has taken but not finished
+    ``jobs:<name>:delayed``                failed jobs waiting for their retry time (ZSET by timestamp)
+    ``jobs:<name>:status:<job_id>``        job status; also makes enqueueing idempotent
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        name: str,
+        max_attempts: int = 3,
+        retry_delay: int = 30,
+        status_ttl: int = 3600,
+    ):
+        self._redis = redis
+        self._name = name
+        self._max_attempts = max(max_attempts, 1)
+        self._retry_delay = retry_delay
+        self._status_ttl = status_ttl
+
+        self._ready_key = f"jobs:{name}:ready"
+        self._delayed_key = f"jobs:{name}:delayed"
+        self._enqueue_script = redis.register_script(_ENQUEUE_SCRIPT)
+        self._fail_script = redis.register_script(_FAIL_SCRIPT)
+        self._promote_script = redis.register_script(_PROMOTE_SCRIPT)
+
+    def _processing_key(self, worker_id: str) -> str:
+        return f"jobs:{self._name}:processing:{worker_id}"
+
+    def _status_key(self, job_id: str) -> str:
+        return f"jobs:{self._name}:status:{job_id}"
+
+    # -----------------------------
+    # PRODUCER
+    # -----------------------------
+    async def enqueue(self, job_id: str, payload: Dict[str, Any]) -> bool:
+        """Queue a job unless one with the same id is queued, running or recently done."""
+        created = await self._enqueue_script(
+            keys=[self._status_key(job_id), self._ready_key],
+            args=[self._status_ttl, Job(id=job_id, payload=payload).dumps()],
+        )
+        return bool(created)
+
+    async def get_status(self, job_id: str) -> Optional[JobStatus]:
+        return await self._redis.get(self._status_key(job_id))
+
+    async def get_statuses(self, job_ids: List[str]) -> Dict[str, Optional[JobStatus]]:
+        if not job_ids:
+            return {}
+        values = await self._redis.mget([self._status_key(job_id) for job_id in job_ids])
+        return dict(zip(job_ids, values))
+
+    # -----------------------------
+    # CONSUMER
+    # -----------------------------
+    async def recover(self, worker_id: str) -> int:
+        """Put back jobs a previous run of this worker took but never finished."""
+        moved = 0
+        while await self._redis.lmove(self._processing_key(worker_id), self._ready_key, "LEFT", "RIGHT"):
+            moved += 1
+        return moved
+
+    async def reserve(self, worker_id: str, timeout: int = 5) -> Optional[Job]:
+        await self._promote_delayed()
+
+        raw = await self._redis.blmove(
+            self._ready_key,
+            self._processing_key(worker_id),
+            timeout,
+            "RIGHT",
+            "LEFT",
+        )
+        if raw is None:
+            return None
+
+        job = Job.loads(raw)
+        await self._redis.set(self._status_key(job.id), "running", ex=self._status_ttl)
+        return job
+
+    async def complete(self, job: Job, worker_id: str) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._status_key(job.id), "done", ex=self._status_ttl)
+            pipe.lrem(self._processing_key(worker_id), 1, job.raw)
+            await pipe.execute()
+
+    async def fail(self, job: Job, worker_id: str) -> bool:
+        """Schedule a retry with exponential backoff; returns False once attempts run out."""
+        attempts = job.attempts + 1
+        retry = attempts < self._max_attempts
+        run_at = time.time() + self._retry_delay * 2 ** (attempts - 1)
+        retry_raw = Job(id=job.id, payload=job.payload, attempts=attempts).dumps() if retry else ""
+
+        await self._fail_script(
+            keys=[self._processing_key(worker_id), self._delayed_key, self._status_key(job.id)],
+            args=[job.raw, retry_raw, run_at, self._status_ttl],
+        )
+        # Only counted once stored, so a retried call after a Redis error schedules the same attempt
+        job.attempts = attempts
+        return retry
+
+    async def _promote_delayed(self) -> None:
+        await self._promote_script(keys=[self._delayed_key, self._ready_key], args=[time.time()])
+
+
+async def _retry_redis(operation: Callable[[], Awaitable[T]], max_backoff: float = 30.0) -> T:
+    """Run ``operation`` until it gets through, backing off while Redis is unavailable."""
+    backoff = 1.0
+    while True:
+        try:
+            return await operation()
+        except RedisError:
+            logger.exception(f"Redis unavailable, retrying in {backoff:.0f}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, max_backoff)
+
+
+async def run_worker(
+    queue: RedisJobQueue,
+    handler: Callable[[Dict[str, Any]], Awaitable[None]],
+    worker_id: str,
+    concurrency: int = 1,
+    poll_timeout: int = 5,
+) -> None:
+    recovered = await _retry_redis(lambda: queue.recover(worker_id))
+    if recovered:
+        logger.info(f"Recovered {recovered} unfinished jobs for worker {worker_id}")
+
+    async def consume() -> None:
+        while True:
+            job = await _retry_redis(lambda: queue.reserve(worker_id, timeout=poll_timeout))
+            if job is None:
+                continue
+
+            try:
+                await handler(job.payload)
+            except Exception:
+                logger.exception(f"Job {job.id} failed (attempt {job.attempts + 1})")
+                await _retry_redis(lambda: queue.fail(job, worker_id))
+            else:
+                await _retry_redis(lambda: queue.complete(job, worker_id))
+
+    await asyncio.gather(*(consume() for _ in range(max(concurrency, 1))))
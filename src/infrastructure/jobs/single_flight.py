@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Deletes the lock only while it still holds our token.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """Runs one call per key at a time, across coroutines and across processes.
+
+    Inside a process concurrent callers of the same key share one task. Between
+    processes a Redis lock (``<prefix>:<key>``) elects one runner; the others poll
+    ``lookup`` for the runner's result and take over if the lock is released or
+    expires without one. When Redis is unavailable the call simply runs.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = "single_flight",
+        lock_ttl: int = 120,
+        poll_interval: float = 0.25,
+    ):
+        self._redis = redis
+        self._prefix = prefix
+        self._lock_ttl = lock_ttl
+        self._poll_interval = poll_interval
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._release_script = redis.register_script(_RELEASE_SCRIPT)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        lookup: Optional[Callable[[], Awaitable[Optional[T]]]] = None,
+    ) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, fn, lookup))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # A cancelled caller must not cancel the call the others are waiting on.
+        return await asyncio.shield(task)
+
+    async def _run(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        lookup: Optional[Callable[[], Awaitable[Optional[T]]]],
+    ) -> T:
+        lock_key = f"{self._prefix}:{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self._lock_ttl
+
+        while True:
+            try:
+                acquired = await self._redis.set(lock_key, token, nx=True, ex=self._lock_ttl)
+            except RedisError:
+                logger.exception("Single-flight lock failed, running %s unguarded", key)
+                return await fn()
+
+            if acquired:
+                try:
+                    return await fn()
+                finally:
+                    try:
+                        await self._release_script(keys=[lock_key], args=[token])
+                    except RedisError:
+                        logger.exception("Single-flight unlock failed for %s", key)
+
+            await asyncio.sleep(self._poll_interval)
+
+            if lookup is not None:
+                result = await lookup()
+                if result is not None:
+                    return result
+
+            if time.monotonic() >= deadline:
+                logger.warning("Single-flight wait for %s timed out, running unguarded", key)
+                return await fn()
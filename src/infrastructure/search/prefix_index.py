@@ -0,0 +1,268 @@
+import asyncio
+import bisect
+import logging
+import re
+import time
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import iter_batches
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "autocomplete:invalidate"
+
+Loader = Callable[[], Awaitable[List[Tuple[int, str]]]]
+
+
+def normalize(text: str) -> str:
+    """Case-fold and strip accents, so "Résumé" and "resume" share keys."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> List[str]:
+    """Normalized words of ``text``, split on non-word characters like the standard analyzer."""
+    return re.findall(r"\w+", normalize(text))
+
+
+class PrefixIndex:
+    """Immutable sorted-array prefix index over ``(id, name)`` pairs.
+
+    Mirrors the search index (edge n-grams with ``operator: and``): every query
+    word must prefix some word of the name, in any order, so "learn mach" finds
+    "Machine Learning". Names whose first word matches the first query word
+    rank first, then shorter names.
+    """
+
+    def __init__(self, items: Iterable[Tuple[int, str]]):
+        entries: List[Tuple[str, int, int]] = []
+        names: Dict[int, str] = {}
+        for item_id, name in items:
+            names[item_id] = name
+            for position, word in enumerate(tokenize(name)):
+                entries.append((word, position, item_id))
+
+        entries.sort()
+        self._entries = entries
+        self._words = [entry[0] for entry in entries]
+        self._names = names
+        self._all = sorted(names.items(), key=lambda item: normalize(item[1]))
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def _match(self, token: str) -> Dict[int, int]:
+        """Ids of names with a word starting with ``token``, mapped to that word's lowest position."""
+        positions: Dict[int, int] = {}
+        for word, position, item_id in self._entries[bisect.bisect_left(self._words, token):]:
+            if not word.startswith(token):
+                break
+            if item_id not in positions or position < positions[item_id]:
+                positions[item_id] = position
+        return positions
+
+    def search(self, prefix: Optional[str] = None) -> List[Tuple[int, str]]:
+        tokens = tokenize(prefix or "")
+        if not tokens:
+            return list(self._all)
+
+        matched = self._match(tokens[0])
+        for token in tokens[1:]:
+            if not matched:
+                break
+            positions = self._match(token)
+            matched = {item_id: position for item_id, position in matched.items() if item_id in positions}
+
+        ranked = sorted(
+            matched.items(),
+            key=lambda item: (item[1] > 0, len(self._names[item[0]]), normalize(self._names[item[0]])),
+        )
+        return [(item_id, self._names[item_id]) for item_id, _ in ranked]
+
+
+def catalog_loader(session_factory: Any, repository_factory: Callable[[Any], Any], batch_size: int = 1000) -> Loader:
+    """Loader reading ``(id, name)`` of every row through ``repository_factory(session).get``."""
+    async def load() -> List[Tuple[int, str]]:
+        async with session_factory() as session:
+            repository = repository_factory(session)
+            items: List[Tuple[int, str]] = []
+            async for batch in iter_batches(lambda pagination: repository.get(pagination=pagination), batch_size):
+                items.extend((dto.id, dto.name) for dto in batch if dto.id is not None and dto.name)
+            return items
+
+    return load
+
+
+class LocalAutocompleteIndex:
+    """In-process copy of a name catalog (skills, directions) for autocomplete.
+
+    Loaded by ``loader`` once ``start`` is called, then reloaded whenever a
+    process publishes ``name`` on ``INVALIDATION_CHANNEL`` (see ``invalidate``),
+    and at least every ``refresh_interval`` seconds in case a message was missed.
+    ``search`` returns None until the first load completes, so callers fall
+    back to Elasticsearch.
+    """
+
+    def __init__(self, redis: Redis, name: str, loader: Loader, refresh_interval: int = 600):
+        self._redis = redis
+        self._name = name
+        self._loader = loader
+        self._refresh_interval = refresh_interval
+        self._index: Optional[PrefixIndex] = None
+        self._loaded_at = 0.0
+        self._dirty = False
+        self._reload_lock = asyncio.Lock()
+        self._listener: Optional[asyncio.Task] = None
+
+    def search(self, prefix: Optional[str] = None) -> Optional[List[Tuple[int, str]]]:
+        if self._index is None:
+            return None
+        return self._index.search(prefix)
+
+    def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def invalidate(self) -> None:
+        """Ask every process (this one included) to reload the catalog."""
+        try:
+            await self._redis.publish(INVALIDATION_CHANNEL, self._name)
+        except RedisError:
+            logger.exception("Autocomplete invalidation failed, reloading %s locally", self._name)
+            await self.reload()
+
+    async def reload(self) -> None:
+        # Requests that arrive while a load runs are served by one more load after it
+        self._dirty = True
+        async with self._reload_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+
+            try:
+                items = await self._loader()
+            except Exception:
+                logger.exception("Autocomplete index %s failed to load", self._name)
+                return
+
+            self._index = PrefixIndex(items)
+            self._loaded_at = time.monotonic()
+            logger.info("Autocomplete index %s loaded with %s entries", self._name, len(self._index))
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Subscribed before loading, so no invalidation falls in between
+                await self.reload()
+
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None and message.get("data") in (self._name, self._name.encode()):
+                        await self.reload()
+                    elif time.monotonic() - self._loaded_at >= self._refresh_interval:
+                        await self.reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Autocomplete listener for %s failed, reconnecting", self._name)
+                await asyncio.sleep(5)
+            finally:
+                await pubsub.aclose()
+
+
+class LocalAutocompleteSearchService:
+    """Search service answering ``search``/``suggest`` from a ``LocalAutocompleteIndex``.
+
+    Falls back to the wrapped Elasticsearch service while the local index is not
+    loaded. Writes go to Elasticsearch and then invalidate the local index.
+    """
+
+    def __init__(self, search_service: Any, index: LocalAutocompleteIndex, dto_factory: Callable[..., Any]):
+        self._search_service = search_service
+        self._index = index
+        self._dto_factory = dto_factory
+
+    async def create_index_if_not_exists(self) -> bool:
+        return await self._search_service.create_index_if_not_exists()
+
+    async def is_index_current(self) -> bool:
+        return await self._search_service.is_index_current()
+
+    async def delete_index(self) -> bool:
+        return await self._search_service.delete_index()
+
+    async def rebuild(self, batches, catch_up=None) -> int:
+        return await self._search_service.rebuild(batches, catch_up=catch_up)
+
+    async def count(self) -> int:
+        return await self._search_service.count()
+
+    # Writes forward their arguments unchanged: the wrapped services name them
+    # differently (``skill_id``/``direction_id``, ``skills``/``directions``).
+    async def bulk_index(self, *args: Any, **kwargs: Any) -> None:
+        await self._search_service.bulk_index(*args, **kwargs)
+        await self._index.invalidate()
+
+    async def index(self, *args: Any, **kwargs: Any) -> None:
+        await self._search_service.index(*args, **kwargs)
+        await self._index.invalidate()
+
+    async def delete(self, *args: Any, **kwargs: Any) -> None:
+        await self._search_service.delete(*args, **kwargs)
+        await self._index.invalidate()
+
+    async def search(
+        self,
+        name: Optional[str] = None,
+        pagination: Optional[PaginationDTO] = None,
+    ) -> PaginationDTO:
+        matches = self._index.search(name)
+        if matches is None:
+            return await self._search_service.search(name=name, pagination=pagination)
+
+        pagination = pagination or PaginationDTO()
+
+        page = max(pagination.page or 1, 1)
+        per_page = min(pagination.per_page or 10, 100)
+
+        from_value = (page - 1) * per_page
+
+        return PaginationDTO[self._dto_factory](
+            page=page,
+            per_page=per_page,
+            total=len(matches),
+            items=[
+                self._dto_factory(id=item_id, name=item_name)
+                for item_id, item_name in matches[from_value:from_value + per_page]
+            ],
+        )
+
+    async def suggest(self, prefix: str, size: int = 10) -> List[Any]:
+        prefix = prefix.strip()
+        if not prefix:
+            return []
+
+        matches = self._index.search(prefix)
+        if matches is None:
+            return await self._search_service.suggest(prefix=prefix, size=size)
+
+        return [
+            self._dto_factory(id=item_id, name=item_name)
+            for item_id, item_name in matches[:min(max(size, 1), 100)]
+        ]
@@ -14,8 +14,8 @@ from src.application.locations.controllers import LocationController
 from src.application.modules.controllers import ModuleController
 from src.application.modules.interfaces import IModuleController
 from src.application.questions.controllers import QuestionController
-from src.application.questions.interfaces import IQuestionRepository, IQuestionController, IUserQuestionRepository
-from src.application.modules.interfaces import IModuleStatisticsService
+from src.application.questions.interfaces import IQuestionRepository, IQuestionController, IUserQuestionRepository, IQuestionSeedService
+from src.application.modules.interfaces import IModuleStatisticsService, IProgressStatisticsCache
 from src.application.locations.interfaces import ICountryRepository, ICityRepository, ILocationController
 from src.application.skills.controllers import SkillController
 from src.application.skills.interfaces import ISkillRepository, ISkillController, ISkillSearchService, IUserSkillRepository
@@ -26,7 +26,12 @@ from src.application.users.user.controllers import UserController
 from src.application.users.user.interfaces import IUserController, IUserService
 from src.application.users.user.services import UserService
 from src.application.interview.controllers import InterviewController
-from src.application.interview.interfaces import IInterviewController, IInterviewSessionRepository, IInterviewQuestionRepository
+from src.application.interview.interfaces import (
+    IInterviewController,
+    IInterviewSessionRepository,
+    IInterviewQuestionRepository,
+    IInterviewStateCache,
+)
 from src.application.learning_recommendations.controllers import LearningRecommendationController
 from src.application.learning_recommendations.interfaces import ILearningRecommendationController, ILearningRecommendationRepository
 from src.application.vacancies.controllers import VacancyController
@@ -80,6 +85,9 @@ async def get_user_controller(
         skill_search_service: ISkillSearchService = Depends(Provide[Container.skill_search_service]),
         airflow_client: AirflowClient = Depends(Provide[Container.airflow_client]),
         hash_service: IHashService = Depends(Provide[Container.hash_service]),
+        question_seed_service: IQuestionSeedService = Depends(Provide[Container.question_seed_service]),
+        interview_state_cache: IInterviewStateCache = Depends(Provide[Container.interview_state_cache]),
+        statistics_cache: IProgressStatisticsCache = Depends(Provide[Container.progress_statistics_cache]),
         uow: IUoW = Depends(get_uow)
 ) -> IUserController:
     user_service: IUserService = UserService(
@@ -98,6 +106,9 @@ async def get_user_controller(
         skill_search_service=skill_search_service,
         airflow_client=airflow_client,
         uow=uow,
+        question_seed_service=question_seed_service,
+        interview_state_cache=interview_state_cache,
+        statistics_cache=statistics_cache,
     )
     return UserController(
         user_repository=user_repository,
@@ -124,14 +135,15 @@ async def get_skill_controller(
         uow=uow
     )
 
+@inject
 async def get_module_controller(
         user_skill_repository: IUserSkillRepository = Depends(get_user_skill_repository),
-        question_repository: IQuestionRepository = Depends(get_question_repository),
         user_question_repository: IUserQuestionRepository = Depends(get_user_question_repository),
+        statistics_cache: IProgressStatisticsCache = Depends(Provide[Container.progress_statistics_cache]),
 ) -> IModuleController:
     module_statistics_service: IModuleStatisticsService = Container.module_statistics_service(
-        question_repository=question_repository,
         user_question_repository=user_question_repository,
+        statistics_cache=statistics_cache,
     )
     return ModuleController(
         user_skill_repository=user_skill_repository,
@@ -160,6 +172,9 @@ async def get_interview_controller(
         user_question_repository: IUserQuestionRepository = Depends(get_user_question_repository),
         user_repository: IUserRepository = Depends(get_user_repository),
         openai_service: IOpenAIService = Depends(Provide[Container.openai_service]),
+        question_seed_service: IQuestionSeedService = Depends(Provide[Container.question_seed_service]),
+        interview_state_cache: IInterviewStateCache = Depends(Provide[Container.interview_state_cache]),
+        statistics_cache: IProgressStatisticsCache = Depends(Provide[Container.progress_statistics_cache]),
         uow: IUoW = Depends(get_uow),
 ) -> IInterviewController:
     return InterviewController(
@@ -170,7 +185,11 @@ async def get_interview_controller(
         user_question_repository=user_question_repository,
         user_repository=user_repository,
         openai_service=openai_service,
+        question_seed_service=question_seed_service,
+        interview_state_cache=interview_state_cache,
+        statistics_cache=statistics_cache,
         uow=uow,
+        max_audio_bytes=Container.settings.INTERVIEW_AUDIO_MAX_BYTES,
     )
 
 @inject
@@ -224,17 +243,12 @@ async def get_direction_salary_controller(
         uow: IUoW = Depends(get_uow),
         openai_service: IOpenAIService = Depends(Provide[Container.openai_service]),
         direction_search_service: IDirectionSearchService = Depends(Provide[Container.direction_search_service]),
-        user_skill_repository: IUserSkillRepository = Depends(get_user_skill_repository),
-        question_repository: IQuestionRepository = Depends(get_question_repository),
         user_question_repository: IUserQuestionRepository = Depends(get_user_question_repository),
+        statistics_cache: IProgressStatisticsCache = Depends(Provide[Container.progress_statistics_cache]),
 ) -> IDirectionSalaryController:
-    module_statistics_service: IModuleStatisticsService = Container.module_statistics_service(
-        question_repository=question_repository,
-        user_question_repository=user_question_repository,
-    )
     direction_statistics_service: IDirectionStatisticsService = Container.direction_statistics_service(
-        module_statistics_service=module_statistics_service,
-        user_skill_repository=user_skill_repository,
+        user_question_repository=user_question_repository,
+        statistics_cache=statistics_cache,
     )
     return DirectionSalaryController(
         salary_repository=salary_repository,
@@ -2,7 +2,7 @@ from typing import AsyncGenerator
 
 from dependency_injector.wiring import inject, Provide
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, AsyncEngine
 
 from app.container import Container
 from src.domain.interfaces import IUoW
@@ -19,4 +19,11 @@ async def get_session(
         yield session
 
 async def get_uow(session: AsyncSession = Depends(get_session)) -> IUoW:
-    return UoW(session=session)
\ No newline at end of file
+    return UoW(session=session)
+
+
+@inject
+def get_engine(
+        engine: AsyncEngine = Depends(Provide[Container.engine]),
+) -> AsyncEngine:
+    return engine
@@ -0,0 +1,31 @@
+from typing import Any, Callable, Coroutine
+
+from fastapi import HTTPException, Request, Response, status as s
+from fastapi.routing import APIRoute
+
+from app.container import Container
+
+# Room for the other form fields and the multipart boundaries around the audio
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class BoundedUploadRoute(APIRoute):
+    """Route rejecting multipart bodies larger than the audio limit before they are read.
+
+    FastAPI parses (and spools to disk) the whole form before any dependency
+    runs, so the declared ``Content-Length`` is checked here instead. Chunked
+    uploads without one are still checked once spooled.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def bounded_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length", "")
+            is_multipart = request.headers.get("content-type", "").startswith("multipart/form-data")
+            max_bytes = Container.settings.INTERVIEW_AUDIO_MAX_BYTES + MULTIPART_OVERHEAD_BYTES
+            if is_multipart and content_length.isdigit() and int(content_length) > max_bytes:
+                raise HTTPException(status_code=s.HTTP_413_CONTENT_TOO_LARGE, detail="Audio file is too large")
+            return await handler(request)
+
+        return bounded_handler
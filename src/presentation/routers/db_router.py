@@ -0,0 +1,30 @@
+from typing import Annotated, Any, Dict
+
+from fastapi import APIRouter, Depends, status as s
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.application.users.dtos import UserDTO
+from src.domain.responses import RESPONSE_401
+from src.infrastructure.dbs.postgre import get_pool_metrics
+from src.presentation.depends.security import get_access_user
+from src.presentation.depends.session import get_engine
+
+router = APIRouter(
+    prefix="/internal/db",
+    tags=["db"],
+)
+
+
+@router.get(
+    "/pool",
+    summary="Connection pool metrics of this worker",
+    status_code=s.HTTP_200_OK,
+    responses={
+        s.HTTP_401_UNAUTHORIZED: RESPONSE_401,
+    },
+)
+async def get_db_pool_metrics(
+    engine: Annotated[AsyncEngine, Depends(get_engine)],
+    user: Annotated[UserDTO, Depends(get_access_user)],
+) -> Dict[str, Any]:
+    return get_pool_metrics(engine)
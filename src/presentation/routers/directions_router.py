@@ -72,6 +72,23 @@ async def direction_autocomplete(
 ):
     return await controller.direction_autocomplete(PaginationDTO[DirectionDTO](**pagination.dict()), q=q)
 
+@router.get(
+    '/suggest',
+    summary="Suggest directions by name prefix",
+    status_code=s.HTTP_200_OK,
+    response_model=List[DirectionDTO],
+    responses={
+        s.HTTP_401_UNAUTHORIZED: RESPONSE_401,
+    }
+)
+async def direction_suggest(
+        controller: Annotated[IDirectionSalaryController, Depends(get_direction_salary_controller)],
+        q: str = Query(..., min_length=1),
+        size: int = Query(10, ge=1, le=100),
+        user: UserDTO = Depends(get_access_user),
+):
+    return await controller.direction_suggest(q=q, size=size)
+
 @router.get(
     '/salary/my',
     summary="Get my salary estimate",
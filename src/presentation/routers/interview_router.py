@@ -1,17 +1,23 @@
-﻿from typing import Annotated, Dict, Any
+﻿import json
+from typing import Annotated, AsyncIterator, Dict, Any
 
 from fastapi import APIRouter, status as s, Depends, UploadFile, File, Form
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from src.application.interview.interfaces import IInterviewController
 from src.application.interview.dtos import InterviewQuestionDTO
 from src.application.users.dtos import UserDTO
-from src.domain.responses import RESPONSE_400, RESPONSE_401, RESPONSE_404, RESPONSE_409
+from src.domain.responses import RESPONSE_400, RESPONSE_401, RESPONSE_404, RESPONSE_409, RESPONSE_413
 from src.presentation.depends.controllers import get_interview_controller
 from src.presentation.depends.security import get_access_user
+from src.presentation.depends.uploads import BoundedUploadRoute
 
 router = APIRouter(
     prefix="/interviews",
     tags=["interviews"],
+    # Answer uploads over the audio limit are rejected before the form is spooled
+    route_class=BoundedUploadRoute,
 )
 
 @router.post(
@@ -37,6 +43,19 @@ router = APIRouter(
                 }
             }
         },
+        s.HTTP_202_ACCEPTED: {
+            "description": "Questions for some modules are still being prepared",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "preparing",
+                        "detail": "Questions are still being prepared",
+                        "pending_modules": [12, 15],
+                        "retry_after": 10
+                    }
+                }
+            }
+        },
         s.HTTP_400_BAD_REQUEST: RESPONSE_400,
         s.HTTP_401_UNAUTHORIZED: RESPONSE_401,
         s.HTTP_409_CONFLICT: RESPONSE_409,
@@ -46,7 +65,11 @@ async def start_interview(
     controller: Annotated[IInterviewController, Depends(get_interview_controller)],
     user: UserDTO = Depends(get_access_user),
 ):
-    return await controller.start(user_id=user.id)
+    result = await controller.start(user_id=user.id)
+    if result.get("status") == "preparing":
+        headers = {"Retry-After": str(result["retry_after"])}
+        return JSONResponse(status_code=s.HTTP_202_ACCEPTED, content=result, headers=headers)
+    return result
 
 @router.post(
     "/{session_id}/answer",
@@ -105,6 +128,7 @@ async def start_interview(
         s.HTTP_400_BAD_REQUEST: RESPONSE_400,
         s.HTTP_401_UNAUTHORIZED: RESPONSE_401,
         s.HTTP_404_NOT_FOUND: RESPONSE_404,
+        s.HTTP_413_CONTENT_TOO_LARGE: RESPONSE_413,
     },
 )
 async def answer_interview_question(
@@ -114,16 +138,70 @@ async def answer_interview_question(
     audio: UploadFile = File(...),
     user: UserDTO = Depends(get_access_user),
 ):
-    data = await audio.read()
     filename = audio.filename or "audio.wav"
     return await controller.answer(
         session_id=session_id,
         interview_question_id=interview_question_id,
-        audio=data,
+        audio=audio.file,
+        filename=filename,
+        user_id=user.id,
+        content_type=audio.content_type,
+    )
+
+async def _ndjson(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    async for event in events:
+        yield json.dumps(jsonable_encoder(event), ensure_ascii=False) + "\n"
+
+@router.post(
+    "/{session_id}/answer/stream",
+    summary="Answer interview question with streamed evaluation",
+    status_code=s.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        s.HTTP_200_OK: {
+            "description": (
+                "Newline-delimited JSON events: `transcript` once the audio is transcribed, "
+                "`feedback` deltas while the answer is evaluated, then `result` with the same "
+                "payload as the non-streaming endpoint, or `error`."
+            ),
+            "content": {
+                "application/x-ndjson": {
+                    "example": (
+                        '{"event": "transcript", "text": "Stack is memory for function calls."}\n'
+                        '{"event": "feedback", "delta": "Good start, but "}\n'
+                        '{"event": "feedback", "delta": "mention how frames are freed."}\n'
+                        '{"event": "result", "data": {"status": "need_followup", "...": "..."}}\n'
+                    )
+                }
+            }
+        },
+        s.HTTP_400_BAD_REQUEST: RESPONSE_400,
+        s.HTTP_401_UNAUTHORIZED: RESPONSE_401,
+        s.HTTP_404_NOT_FOUND: RESPONSE_404,
+        s.HTTP_413_CONTENT_TOO_LARGE: RESPONSE_413,
+    },
+)
+async def answer_interview_question_stream(
+    controller: Annotated[IInterviewController, Depends(get_interview_controller)],
+    session_id: int,
+    interview_question_id: int = Form(...),
+    audio: UploadFile = File(...),
+    user: UserDTO = Depends(get_access_user),
+):
+    filename = audio.filename or "audio.wav"
+    events = await controller.answer_stream(
+        session_id=session_id,
+        interview_question_id=interview_question_id,
+        audio=audio.file,
         filename=filename,
         user_id=user.id,
         content_type=audio.content_type,
     )
+    return StreamingResponse(
+        _ndjson(events),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.get(
     "/questions/{interview_question_id}",
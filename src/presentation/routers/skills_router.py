@@ -52,6 +52,23 @@ async def skill_autocomplete(
 ):
     return await controller.skill_autocomplete(PaginationDTO[SkillDTO](**pagination.dict()), q=q)
 
+@router.get(
+    '/suggest',
+    summary="Suggest skills by name prefix",
+    status_code=s.HTTP_200_OK,
+    response_model=List[SkillDTO],
+    responses={
+        s.HTTP_401_UNAUTHORIZED: RESPONSE_401,
+    }
+)
+async def skill_suggest(
+        controller: Annotated[ISkillController, Depends(get_skill_controller)],
+        q: str = Query(..., min_length=1),
+        size: int = Query(10, ge=1, le=100),
+        user: UserDTO = Depends(get_access_user)
+):
+    return await controller.skill_suggest(q=q, size=size)
+
 @router.get(
     '/my',
     summary="Get my skills",
@@ -0,0 +1,12 @@
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Settings are required at import time; fall back to the example values.
+for line in (ROOT / ".env.example").read_text(encoding="utf-8").splitlines():
+    name, sep, value = line.partition("=")
+    if sep and name.isupper() and not line.startswith("#"):
+        os.environ.setdefault(name, value)
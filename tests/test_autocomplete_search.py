@@ -0,0 +1,74 @@
+import asyncio
+
+from dependency_injector import providers
+
+from app.container import Container
+from src.application.skills.controllers import SkillController
+from src.application.skills.dtos import SkillDTO
+from src.infrastructure.search.prefix_index import INVALIDATION_CHANNEL, PrefixIndex
+
+
+class FakeRedis:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+class FakeSkillSearchService:
+    def __init__(self):
+        self.indexed = []
+
+    async def index(self, skill_id: int, name: str) -> None:
+        self.indexed.append((skill_id, name))
+
+
+class FakeSkillRepository:
+    async def get_by_name(self, name):
+        return None
+
+    async def add(self, skill: SkillDTO) -> SkillDTO:
+        return SkillDTO(id=7, name=skill.name)
+
+
+class FakeUoW:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def test_create_skill_through_wired_search_service():
+    redis = FakeRedis()
+    es_search_service = FakeSkillSearchService()
+
+    async def run():
+        with Container.redis.override(providers.Object(redis)), \
+                Container.session_factory.override(providers.Object(None)), \
+                Container.skill_es_search_service.override(providers.Object(es_search_service)), \
+                Container.skill_autocomplete_index.reset():
+            controller = SkillController(
+                skill_repository=FakeSkillRepository(),
+                user_skill_repository=None,
+                uow=FakeUoW(),
+                skill_search_service=Container.skill_search_service(),
+            )
+            return await controller.create("Rust")
+
+    skill = asyncio.run(run())
+
+    assert skill.id == 7
+    assert es_search_service.indexed == [(7, "Rust")]
+    assert redis.published == [(INVALIDATION_CHANNEL, "skills")]
+
+
+def test_prefix_index_matches_every_query_word_in_any_order():
+    index = PrefixIndex([(1, "Machine Learning"), (2, "Learning Theory"), (3, "Résumé writing"), (4, "Learn")])
+
+    assert index.search("mach learn") == [(1, "Machine Learning")]
+    assert index.search("learn mach") == [(1, "Machine Learning")]
+    assert index.search("learn") == [(4, "Learn"), (2, "Learning Theory"), (1, "Machine Learning")]
+    assert index.search("RESU") == [(3, "Résumé writing")]
+    assert index.search("mach theory") == []
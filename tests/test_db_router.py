@@ -0,0 +1,19 @@
+from contextlib import asynccontextmanager
+
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_pool_metrics_reject_anonymous_requests():
+    @asynccontextmanager
+    async def session_factory():
+        yield None
+
+    with app.container.engine.override(providers.Object(None)), \
+            app.container.session_factory.override(providers.Object(session_factory)):
+        response = TestClient(app).get("/internal/db/pool")
+
+    # HTTPBearer rejects requests without credentials before the token is checked
+    assert response.status_code == 403
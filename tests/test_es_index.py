@@ -0,0 +1,83 @@
+import asyncio
+
+from elasticsearch import NotFoundError
+
+from src.infrastructure.integrations import es_index
+from src.infrastructure.integrations.es_index import AliasedIndex
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+
+class FakeIndices:
+    def __init__(self, es):
+        self._es = es
+
+    async def create(self, index, **kwargs):
+        self._es.indices_created.append(index)
+
+    async def put_settings(self, **kwargs):
+        pass
+
+    async def refresh(self, **kwargs):
+        pass
+
+    async def get_alias(self, name):
+        if not self._es.aliased:
+            raise NotFoundError("index_not_found_exception", None, {})
+        return FakeResponse({index: {} for index in self._es.aliased})
+
+    async def exists(self, index):
+        return False
+
+    async def update_aliases(self, actions):
+        for action in actions:
+            if "add" in action:
+                self._es.aliased.append(action["add"]["index"])
+            if "remove" in action:
+                self._es.aliased.remove(action["remove"]["index"])
+
+    async def delete(self, index, **kwargs):
+        self._es.deleted.append(index)
+
+
+class FakeElasticsearch:
+    def __init__(self):
+        self.indices_created = []
+        self.aliased = ["skills_initial"]
+        self.deleted = []
+        self.documents = {}
+        self.indices = FakeIndices(self)
+
+
+def test_rebuild_catches_up_rows_created_during_the_rebuild(monkeypatch):
+    es = FakeElasticsearch()
+
+    async def fake_bulk(client, actions):
+        for action in actions:
+            client.documents.setdefault(action["_index"], {})[action["_id"]] = action["_source"]
+        return len(actions), []
+
+    monkeypatch.setattr(es_index, "async_bulk", fake_bulk)
+
+    async def batches():
+        yield [{"id": 1, "name": "Python"}, {"id": 2, "name": "Rust"}]
+
+    caught_up_after = []
+
+    async def catch_up(max_id):
+        caught_up_after.append(max_id)
+        # A skill created while the rebuild ran, written through the old alias
+        yield [{"id": 3, "name": "Go"}]
+
+    index = AliasedIndex(es, alias="skills", settings={}, mappings={})
+    indexed = asyncio.run(index.rebuild(batches(), catch_up=catch_up))
+
+    new_index = es.indices_created[0]
+    assert indexed == 3
+    assert caught_up_after == [2]
+    assert sorted(es.documents[new_index]) == [1, 2, 3]
+    assert es.aliased == [new_index]
+    assert es.deleted == ["skills_initial"]
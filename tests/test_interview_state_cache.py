@@ -0,0 +1,41 @@
+import asyncio
+
+import fakeredis
+
+from src.application.interview.dtos import InterviewSessionDTO, InterviewSessionStateDTO
+from src.application.interview.services import InterviewStateCache
+
+
+def state(current_main_index: int) -> InterviewSessionStateDTO:
+    return InterviewSessionStateDTO(
+        session=InterviewSessionDTO(id=1, user_id=2, current_main_index=current_main_index),
+    )
+
+
+def test_rebuilt_state_does_not_replace_a_newer_write_through():
+    async def run():
+        cache = InterviewStateCache(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+        # The answer drops the state before persisting, a miss rebuilds meanwhile
+        await cache.delete(1)
+        generation = await cache.get_generation(1)
+        await cache.set(state(current_main_index=1))
+        await cache.set_if_current(state(current_main_index=0), generation)
+        after_answer = await cache.get(1)
+
+        # A deleted session is not revived by a rebuild that started earlier
+        generation = await cache.get_generation(1)
+        await cache.delete_for_user(2)
+        await cache.set_if_current(state(current_main_index=1), generation)
+        after_delete = await cache.get(1)
+
+        generation = await cache.get_generation(1)
+        await cache.set_if_current(state(current_main_index=1), generation)
+        rebuilt = await cache.get(1)
+        return after_answer, after_delete, rebuilt
+
+    after_answer, after_delete, rebuilt = asyncio.run(run())
+
+    assert after_answer.session.current_main_index == 1
+    assert after_delete is None
+    assert rebuilt.session.current_main_index == 1
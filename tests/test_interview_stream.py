@@ -0,0 +1,43 @@
+import asyncio
+
+from src.application.interview.controllers import InterviewController
+
+
+class FailingOpenAIService:
+    async def stream_evaluate_answer(self, question, answer, model):
+        yield "Good "
+        raise RuntimeError("upstream error")
+
+
+def stream_events(transcription_result):
+    async def run():
+        controller = InterviewController.__new__(InterviewController)
+        controller._openai_service = FailingOpenAIService()
+
+        async def transcribe():
+            return await transcription_result()
+
+        transcription = asyncio.create_task(transcribe())
+        events = controller._stream_answer({"question_text": "Why?"}, 1, transcription, user_id=1)
+        return [event async for event in events]
+
+    return asyncio.run(run())
+
+
+def test_unexpected_error_ends_the_stream_with_an_error_event():
+    async def transcript():
+        return "Because"
+
+    events = stream_events(transcript)
+
+    assert [event["event"] for event in events] == ["transcript", "feedback", "error"]
+    assert events[-1]["status_code"] == 500
+
+
+def test_cancelled_transcription_ends_the_stream_with_an_error_event():
+    async def cancelled():
+        raise asyncio.CancelledError
+
+    events = stream_events(cancelled)
+
+    assert events == [{"event": "error", "status_code": 500, "detail": "Failed to transcribe audio"}]
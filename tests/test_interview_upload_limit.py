@@ -0,0 +1,19 @@
+from fastapi.testclient import TestClient
+
+from app.container import Container
+from app.main import app
+from src.presentation.depends.uploads import MULTIPART_OVERHEAD_BYTES
+
+
+def test_oversized_answer_upload_is_rejected_before_the_form_is_read(monkeypatch):
+    monkeypatch.setattr(Container.settings, "INTERVIEW_AUDIO_MAX_BYTES", 1024)
+
+    response = TestClient(app).post(
+        "/interviews/1/answer",
+        data={"interview_question_id": "1"},
+        files={"audio": ("answer.wav", b"\0" * (1024 + MULTIPART_OVERHEAD_BYTES + 1), "audio/wav")},
+    )
+
+    # Rejected before the body is parsed and any dependency (auth included) runs
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Audio file is too large"}
@@ -0,0 +1,76 @@
+import asyncio
+
+import fakeredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.infrastructure.jobs.queue import Job, RedisJobQueue, run_worker
+
+
+def test_failed_job_moves_to_the_delayed_set_until_attempts_run_out():
+    async def run():
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        queue = RedisJobQueue(redis, name="seed", max_attempts=2, retry_delay=0)
+        await queue.enqueue("job-1", {"module_id": 1})
+
+        job = await queue.reserve("worker", timeout=1)
+        retried = await queue.fail(job, "worker")
+        after_fail = (
+            await redis.llen("jobs:seed:processing:worker"),
+            await redis.zcard("jobs:seed:delayed"),
+            await queue.get_status("job-1"),
+        )
+
+        job = await queue.reserve("worker", timeout=1)
+        exhausted = not await queue.fail(job, "worker")
+        return retried, after_fail, job.attempts, exhausted, await queue.get_status("job-1")
+
+    retried, after_fail, attempts, exhausted, status = asyncio.run(run())
+
+    assert retried
+    assert after_fail == (0, 1, "queued")
+    assert attempts == 2
+    assert exhausted
+    assert status == "failed"
+
+
+class FlakyQueue:
+    """Hands out one job, after failing the first reserve like a dropped connection."""
+
+    def __init__(self):
+        self.jobs = [Job(id="job-1", payload={"module_id": 1})]
+        self.reserve_errors = 1
+        self.completed = []
+
+    async def recover(self, worker_id):
+        return 0
+
+    async def reserve(self, worker_id, timeout=5):
+        if self.reserve_errors:
+            self.reserve_errors -= 1
+            raise RedisConnectionError("connection reset")
+        if self.jobs:
+            return self.jobs.pop()
+        await asyncio.sleep(0.01)
+        return None
+
+    async def complete(self, job, worker_id):
+        self.completed.append(job.id)
+
+
+def test_worker_keeps_running_after_a_redis_error():
+    queue = FlakyQueue()
+
+    async def run():
+        handled = asyncio.Event()
+
+        async def handler(payload):
+            handled.set()
+
+        worker = asyncio.create_task(run_worker(queue, handler, worker_id="worker"))
+        await asyncio.wait_for(handled.wait(), timeout=5)
+        await asyncio.sleep(0.05)
+        worker.cancel()
+
+    asyncio.run(run())
+
+    assert queue.completed == ["job-1"]
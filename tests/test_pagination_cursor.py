@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.application.locations.controllers import LocationController
+from src.domain.base_dto import PaginationDTO
+from src.infrastructure.dbs.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class CursorCountryRepository:
+    async def get(self, name=None, pagination=None):
+        decode_cursor(pagination.cursor, 1)
+        return PaginationDTO(items=[])
+
+
+def test_decode_cursor_round_trips_and_rejects_foreign_cursors():
+    assert decode_cursor(encode_cursor([42]), 1) == [42]
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not a cursor!", 1)
+    # A cursor of another query, with a different number of sort keys
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(["Python", 42]), 1)
+
+
+def test_controllers_answer_invalid_cursors_with_400():
+    controller = LocationController(country_repository=CursorCountryRepository(), city_repository=None)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(controller.get_countries_by_name(PaginationDTO(per_page=10, cursor="garbage"), q=None))
+
+    assert error.value.status_code == 400
+    assert error.value.detail == "Invalid cursor"
@@ -0,0 +1,39 @@
+import asyncio
+
+import fakeredis
+
+from src.application.directions.dtos import ProgressStatisticsDTO
+from src.application.modules.services import ProgressStatisticsCache
+
+STATISTICS = ProgressStatisticsDTO(
+    total_questions=10,
+    met_questions=4,
+    correct_answers=3,
+    incorrect_answers=1,
+    readiness_percentage=30.0,
+)
+
+
+def test_statistics_read_before_an_invalidation_are_not_cached():
+    async def run():
+        cache = ProgressStatisticsCache(fakeredis.FakeAsyncRedis(decode_responses=True), ttl=3600)
+
+        generation = await cache.get_generation(user_id=1)
+        # An answer commits and invalidates while the statistics are computed
+        await cache.delete_for_user(user_id=1)
+        await cache.set_module(user_id=1, module_id=5, statistics=STATISTICS, generation=generation)
+        stale = await cache.get_module(user_id=1, module_id=5)
+
+        generation = await cache.get_generation(user_id=1)
+        await cache.set_module(user_id=1, module_id=5, statistics=STATISTICS, generation=generation)
+        fresh = await cache.get_module(user_id=1, module_id=5)
+
+        await cache.delete_for_module(module_id=5)
+        dropped = await cache.get_module(user_id=1, module_id=5)
+        return stale, fresh, dropped
+
+    stale, fresh, dropped = asyncio.run(run())
+
+    assert stale is None
+    assert fresh == STATISTICS
+    assert dropped is None
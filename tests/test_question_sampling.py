@@ -0,0 +1,157 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.application.questions.models import Question, UserQuestionProgress
+from src.application.questions.repositories import QuestionRepository
+from src.application.skills.models import Skill
+from src.application.skills.repositories import SkillRepository
+from src.application.users.models import User
+from src.domain.value_objects import QuestionStatus
+from src.infrastructure.dbs.postgre import Base
+
+# Register every mapped model so relationships resolve
+import app.reindex  # noqa: F401
+
+pgserver = pytest.importorskip("pgserver")
+
+TRIALS = 2000
+
+
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory):
+    server = pgserver.get_server(tmp_path_factory.mktemp("pgdata"), cleanup_mode="stop")
+    url = server.get_uri().replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    async def create_schema():
+        engine = create_async_engine(url)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all)
+            await connection.run_sync(Base.metadata.create_all)
+        await engine.dispose()
+
+    asyncio.run(create_schema())
+    yield url
+    server.cleanup()
+
+
+def run_in_session(database_url, operation):
+    """Run ``operation(session)`` in a transaction that is rolled back afterwards."""
+    async def run():
+        engine = create_async_engine(database_url)
+        try:
+            async with AsyncSession(engine) as session:
+                # Seeded random(), so the sampling tests are deterministic
+                await session.execute(text("SELECT setseed(0.42)"))
+                try:
+                    return await operation(session)
+                finally:
+                    await session.rollback()
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def add_questions(session, skill, count):
+    questions = [Question(question=f"{skill.name} {i}?", ideal_answer="-", skill=skill) for i in range(count)]
+    session.add_all(questions)
+    await session.flush()
+    return questions
+
+
+def test_sampling_follows_module_weights_not_module_sizes(database_url):
+    async def operation(session):
+        large, small = Skill(name="Large"), Skill(name="Small")
+        await add_questions(session, large, 30)
+        await add_questions(session, small, 10)
+
+        repository = QuestionRepository(session)
+        picks = Counter()
+        for _ in range(TRIALS):
+            [question] = await repository.sample_for_modules({large.id: 1, small.id: 3}, limit=1)
+            picks[question.skill_id] += 1
+        return picks[small.id] / TRIALS
+
+    small_share = run_in_session(database_url, operation)
+
+    # Weight 3 of 4 goes to the small module, even though it has a quarter of the questions
+    assert small_share == pytest.approx(0.75, abs=0.05)
+
+
+def test_sampling_prioritizes_unseen_and_unsatisfactory_questions(database_url):
+    async def operation(session):
+        user = User(email="sampling@example.com")
+        skill = Skill(name="Python")
+        session.add(user)
+        unseen, unsatisfactory, fresh, stale = await add_questions(session, skill, 4)
+
+        now = datetime.now(timezone.utc)
+        session.add_all([
+            UserQuestionProgress(
+                user_id=user.id, question_id=question.id, skill_id=skill.id,
+                last_status=status, last_seen_at=seen_at,
+            )
+            for question, status, seen_at in [
+                (unsatisfactory, QuestionStatus.UNSATISFACTORY, now),
+                (fresh, QuestionStatus.SATISFACTORY, now),
+                (stale, QuestionStatus.SATISFACTORY, now - timedelta(days=60)),
+            ]
+        ])
+        await session.flush()
+
+        repository = QuestionRepository(session)
+        picks = Counter()
+        for _ in range(TRIALS):
+            [question] = await repository.sample_for_modules({skill.id: 1}, limit=1, user_id=user.id)
+            picks[question.id] += 1
+
+        names = {unseen.id: "unseen", unsatisfactory.id: "unsatisfactory", fresh.id: "fresh", stale.id: "stale"}
+        return {names[question_id]: count / TRIALS for question_id, count in picks.items()}
+
+    shares = run_in_session(database_url, operation)
+
+    # Priorities 4 : 3 : 0.25 : 1, the satisfactory answer seen 60 days ago having fully recovered
+    total = 4 + 3 + 0.25 + 1
+    assert shares["unseen"] == pytest.approx(4 / total, abs=0.05)
+    assert shares["unsatisfactory"] == pytest.approx(3 / total, abs=0.05)
+    assert shares.get("fresh", 0) == pytest.approx(0.25 / total, abs=0.03)
+    assert shares["stale"] == pytest.approx(1 / total, abs=0.05)
+
+
+def test_sampling_returns_distinct_questions_up_to_the_limit(database_url):
+    async def operation(session):
+        skill = Skill(name="Go")
+        questions = await add_questions(session, skill, 5)
+
+        repository = QuestionRepository(session)
+        sampled = await repository.sample_for_modules({skill.id: 1}, limit=10)
+        return {question.id for question in questions}, [question.id for question in sampled]
+
+    question_ids, sampled_ids = run_in_session(database_url, operation)
+
+    assert sorted(sampled_ids) == sorted(question_ids)
+
+
+def test_get_or_create_many_splits_created_from_existing_skills(database_url):
+    async def operation(session):
+        existing = Skill(name="Docker")
+        session.add(existing)
+        await session.flush()
+
+        repository = SkillRepository(session)
+        skills, created = await repository.get_or_create_many(["docker", "Kubernetes", " kubernetes ", ""])
+        return existing.id, skills, created
+
+    existing_id, skills, created = run_in_session(database_url, operation)
+
+    assert set(skills) == {"docker", "kubernetes"}
+    # The existing row keeps its id and spelling
+    assert skills["docker"].id == existing_id
+    assert skills["docker"].name == "Docker"
+    assert [skill.name for skill in created] == ["Kubernetes"]
+    assert created[0].id == skills["kubernetes"].id
@@ -0,0 +1,16 @@
+import pytest
+
+from app.reindex import parse_targets
+
+
+def test_targets_default_to_every_index():
+    assert parse_targets([]) == ["skills", "directions"]
+
+
+def test_targets_can_be_picked():
+    assert parse_targets(["directions"]) == ["directions"]
+
+
+def test_unknown_targets_are_rejected():
+    with pytest.raises(SystemExit):
+        parse_targets(["vacancies"])
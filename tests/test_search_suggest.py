@@ -0,0 +1,46 @@
+import asyncio
+
+from src.application.skills.dtos import SkillDTO
+from src.application.skills.services import SkillSearchService
+from src.infrastructure.integrations.es_index import completion_inputs
+
+NAMES = {1: "Software - Testing Methodologies", 2: "Agile Testing Methodologies"}
+
+
+class FakeElasticsearch:
+    def __init__(self):
+        self.request = None
+
+    async def search(self, index, source, suggest):
+        self.request = suggest
+        completion = suggest["name_suggest"]["completion"]
+        prefix = suggest["name_suggest"]["prefix"].lower()
+        # One option per matching input, as the completion suggester ranks inputs
+        options = [
+            {"text": text, "_source": {"id": skill_id, "name": NAMES[skill_id]}}
+            for skill_id in NAMES
+            for text in completion_inputs(NAMES[skill_id])
+            if text.lower().startswith(prefix)
+        ]
+        if completion.get("skip_duplicates"):
+            seen = set()
+            options = [o for o in options if o["text"] not in seen and not seen.add(o["text"])]
+        return {"suggest": {"name_suggest": [{"options": options[:completion["size"]]}]}}
+
+
+def test_completion_inputs_start_at_every_word():
+    assert completion_inputs(NAMES[1]) == [
+        "Software Testing Methodologies",
+        "Testing Methodologies",
+        "Methodologies",
+    ]
+
+
+def test_suggest_returns_every_skill_sharing_a_suffix():
+    es = FakeElasticsearch()
+    service = SkillSearchService(es_client=es)
+
+    suggestions = asyncio.run(service.suggest("testing", size=10))
+
+    assert "skip_duplicates" not in es.request["name_suggest"]["completion"]
+    assert suggestions == [SkillDTO(id=1, name=NAMES[1]), SkillDTO(id=2, name=NAMES[2])]